@@ -0,0 +1,337 @@
+"""Бенчмарки репозиториев и сервисов на реалистичных объемах данных.
+
+Для каждой пары (хранилище, размер) создается отдельная база SQLite, в нее
+загружаются `size` товаров, `size // 10` заказов по три позиции и `size // 100`
+клиентов, после чего замеряются основные операции. Для каждой операции
+записываются число SQL-запросов, время выполнения и пиковое потребление памяти
+(по данным `tracemalloc`) в JSON-файл, пригодный для сравнения запусков между коммитами.
+
+Запуск:
+
+    make benchmark
+    python -m tests.benchmarks.run_benchmarks --sizes 1000 100000 --backends memory --output results.json
+
+Трассировка памяти замедляет выполнение; для замеров только времени используйте `--skip-memory`.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, UTC
+from itertools import batched
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+import sqlalchemy
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from warehouse_management.application.customer_service import CustomerService
+from warehouse_management.domain.models import Product
+from warehouse_management.domain.services import WarehouseService
+from warehouse_management.infrastructure.database import create_database_engine
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.infrastructure.orm import CustomerORM, OrderLineORM, OrderORM
+from warehouse_management.infrastructure.repositories import (
+    SqlAlchemyCustomerRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyProductRepository,
+)
+from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+from warehouse_management.settings import DatabaseSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SIZES = (1_000, 100_000, 1_000_000)
+BACKENDS = ('memory', 'file')
+DEFAULT_OUTPUT = Path('benchmark-results.json')
+
+# Количество строк в одном INSERT при заполнении базы.
+_SEED_CHUNK_SIZE = 10_000
+_LINES_PER_ORDER = 3
+_PRODUCTS_PER_NEW_ORDER = 5
+
+
+@dataclass
+class Measurement:
+    """Результат замера одной операции.
+
+    Attributes:
+        backend: Хранилище SQLite (`memory` или `file`).
+        size: Количество товаров в базе.
+        operation: Название операции.
+        calls: Сколько раз операция выполнялась в рамках замера.
+        queries: Количество выполненных SQL-запросов.
+        wall_time_s: Суммарное время выполнения в секундах.
+        peak_memory_bytes: Пиковый объем памяти, выделенной за время замера, или None без трассировки.
+    """
+
+    backend: str
+    size: int
+    operation: str
+    calls: int
+    queries: int
+    wall_time_s: float
+    peak_memory_bytes: int | None
+
+
+class Benchmark:
+    """Замеряет операции над одной базой данных и накапливает результаты."""
+
+    def __init__(self, engine: 'Engine', backend: str, size: int, trace_memory: bool = True) -> None:
+        """Инициализирует замеры и подписывается на выполнение SQL-запросов движком.
+
+        Args:
+            engine: Движок базы данных.
+            backend: Хранилище SQLite (`memory` или `file`).
+            size: Количество товаров в базе.
+            trace_memory: Замерять ли пиковое потребление памяти.
+        """
+        self.engine = engine
+        self.backend = backend
+        self.size = size
+        self.trace_memory = trace_memory
+        self.queries = 0
+        self.results: list[Measurement] = []
+        event.listen(engine, 'before_cursor_execute', self._count_query)
+
+    def _count_query(self, *_args: Any) -> None:
+        self.queries += 1
+
+    @contextmanager
+    def measure(self, operation: str, calls: int = 1) -> 'Iterator[None]':
+        """Замеряет время, число запросов и память для блока кода.
+
+        Args:
+            operation: Название операции.
+            calls: Сколько раз операция выполняется внутри блока.
+
+        Yields:
+            None.
+        """
+        self.queries = 0
+        if self.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            peak_memory = None
+            if self.trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.results.append(
+                Measurement(self.backend, self.size, operation, calls, self.queries, elapsed, peak_memory)
+            )
+            logger.info(
+                '%-6s %9d %-34s %6d calls %8d queries %10.3f s',
+                self.backend,
+                self.size,
+                operation,
+                calls,
+                self.queries,
+                elapsed,
+            )
+
+
+def seed_orders(engine: 'Engine', size: int, seed: int = 0) -> tuple[int, int]:
+    """Заполняет базу клиентами, заказами и строками заказов напрямую через Core.
+
+    Предполагается, что в базе уже есть `size` товаров с ID от 1 до `size`.
+
+    Args:
+        engine: Движок базы данных.
+        size: Количество товаров в базе.
+        seed: Начальное значение генератора случайных чисел.
+
+    Returns:
+        Количество созданных клиентов и заказов.
+    """
+    rng = random.Random(seed)
+    customers = max(1, size // 100)
+    orders = max(1, size // 10)
+    with engine.begin() as connection:
+        for chunk in batched(range(1, customers + 1), _SEED_CHUNK_SIZE):
+            connection.execute(
+                insert(CustomerORM),
+                [{'id': i, 'name': f'Customer {i}', 'birth_date': date(1970 + i % 40, 1 + i % 12, 1)} for i in chunk],
+            )
+        for chunk in batched(range(1, orders + 1), _SEED_CHUNK_SIZE):
+            connection.execute(insert(OrderORM), [{'id': i, 'customer_id': 1 + i % customers} for i in chunk])
+            lines = [
+                {'order_id': order_id, 'product_id': product_id, 'quantity': rng.randint(1, 5), 'unit_price': 1.0}
+                for order_id in chunk
+                for product_id in rng.sample(range(1, size + 1), min(_LINES_PER_ORDER, size))
+            ]
+            connection.execute(insert(OrderLineORM), lines)
+    return customers, orders
+
+
+def run_scenario(benchmark: Benchmark, calls: int, seed: int = 0) -> None:
+    """Выполняет набор замеров над пустой базой.
+
+    Args:
+        benchmark: Объект замеров, привязанный к базе.
+        calls: Сколько раз выполнять точечные операции (add, get, создание заказа, информация о клиенте).
+        seed: Начальное значение генератора случайных чисел.
+    """
+    rng = random.Random(seed)
+    size = benchmark.size
+    engine = benchmark.engine
+
+    products = [Product(id=None, name=f'Product {i}', quantity=i % 100, price=1.0 + i % 50) for i in range(size)]
+    with benchmark.measure('product.add_many', size), Session(engine) as session, SqlAlchemyUnitOfWork(session):
+        SqlAlchemyProductRepository(session).add_many(products)
+    del products
+
+    customers, _orders = seed_orders(engine, size, seed)
+
+    with benchmark.measure('product.add', calls), Session(engine) as session:
+        repository = SqlAlchemyProductRepository(session)
+        for i in range(calls):
+            with SqlAlchemyUnitOfWork(session):
+                repository.add(Product(id=None, name=f'Single {i}', quantity=1, price=1.0))
+
+    product_ids = [rng.randint(1, size) for _ in range(calls)]
+    with benchmark.measure('product.get', calls), Session(engine) as session:
+        repository = SqlAlchemyProductRepository(session)
+        for product_id in product_ids:
+            repository.get(product_id)
+
+    with benchmark.measure('product.list'), Session(engine) as session:
+        SqlAlchemyProductRepository(session).list()
+
+    with benchmark.measure('product.list[core_reads]'), Session(engine) as session:
+        SqlAlchemyProductRepository(session, core_reads=True).list()
+
+    with benchmark.measure('order.list'), Session(engine) as session:
+        SqlAlchemyOrderRepository(session).list()
+
+    with benchmark.measure('warehouse_service.order_totals'), Session(engine) as session:
+        service = WarehouseService(SqlAlchemyProductRepository(session), SqlAlchemyOrderRepository(session))
+        for _totals in service.order_totals():
+            pass
+
+    with benchmark.measure('warehouse_service.create_order', calls), Session(engine) as session:
+        service = WarehouseService(SqlAlchemyProductRepository(session), SqlAlchemyOrderRepository(session))
+        for _ in range(calls):
+            with SqlAlchemyUnitOfWork(session):
+                ids = rng.sample(range(1, size + 1), min(_PRODUCTS_PER_NEW_ORDER, size))
+                service.create_order([service.product_repo.get(product_id) for product_id in ids])
+
+    customer_ids = [rng.randint(1, customers) for _ in range(calls)]
+    with benchmark.measure('customer_service.get_customer_info', calls), Session(engine) as session:
+        customer_service = CustomerService(SqlAlchemyCustomerRepository(session), SqlAlchemyOrderRepository(session))
+        for customer_id in customer_ids:
+            customer_service.get_customer_info(customer_id)
+
+    with benchmark.measure('customer_service.get_customer_summary', calls), Session(engine) as session:
+        customer_service = CustomerService(SqlAlchemyCustomerRepository(session), SqlAlchemyOrderRepository(session))
+        for customer_id in customer_ids:
+            customer_service.get_customer_summary(customer_id)
+
+
+def run(
+    sizes: 'Sequence[int]', backends: 'Sequence[str]', calls: int, data_dir: Path, trace_memory: bool = True
+) -> list[Measurement]:
+    """Выполняет бенчмарки для всех сочетаний размеров и хранилищ.
+
+    Args:
+        sizes: Количества товаров в базе.
+        backends: Хранилища SQLite (`memory`, `file`).
+        calls: Сколько раз выполнять точечные операции.
+        data_dir: Каталог для файловых баз данных.
+        trace_memory: Замерять ли пиковое потребление памяти.
+
+    Returns:
+        Результаты замеров.
+    """
+    results: list[Measurement] = []
+    for backend in backends:
+        for size in sizes:
+            if backend == 'file':
+                database_path = data_dir / f'benchmark-{size}.db'
+                database_path.unlink(missing_ok=True)
+                url = f'sqlite:///{database_path}'
+            else:
+                url = 'sqlite://'
+            engine = create_database_engine(DatabaseSettings(url=url))
+            try:
+                upgrade(engine)
+                benchmark = Benchmark(engine, backend, size, trace_memory)
+                run_scenario(benchmark, calls)
+                results.extend(benchmark.results)
+            finally:
+                engine.dispose()
+    return results
+
+
+def write_results(results: 'Sequence[Measurement]', output: Path) -> None:
+    """Сохраняет результаты вместе с описанием окружения в JSON-файл.
+
+    Args:
+        results: Результаты замеров.
+        output: Путь к файлу результатов.
+    """
+    report = {
+        'commit': _git_commit(),
+        'created_at': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'sqlalchemy': sqlalchemy.__version__,
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'results': [asdict(result) for result in results],
+    }
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def _git_commit() -> str | None:
+    """Возвращает хэш текущего коммита или None, если он недоступен."""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Разбирает аргументы командной строки и запускает бенчмарки.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='количества товаров в базе')
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=BACKENDS, help='хранилища SQLite')
+    parser.add_argument('--calls', type=int, default=100, help='повторений точечных операций')
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help='файл для результатов в формате JSON')
+    parser.add_argument('--data-dir', type=Path, help='каталог для файловых баз (по умолчанию временный)')
+    parser.add_argument('--skip-memory', action='store_true', help='не замерять пиковое потребление памяти')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        data_dir = args.data_dir or Path(temporary_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        results = run(args.sizes, args.backends, args.calls, data_dir, trace_memory=not args.skip_memory)
+    write_results(results, args.output)
+    logger.info('Results written to %s', args.output)
+
+
+if __name__ == '__main__':
+    main()
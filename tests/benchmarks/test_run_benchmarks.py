@@ -0,0 +1,32 @@
+"""Проверка работоспособности набора бенчмарков на минимальном объеме данных."""
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.run_benchmarks import main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.performance
+def test_run_benchmarks__writes_results(tmp_path: 'Path') -> None:
+    """Тест запуска бенчмарков для обоих хранилищ.
+
+    Ожидаемый результат:
+    - В JSON-файл записываются замеры всех операций для каждого хранилища.
+    - Для каждой операции заполнены число запросов, время и пиковая память.
+    """
+    output = tmp_path / 'results.json'
+
+    main(['--sizes', '50', '--calls', '3', '--output', str(output), '--data-dir', str(tmp_path)])
+
+    report = json.loads(output.read_text(encoding='utf-8'))
+    operations = {(result['backend'], result['operation']) for result in report['results']}
+    assert {backend for backend, _ in operations} == {'memory', 'file'}
+    assert len(operations) == 20  # noqa: PLR2004
+    assert all(result['queries'] > 0 for result in report['results'])
+    assert all(result['wall_time_s'] > 0 for result in report['results'])
+    assert all(result['peak_memory_bytes'] > 0 for result in report['results'])
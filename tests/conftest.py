@@ -2,11 +2,15 @@ import os
 from typing import TYPE_CHECKING
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from warehouse_management.infrastructure.orm import Base
-from warehouse_management.infrastructure.repositories import SqlAlchemyOrderRepository, SqlAlchemyProductRepository
+from warehouse_management.infrastructure.repositories import (
+    SqlAlchemyCustomerRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyProductRepository,
+)
 from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
 if TYPE_CHECKING:
@@ -55,6 +59,20 @@ def order_repo(db_session: 'Session') -> 'SqlAlchemyOrderRepository':
     return SqlAlchemyOrderRepository(db_session)
 
 
+@pytest.fixture
+def customer_repo(db_session: 'Session') -> 'SqlAlchemyCustomerRepository':
+    """Создает тестовый репозиторий клиентов."""
+    return SqlAlchemyCustomerRepository(db_session)
+
+
+@pytest.fixture
+def executed_statements(db_session: 'Session') -> list[str]:
+    """Собирает SQL-запросы, выполненные через соединение тестовой сессии."""
+    statements: list[str] = []
+    event.listen(db_session.connection(), 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    return statements
+
+
 @pytest.fixture
 def unit_of_work(db_session: 'Session') -> 'SqlAlchemyUnitOfWork':
     """Создает тестовый Unit of Work."""
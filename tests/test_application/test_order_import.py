@@ -0,0 +1,166 @@
+"""Интеграционные тесты потокового импорта заказов."""
+
+import json
+from datetime import date
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+from warehouse_management.application.customer_service import CustomerService
+from warehouse_management.application.order_import import OrderImporter, read_records
+from warehouse_management.domain.models import Product
+from warehouse_management.domain.services import WarehouseService
+from warehouse_management.infrastructure.repositories import SqlAlchemyImportProgressRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pytest_mock import MockFixture
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.application.order_import import InvalidRecord
+    from warehouse_management.infrastructure.repositories import (
+        SqlAlchemyCustomerRepository,
+        SqlAlchemyOrderRepository,
+        SqlAlchemyProductRepository,
+    )
+    from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def importer(
+    db_session: 'Session',
+    unit_of_work: 'SqlAlchemyUnitOfWork',
+    product_repo: 'SqlAlchemyProductRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    customer_repo: 'SqlAlchemyCustomerRepository',
+) -> OrderImporter:
+    """Создает импорт пакетами по два заказа с двумя товарами и клиентом в базе."""
+    warehouse_service = WarehouseService(product_repo, order_repo)
+    customer_service = CustomerService(customer_repo, order_repo)
+    product_repo.add_many([Product(id=None, name=f'Feed item {i}', quantity=10, price=2.0) for i in range(2)])
+    customer_service.register_customer('Partner', date(1990, 1, 1))
+    return OrderImporter(
+        unit_of_work,
+        warehouse_service,
+        customer_service,
+        chunk_size=2,
+        progress_repo=SqlAlchemyImportProgressRepository(db_session),
+        checkpoint='orders',
+    )
+
+
+@pytest.mark.integration
+def test_order_importer__chunks_and_failures(importer: OrderImporter, tmp_path: 'Path') -> None:
+    """Тест импорта CSV с некорректными заказами.
+
+    Ожидаемый результат:
+    - Заказы с отсутствующим товаром, клиентом или неположительным количеством пропускаются целиком.
+    - Остальные заказы сохраняются со строками и ценой из файла или текущей ценой товара.
+    - В контрольной точке в базе сохраняется количество обработанных записей.
+    """
+    path = tmp_path / 'orders.csv'
+    path.write_text(
+        'order_ref,customer_id,product_id,quantity,unit_price\n'
+        'A,1,1,2,\n'
+        'A,1,2,1,5.0\n'
+        'B,1,404,1,\n'
+        'C,,1,0,\n'
+        'D,404,1,1,\n'
+        'E,,2,3,\n',
+        encoding='utf-8',
+    )
+
+    report = importer.run(read_records(path, 'csv'))
+
+    assert (report.rows, report.orders, report.failed_orders, report.failed_rows) == (6, 2, 3, 3)
+    assert importer.progress_repo is not None
+    assert importer.progress_repo.get_offset('orders') == 6  # noqa: PLR2004
+    orders = importer.warehouse_service.order_repo.list()
+    assert [(order.customer_id, order.get_total_price()) for order in orders] == [(1, 9.0), (None, 6.0)]
+
+
+@pytest.mark.integration
+def test_order_importer__resume_from_checkpoint(importer: OrderImporter, tmp_path: 'Path') -> None:
+    """Тест продолжения прерванного импорта JSONL.
+
+    Ожидаемый результат:
+    - Пакеты, зафиксированные до сбоя, не импортируются повторно.
+    - Повторный запуск продолжает импорт с первой незафиксированной записи.
+    """
+    path = tmp_path / 'orders.jsonl'
+    records = [{'order_ref': ref, 'customer_id': 1, 'product_id': 1, 'quantity': 1} for ref in range(5)]
+    path.write_text('\n'.join(json.dumps(record) for record in records) + '\n', encoding='utf-8')
+
+    def interrupted() -> 'Iterator[dict[str, Any] | InvalidRecord]':
+        for number, record in enumerate(read_records(path, 'jsonl')):
+            if number == 3:  # noqa: PLR2004
+                raise OSError('connection lost')
+            yield record
+
+    with pytest.raises(OSError, match='connection lost'):
+        importer.run(interrupted())
+    report = importer.run(read_records(path, 'jsonl'))
+
+    assert (report.offset, report.rows, report.orders) == (5, 3, 3)
+    assert len(importer.warehouse_service.order_repo.list()) == 5  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_order_importer__malformed_records(importer: OrderImporter, tmp_path: 'Path') -> None:
+    """Тест импорта JSONL с записями, которые не удалось разобрать.
+
+    Ожидаемый результат:
+    - Некорректный JSON и значения, не являющиеся объектами, пропускаются по одной записи.
+    - Соседние заказы сохраняются, а неразобранные записи учитываются в `malformed_rows`.
+    - Повторный запуск после завершения не останавливается на неразобранных записях.
+    """
+    path = tmp_path / 'orders.jsonl'
+    path.write_text(
+        '{"order_ref": "A", "customer_id": 1, "product_id": 1, "quantity": 1}\n'
+        '{"order_ref": "B", "customer_id": 1,\n'
+        '[1, 2]\n'
+        '{"order_ref": "C", "customer_id": 1, "product_id": 2, "quantity": 2}\n',
+        encoding='utf-8',
+    )
+
+    report = importer.run(read_records(path, 'jsonl'))
+    rerun = importer.run(read_records(path, 'jsonl'))
+
+    assert (report.rows, report.orders, report.malformed_rows, report.failed_orders) == (4, 2, 2, 0)
+    assert (rerun.offset, rerun.rows) == (4, 0)
+    assert len(importer.warehouse_service.order_repo.list()) == 2  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_order_importer__checkpoint_in_chunk_transaction(
+    importer: OrderImporter, tmp_path: 'Path', mocker: 'MockFixture'
+) -> None:
+    """Тест сбоя при сохранении контрольной точки пакета.
+
+    Ожидаемый результат:
+    - Заказы пакета откатываются вместе с контрольной точкой.
+    - Повторный запуск импортирует каждый заказ ровно один раз.
+    """
+    path = tmp_path / 'orders.jsonl'
+    records = [{'order_ref': ref, 'customer_id': 1, 'product_id': 1, 'quantity': 1} for ref in range(5)]
+    path.write_text('\n'.join(json.dumps(record) for record in records) + '\n', encoding='utf-8')
+    assert importer.progress_repo is not None
+    save_offset = importer.progress_repo.save_offset
+
+    def crash_on_second_chunk(source: str, offset: int) -> None:
+        if offset > 2:  # noqa: PLR2004
+            raise OSError('crashed before commit')
+        save_offset(source, offset)
+
+    mocker.patch.object(importer.progress_repo, 'save_offset', side_effect=crash_on_second_chunk)
+    with pytest.raises(OSError, match='crashed before commit'):
+        importer.run(read_records(path, 'jsonl'))
+    assert len(importer.warehouse_service.order_repo.list()) == 2  # noqa: PLR2004
+
+    mocker.patch.object(importer.progress_repo, 'save_offset', side_effect=save_offset)
+    report = importer.run(read_records(path, 'jsonl'))
+
+    assert (report.offset, report.rows, report.orders) == (5, 3, 3)
+    assert len(importer.warehouse_service.order_repo.list()) == 5  # noqa: PLR2004
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from warehouse_management.domain.models import OrderLine
 from warehouse_management.domain.services import WarehouseService
 
 if TYPE_CHECKING:
@@ -83,3 +84,111 @@ def test_create_product__invalid_input(
         warehouse_service.create_product(name=name, quantity=quantity, price=price)
 
     mock_product_repo.add.assert_not_called()
+
+
+@pytest.mark.unit
+def test_create_products__success(warehouse_service: 'WarehouseService', mocker: 'MockFixture') -> None:
+    """Тест пакетного создания товаров.
+
+    Ожидаемый результат:
+    - Товары создаются в порядке входных данных.
+    - Метод `add_many()` репозитория вызывается один раз со всеми товарами.
+    """
+    mock_product_repo = mocker.patch.object(warehouse_service, 'product_repo')
+    items = [('Laptop', 10, 999.99), ('Smartphone', 5, 499.50)]
+
+    products = warehouse_service.create_products(items, chunk_size=50)
+
+    assert [(p.name, p.quantity, p.price) for p in products] == items
+    mock_product_repo.add_many.assert_called_once_with(products, chunk_size=50)
+    mock_product_repo.add.assert_not_called()
+
+
+@pytest.mark.unit
+def test_create_products__invalid_item(warehouse_service: 'WarehouseService', mocker: 'MockFixture') -> None:
+    """Тест валидации всех позиций до сохранения.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError` с номером некорректной позиции.
+    - Метод `add_many()` репозитория **не вызывается**.
+    """
+    mock_product_repo = mocker.patch.object(warehouse_service, 'product_repo')
+
+    with pytest.raises(ValueError, match='Позиция 1'):
+        warehouse_service.create_products([('Laptop', 10, 999.99), ('Phone', -1, 10.0)])
+
+    mock_product_repo.add_many.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('partial, expected_reserved', [(False, []), (True, [OrderLine(1, 2), OrderLine(1, 1)])])
+def test_reserve_stock__insufficient_stock(
+    warehouse_service: 'WarehouseService',
+    mocker: 'MockFixture',
+    partial: bool,
+    expected_reserved: list[OrderLine],
+) -> None:
+    """Тест резервирования при нехватке остатка одного из товаров.
+
+    Ожидаемый результат:
+    - Количество повторяющегося товара суммируется, `reserve()` вызывается один раз.
+    - В результате перечислены строки, которые не удалось зарезервировать.
+    - Без `partial` резерв по остальным строкам возвращается через `release()`.
+    """
+    mock_product_repo = mocker.patch.object(warehouse_service, 'product_repo')
+    mock_product_repo.reserve.return_value = {1}
+    items = [OrderLine(1, 2), OrderLine(2, 5), OrderLine(1, 1)]
+
+    reservation = warehouse_service.reserve_stock(items, partial=partial)
+
+    mock_product_repo.reserve.assert_called_once_with({1: 3, 2: 5})
+    assert reservation.failed == [OrderLine(2, 5)]
+    assert reservation.reserved == expected_reserved
+    assert not reservation.is_complete
+    if partial:
+        mock_product_repo.release.assert_not_called()
+    else:
+        mock_product_repo.release.assert_called_once_with({1: 3})
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('line', [OrderLine(None, 1), OrderLine(1, 0)])
+def test_reserve_stock__invalid_line(
+    warehouse_service: 'WarehouseService', mocker: 'MockFixture', line: OrderLine
+) -> None:
+    """Тест валидации строк перед резервированием.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError` с номером некорректной позиции.
+    - Метод `reserve()` репозитория **не вызывается**.
+    """
+    mock_product_repo = mocker.patch.object(warehouse_service, 'product_repo')
+
+    with pytest.raises(ValueError, match='Позиция 1'):
+        warehouse_service.reserve_stock([OrderLine(1, 1), line])
+
+    mock_product_repo.reserve.assert_not_called()
+
+
+@pytest.mark.unit
+def test_order_totals__ids_and_filter(warehouse_service: 'WarehouseService', mocker: 'MockFixture') -> None:
+    """Тест пакетного расчета стоимости заказов.
+
+    Ожидаемый результат:
+    - Список ID разбивается на порции по `chunk_size`, для каждой вызывается `totals()`.
+    - Без списка ID обход делегируется `iter_totals()` репозитория с фильтром по клиенту.
+    - Одновременное указание ID и клиента отклоняется до обращения к репозиторию.
+    """
+    mock_order_repo = mocker.patch.object(warehouse_service, 'order_repo')
+    mock_order_repo.totals.side_effect = lambda chunk: dict.fromkeys(chunk, 1.0)
+
+    chunks = list(warehouse_service.order_totals([1, 2, 3], chunk_size=2))
+    warehouse_service.order_totals(customer_id=7, chunk_size=50)
+
+    assert chunks == [{1: 1.0, 2: 1.0}, {3: 1.0}]
+    mock_order_repo.iter_totals.assert_called_once_with(customer_id=7, batch_size=50)
+    with pytest.raises(ValueError, match='клиента'):
+        warehouse_service.order_totals([1], customer_id=7)
+    with pytest.raises(ValueError, match='порции'):
+        warehouse_service.order_totals([1], chunk_size=0)
+    assert mock_order_repo.totals.call_count == 2  # noqa: PLR2004
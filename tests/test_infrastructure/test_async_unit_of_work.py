@@ -0,0 +1,167 @@
+"""Интеграционные тесты для асинхронного Unit of Work и репозиториев."""
+
+import asyncio
+import multiprocessing
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+
+from warehouse_management.domain.models import Customer, Order, Product
+from warehouse_management.infrastructure.async_database import (
+    get_async_engine,
+    get_async_session_factory,
+    init_async_db,
+    to_async_url,
+)
+from warehouse_management.infrastructure.async_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from warehouse_management.infrastructure.database import get_engine
+from warehouse_management.settings import DatabaseSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+
+def run_with_uow(database_path: 'Path', scenario: 'Callable[[AsyncSqlAlchemyUnitOfWork], Awaitable[None]]') -> None:
+    """Создает схему во временной базе SQLite и выполняет асинхронный сценарий."""
+
+    async def main() -> None:
+        engine = get_async_engine(DatabaseSettings(url=f'sqlite:///{database_path}'))
+        await init_async_db(engine)
+        try:
+            await scenario(AsyncSqlAlchemyUnitOfWork(get_async_session_factory(engine)))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    'database_url, expected',
+    [
+        ('sqlite:///warehouse.db', 'sqlite+aiosqlite:///warehouse.db'),
+        ('sqlite+aiosqlite:///:memory:', 'sqlite+aiosqlite:///:memory:'),
+        ('postgresql://user:secret@db/warehouse', 'postgresql+asyncpg://user:secret@db/warehouse'),
+    ],
+)
+@pytest.mark.unit
+def test_to_async_url(database_url: str, expected: str) -> None:
+    """Тест выбора асинхронного драйвера по URL.
+
+    Ожидаемый результат:
+    - Для синхронного URL подставляется асинхронный драйвер, явный драйвер сохраняется.
+    """
+    assert to_async_url(database_url) == expected
+
+
+def _check_async_pool_in_child(settings: DatabaseSettings) -> None:
+    """Проверяет в дочернем процессе, что пул асинхронного движка не содержит соединений родителя."""
+    if get_async_engine(settings).sync_engine.pool.checkedin() != 0:  # type: ignore[attr-defined]
+        raise SystemExit(1)
+
+
+@pytest.mark.integration
+# Соединение aiosqlite в пуле держит собственный поток, fork() выполняется при живом потоке.
+@pytest.mark.filterwarnings('ignore:This process .* is multi-threaded:DeprecationWarning')
+def test_get_async_engine__registered_and_fork_safe(tmp_path: 'Path') -> None:
+    """Тест повторного использования асинхронного движка и его сброса после fork().
+
+    Ожидаемый результат:
+    - Для одинаковых настроек возвращается один и тот же движок, отличный от синхронного.
+    - Дочерний процесс не наследует соединения родителя из пула асинхронного движка.
+    """
+    settings = DatabaseSettings(url=f'sqlite:///{tmp_path / "async_fork.db"}')
+    engine = get_async_engine(settings)
+    assert get_async_engine(DatabaseSettings(url=settings.url)) is engine
+    assert get_engine(settings) is not engine.sync_engine
+
+    async def connect() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+    asyncio.run(connect())
+    assert engine.sync_engine.pool.checkedin() == 1  # type: ignore[attr-defined]
+
+    child = multiprocessing.get_context('fork').Process(target=_check_async_pool_in_child, args=(settings,))
+    child.start()
+    child.join()
+
+    assert child.exitcode == 0
+    asyncio.run(engine.dispose())
+
+
+@pytest.mark.integration
+def test_async_unit_of_work__commit_concurrent(tmp_path: 'Path') -> None:
+    """Тест конкурентных Unit of Work на одном цикле событий.
+
+    Ожидаемый результат:
+    - Каждая задача работает в собственной сессии, все изменения фиксируются.
+    """
+
+    async def scenario(uow: AsyncSqlAlchemyUnitOfWork) -> None:
+        async def create(index: int) -> None:
+            async with AsyncSqlAlchemyUnitOfWork(uow.session_factory) as task_uow:
+                await task_uow.products.add(Product(id=None, name=f'Async {index}', quantity=index, price=1.0))
+
+        await asyncio.gather(*(create(index) for index in range(20)))
+
+        async with uow:
+            products = [product async for product in uow.products.iter_all(batch_size=7)]
+
+        assert sorted(product.name for product in products) == sorted(f'Async {index}' for index in range(20))
+
+    run_with_uow(tmp_path / 'async.db', scenario)
+
+
+@pytest.mark.integration
+def test_async_unit_of_work__rollback_on_error(tmp_path: 'Path') -> None:
+    """Тест отката изменений при исключении.
+
+    Ожидаемый результат:
+    - Изменения не сохраняются, сессия закрывается.
+    """
+
+    async def scenario(uow: AsyncSqlAlchemyUnitOfWork) -> None:
+        with pytest.raises(RuntimeError, match='Ошибка'):
+            async with uow:
+                await uow.products.add_many([Product(id=None, name='Rolled back', quantity=1, price=1.0)])
+                raise RuntimeError('Ошибка внутри транзакции')
+
+        async with uow:
+            assert await uow.products.list() == []
+
+        with pytest.raises(RuntimeError, match='not active'):
+            _ = uow.session
+
+    run_with_uow(tmp_path / 'async.db', scenario)
+
+
+@pytest.mark.integration
+def test_async_repositories__customer_graph(tmp_path: 'Path') -> None:
+    """Тест чтения графа клиента через асинхронные репозитории.
+
+    Ожидаемый результат:
+    - Клиент, заказы и товары читаются так же, как синхронными репозиториями.
+    """
+
+    async def scenario(uow: AsyncSqlAlchemyUnitOfWork) -> None:
+        products = [Product(id=None, name=f'Item {index}', quantity=1, price=2.0) for index in range(2)]
+        customer = Customer(id=None, name='Async customer', birth_date=date(1990, 1, 1))
+
+        async with uow:
+            await uow.products.add_many(products)
+            await uow.customers.add(customer)
+            await uow.orders.add(Order(id=None, customer_id=customer.id, products=products))
+
+        async with uow:
+            assert customer.id is not None
+            stored = await uow.customers.get(customer.id)
+            orders = await uow.orders.page(limit=10, load_products=False)
+
+        assert stored.name == customer.name
+        assert [sorted(p.name for p in order.products) for order in stored.orders] == [['Item 0', 'Item 1']]
+        assert [order.customer_id for order in orders] == [customer.id]
+
+    run_with_uow(tmp_path / 'async.db', scenario)
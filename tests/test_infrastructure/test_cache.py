@@ -0,0 +1,236 @@
+"""Тесты для кэширующего репозитория товаров."""
+
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
+
+import pytest
+
+from warehouse_management.domain.models import Product
+from warehouse_management.infrastructure.cache import CachedProductRepository, CacheStats
+from warehouse_management.infrastructure.orm import ProductORM
+from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+    from pytest_mock import MockFixture
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.infrastructure.repositories import SqlAlchemyProductRepository
+
+
+@pytest.fixture
+def backing_repo(mocker: 'MockFixture') -> 'Mock':
+    """Создает мок-репозиторий, возвращающий товар с запрошенным ID."""
+    repo: Mock = mocker.Mock()
+    repo.get.side_effect = lambda product_id: Product(id=product_id, name=f'P{product_id}', quantity=1, price=1.0)
+    return repo
+
+
+@pytest.mark.unit
+def test_cached_product_repository__hit_and_miss(backing_repo: 'Mock') -> None:
+    """Тест read-through кэширования.
+
+    Ожидаемый результат:
+    - Повторный `get()` не обращается к обернутому репозиторию.
+    - Изменение возвращенного объекта не влияет на кэш.
+    """
+    cache = CachedProductRepository(backing_repo)
+
+    first = cache.get(1)
+    first.price = 999.0
+    second = cache.get(1)
+
+    assert second.price == 1.0
+    backing_repo.get.assert_called_once_with(1)
+    assert cache.stats == CacheStats(hits=1, misses=1)
+
+
+@pytest.mark.unit
+def test_cached_product_repository__lru_eviction(backing_repo: 'Mock') -> None:
+    """Тест вытеснения наименее используемых записей.
+
+    Ожидаемый результат:
+    - При превышении `max_size` вытесняется самая давно использованная запись.
+    """
+    cache = CachedProductRepository(backing_repo, max_size=2)
+
+    cache.get(1)
+    cache.get(2)
+    cache.get(1)
+    cache.get(3)
+    cache.get(1)
+    cache.get(2)
+
+    assert backing_repo.get.call_count == 4  # noqa: PLR2004
+    assert cache.stats.evictions == 2  # noqa: PLR2004
+    assert len(cache) == 2  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_cached_product_repository__ttl_expiration(backing_repo: 'Mock') -> None:
+    """Тест устаревания записей по TTL.
+
+    Ожидаемый результат:
+    - Запись обслуживается из кэша до истечения TTL и перечитывается после.
+    """
+    now = [0.0]
+    cache = CachedProductRepository(backing_repo, ttl_seconds=10, clock=lambda: now[0])
+
+    cache.get(1)
+    now[0] = 9.9
+    cache.get(1)
+    now[0] = 10.0
+    cache.get(1)
+
+    assert backing_repo.get.call_count == 2  # noqa: PLR2004
+    assert cache.stats == CacheStats(hits=1, misses=2, evictions=1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('max_size, ttl_seconds', [(0, None), (10, 0), (10, -1.0)])
+def test_cached_product_repository__invalid_config(
+    backing_repo: 'Mock', max_size: int, ttl_seconds: float | None
+) -> None:
+    """Тест проверки параметров кэша.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError`.
+    """
+    with pytest.raises(ValueError):
+        CachedProductRepository(backing_repo, max_size=max_size, ttl_seconds=ttl_seconds)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('fail', [False, True])
+def test_cached_product_repository__invalidated_by_unit_of_work(
+    product_repo: 'SqlAlchemyProductRepository', db_session: 'Session', fail: bool
+) -> None:
+    """Тест инвалидации кэша после завершения Unit of Work.
+
+    Ожидаемый результат:
+    - После commit() или rollback() следующий `get()` читает актуальное значение из базы.
+    """
+    product = Product(id=None, name='Cached', quantity=10, price=5.0)
+    product_repo.add(product)
+    db_session.commit()
+    cache = CachedProductRepository(product_repo)
+    uow = SqlAlchemyUnitOfWork(db_session, product_cache=cache)
+    assert product.id is not None
+    cache.get(product.id)
+
+    with pytest.raises(RuntimeError) if fail else nullcontext(), uow:
+        db_session.get_one(ProductORM, product.id).quantity = 3
+        db_session.flush()
+        assert cache.get(product.id).quantity == 10  # noqa: PLR2004
+        if fail:
+            raise RuntimeError('Ошибка внутри транзакции')
+
+    assert cache.get(product.id).quantity == (10 if fail else 3)
+    assert cache.stats.invalidations == 1
+
+
+@pytest.mark.integration
+def test_cached_product_repository__invalidated_after_reserve(
+    product_repo: 'SqlAlchemyProductRepository', db_session: 'Session'
+) -> None:
+    """Тест инвалидации кэша после резервирования массовым UPDATE.
+
+    Ожидаемый результат:
+    - После commit() кэш не возвращает остаток, бывший до резервирования.
+    """
+    product = Product(id=None, name='Reserved', quantity=10, price=5.0)
+    product_repo.add(product)
+    db_session.commit()
+    cache = CachedProductRepository(product_repo)
+    assert product.id is not None
+    cache.get(product.id)
+
+    with SqlAlchemyUnitOfWork(db_session, product_cache=cache):
+        assert cache.reserve({product.id: 4}) == {product.id}
+
+    assert cache.get(product.id).quantity == 6  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_cached_product_repository__invalidated_during_load(backing_repo: 'Mock') -> None:
+    """Тест инвалидации, пришедшей во время чтения товара при промахе.
+
+    Ожидаемый результат:
+    - Значение, прочитанное до инвалидации, не сохраняется в кэш.
+    - Следующий `get()` перечитывает товар из обернутого репозитория.
+    """
+    cache = CachedProductRepository(backing_repo)
+    read = backing_repo.get.side_effect
+
+    def read_then_invalidate(product_id: int) -> Product:
+        product: Product = read(product_id)
+        cache.invalidate([product_id])
+        return product
+
+    backing_repo.get.side_effect = read_then_invalidate
+    cache.get(1)
+    backing_repo.get.side_effect = read
+    cache.get(1)
+    cache.get(1)
+
+    assert backing_repo.get.call_count == 2  # noqa: PLR2004
+    assert len(cache) == 1
+
+
+@pytest.mark.integration
+def test_cached_product_repository__skips_uncommitted_writes(
+    product_repo: 'SqlAlchemyProductRepository', db_session: 'Session'
+) -> None:
+    """Тест чтения товаров, измененных в незафиксированной транзакции.
+
+    Ожидаемый результат:
+    - Товар, измененный до или после flush, читается с изменениями, но не сохраняется в кэш.
+    - Неизмененный товар из той же транзакции кэшируется.
+    - После rollback() кэш и база возвращают исходный остаток.
+    """
+    changed = Product(id=None, name='Changed', quantity=10, price=5.0)
+    untouched = Product(id=None, name='Untouched', quantity=7, price=1.0)
+    product_repo.add_many([changed, untouched])
+    db_session.commit()
+    cache = CachedProductRepository(product_repo, session=db_session)
+    assert changed.id is not None
+    assert untouched.id is not None
+
+    with pytest.raises(RuntimeError), SqlAlchemyUnitOfWork(db_session, product_cache=cache):
+        db_session.get_one(ProductORM, changed.id).quantity = 3
+        assert cache.get(changed.id).quantity == 3  # noqa: PLR2004
+        db_session.flush()
+        assert cache.get(changed.id).quantity == 3  # noqa: PLR2004
+        cache.get(untouched.id)
+        assert len(cache) == 1
+        raise RuntimeError('Ошибка внутри транзакции')
+
+    assert cache.get(changed.id).quantity == 10  # noqa: PLR2004
+    assert cache.get(untouched.id).quantity == 7  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_cached_product_repository__bypassed_after_reserve_in_transaction(
+    product_repo: 'SqlAlchemyProductRepository', db_session: 'Session'
+) -> None:
+    """Тест чтения закэшированного товара после резервирования в той же транзакции.
+
+    Ожидаемый результат:
+    - После `reserve()` `get()` возвращает остаток из транзакции, а не закэшированный.
+    - Закэшированная запись не подменяется незафиксированным значением.
+    """
+    product = Product(id=None, name='Reserved', quantity=10, price=5.0)
+    product_repo.add(product)
+    db_session.commit()
+    cache = CachedProductRepository(product_repo, session=db_session)
+    assert product.id is not None
+    cache.get(product.id)
+
+    with pytest.raises(RuntimeError), SqlAlchemyUnitOfWork(db_session, product_cache=cache):
+        assert cache.reserve({product.id: 3}) == {product.id}
+        assert cache.get(product.id).quantity == 7  # noqa: PLR2004
+        assert cache.exists(product.id)
+        raise RuntimeError('Ошибка внутри транзакции')
+
+    assert cache.get(product.id).quantity == 10  # noqa: PLR2004
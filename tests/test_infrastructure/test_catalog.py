@@ -0,0 +1,117 @@
+"""Интеграционные тесты для колоночного снимка каталога товаров."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from warehouse_management.domain.models import Product
+from warehouse_management.infrastructure.catalog import ProductCatalogSnapshot
+from warehouse_management.infrastructure.orm import ProductORM
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.infrastructure.repositories import SqlAlchemyProductRepository
+
+
+@pytest.fixture
+def snapshot(product_repo: 'SqlAlchemyProductRepository', db_session: 'Session') -> ProductCatalogSnapshot:
+    """Создает снимок каталога из четырех товаров."""
+    product_repo.add_many(
+        [
+            Product(id=None, name='Laptop', quantity=2, price=1000.0),
+            Product(id=None, name='Mouse', quantity=50, price=10.0),
+            Product(id=None, name='Monitor', quantity=0, price=300.0),
+            Product(id=None, name='Cable', quantity=100, price=1.5),
+        ]
+    )
+    catalog = ProductCatalogSnapshot(db_session, batch_size=2)
+    catalog.load()
+    return catalog
+
+
+@pytest.mark.integration
+def test_product_catalog_snapshot__aggregates(snapshot: ProductCatalogSnapshot) -> None:
+    """Тест агрегатов по колонкам снимка.
+
+    Ожидаемый результат:
+    - Стоимость остатков, гистограмма цен и маска малых остатков считаются по всем товарам.
+    - Товар находится по названию.
+    """
+    assert len(snapshot) == 4  # noqa: PLR2004
+    assert snapshot.total_stock_value() == 2000.0 + 500.0 + 0.0 + 150.0
+    assert snapshot.price_histogram([0, 10, 500, 1000]) == [1, 2, 1]
+    assert list(snapshot.low_stock_mask(5)) == [1, 0, 1, 0]
+    assert snapshot.low_stock_ids(5) == [snapshot.ids[0], snapshot.ids[2]]
+    assert snapshot.index_of('Monitor') == 2  # noqa: PLR2004
+    assert snapshot.index_of('Keyboard') is None
+
+
+@pytest.mark.integration
+def test_product_catalog_snapshot__refresh(
+    snapshot: ProductCatalogSnapshot,
+    product_repo: 'SqlAlchemyProductRepository',
+    db_session: 'Session',
+    executed_statements: list[str],
+) -> None:
+    """Тест инкрементального обновления снимка.
+
+    Ожидаемый результат:
+    - Читаются измененные и новые товары, включая изменения массовым UPDATE, но не весь каталог.
+    - Колонки и индекс названий отражают новые значения.
+    """
+    laptop = db_session.get_one(ProductORM, snapshot.ids[0])
+    laptop.name = 'Gaming laptop'
+    product_repo.reserve({snapshot.ids[1]: 20})
+    product_repo.add(Product(id=None, name='Keyboard', quantity=3, price=50.0))
+    db_session.flush()
+    executed_statements.clear()
+
+    # Кроме трех измененных товаров перечитываются строки с отметкой времени на границе предыдущей загрузки.
+    assert 3 <= snapshot.refresh() < 5  # noqa: PLR2004
+
+    # Запрос измененных товаров и сверка ID для поиска удаленных.
+    assert len(executed_statements) == 2  # noqa: PLR2004
+    assert len(snapshot) == 5  # noqa: PLR2004
+    assert list(snapshot.quantities) == [2, 30, 0, 100, 3]
+    assert snapshot.index_of('Laptop') is None
+    assert snapshot.index_of('Gaming laptop') == 0
+    assert snapshot.index_of('Keyboard') == 4  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_product_catalog_snapshot__refresh_removes_deleted(
+    snapshot: ProductCatalogSnapshot, product_repo: 'SqlAlchemyProductRepository', db_session: 'Session'
+) -> None:
+    """Тест обновления снимка после удаления товаров.
+
+    Ожидаемый результат:
+    - Удаленные товары исключаются из колонок, агрегатов и индексов.
+    - Добавленный в том же обновлении товар появляется в снимке.
+    """
+    laptop_id, _, monitor_id, _ = snapshot.ids
+    db_session.delete(db_session.get_one(ProductORM, laptop_id))
+    db_session.delete(db_session.get_one(ProductORM, monitor_id))
+    product_repo.add(Product(id=None, name='Keyboard', quantity=3, price=50.0))
+    db_session.flush()
+
+    snapshot.refresh()
+
+    assert len(snapshot) == 3  # noqa: PLR2004
+    assert snapshot.total_stock_value() == 500.0 + 150.0 + 150.0
+    assert snapshot.price_histogram([0, 10, 500, 1000]) == [1, 2, 0]
+    assert snapshot.index_of('Laptop') is None
+    assert snapshot.index_of('Keyboard') == 2  # noqa: PLR2004
+    assert laptop_id not in snapshot.ids
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('edges', [[], [1.0], [1.0, 1.0], [2.0, 1.0]])
+def test_product_catalog_snapshot__invalid_edges(db_session: 'Session', edges: list[float]) -> None:
+    """Тест валидации границ гистограммы.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError`.
+    """
+    with pytest.raises(ValueError):
+        ProductCatalogSnapshot(db_session).price_histogram(edges)
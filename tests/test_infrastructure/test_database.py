@@ -0,0 +1,148 @@
+"""Интеграционные тесты для настройки движка базы данных."""
+
+import multiprocessing
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+
+from warehouse_management.infrastructure.database import (
+    create_database_engine,
+    engine_options,
+    get_engine,
+    ReplicaRouter,
+)
+from warehouse_management.settings import DatabaseSettings, SqliteSettings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.integration
+def test_get_engine__sqlite_pragmas(tmp_path: 'Path') -> None:
+    """Тест применения PRAGMA к соединениям SQLite.
+
+    Ожидаемый результат:
+    - Каждое соединение получает значения PRAGMA из настроек.
+    """
+    settings = DatabaseSettings(
+        url=f'sqlite:///{tmp_path / "pragmas.db"}',
+        sqlite=SqliteSettings(synchronous='FULL', busy_timeout_ms=1234, cache_size=-2000, mmap_size=0),
+    )
+    engine = create_database_engine(settings)
+
+    with engine.connect() as connection:
+        pragmas = {
+            name: connection.execute(text(f'PRAGMA {name}')).scalar()
+            for name in ('journal_mode', 'synchronous', 'busy_timeout', 'cache_size', 'mmap_size', 'foreign_keys')
+        }
+    engine.dispose()
+
+    assert pragmas == {
+        'journal_mode': 'wal',
+        'synchronous': 2,
+        'busy_timeout': 1234,
+        'cache_size': -2000,
+        'mmap_size': 0,
+        'foreign_keys': 1,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'url, expect_pool_size',
+    [
+        ('sqlite://', False),
+        ('sqlite:///:memory:', False),
+        ('sqlite:///warehouse.db', True),
+        ('postgresql://user@db/warehouse', True),
+    ],
+)
+def test_engine_options__pool_size(url: str, expect_pool_size: bool) -> None:
+    """Тест выбора параметров пула.
+
+    Ожидаемый результат:
+    - Размер пула передается всем базам, кроме SQLite в памяти.
+    """
+    options = engine_options(DatabaseSettings(url=url, pool_size=7, pool_recycle=300), make_url(url))
+
+    assert options['pool_recycle'] == 300  # noqa: PLR2004
+    assert options['pool_pre_ping'] is True
+    assert ('pool_size' in options) is expect_pool_size
+
+
+@pytest.mark.unit
+def test_database_settings__env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Тест чтения настроек базы данных из переменных окружения.
+
+    Ожидаемый результат:
+    - Значения берутся из переменных с префиксом `WAREHOUSE_MANAGEMENT_DATABASE_`.
+    """
+    monkeypatch.setenv('WAREHOUSE_MANAGEMENT_DATABASE_URL', 'sqlite:///env.db')
+    monkeypatch.setenv('WAREHOUSE_MANAGEMENT_DATABASE_POOL_SIZE', '20')
+    monkeypatch.setenv('WAREHOUSE_MANAGEMENT_DATABASE_SQLITE_JOURNAL_MODE', 'DELETE')
+
+    settings = DatabaseSettings(sqlite=SqliteSettings())
+
+    assert settings.url == 'sqlite:///env.db'
+    assert settings.pool_size == 20  # noqa: PLR2004
+    assert settings.sqlite.journal_mode == 'DELETE'
+
+
+def _query_in_child(settings: DatabaseSettings) -> None:
+    """Проверяет в дочернем процессе, что пул движка не содержит соединений родителя."""
+    engine = get_engine(settings)
+    if engine.pool.checkedin() != 0:  # type: ignore[attr-defined]
+        raise SystemExit(1)
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+
+
+@pytest.mark.integration
+def test_get_engine__lazy_and_fork_safe(tmp_path: 'Path') -> None:
+    """Тест повторного использования движка и его сброса после fork().
+
+    Ожидаемый результат:
+    - Для одинаковых настроек возвращается один и тот же движок.
+    - Дочерний процесс не использует соединения родителя и открывает собственные.
+    - Соединения родителя остаются рабочими после завершения дочернего процесса.
+    """
+    settings = DatabaseSettings(url=f'sqlite:///{tmp_path / "fork.db"}')
+    engine = get_engine(settings)
+    assert get_engine(DatabaseSettings(url=settings.url)) is engine
+    assert get_engine(DatabaseSettings(url=settings.url, echo=True)) is not engine
+
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+    assert engine.pool.checkedin() == 1  # type: ignore[attr-defined]
+
+    child = multiprocessing.get_context('fork').Process(target=_query_in_child, args=(settings,))
+    child.start()
+    child.join()
+
+    assert child.exitcode == 0
+    with engine.connect() as connection:
+        assert connection.execute(text('SELECT 1')).scalar() == 1
+
+
+@pytest.mark.integration
+def test_replica_router__round_robin_and_health_checks(tmp_path: 'Path') -> None:
+    """Тест выбора реплики для чтения.
+
+    Ожидаемый результат:
+    - Доступные реплики выбираются по очереди, недоступная реплика пропускается.
+    - Результат проверки доступности переиспользуется в течение интервала.
+    - Если недоступны все реплики, возвращается основной движок.
+    """
+    primary, first, second = (create_engine(f'sqlite:///{tmp_path / name}') for name in ('p.db', 'r1.db', 'r2.db'))
+    broken = create_engine(f'sqlite:///{tmp_path / "missing" / "r3.db"}')
+    router = ReplicaRouter(primary, [first, broken, second], health_check_interval_s=60)
+    checks: list[object] = []
+    event.listen(first.pool, 'checkout', lambda *args: checks.append(args))
+
+    chosen = [router.engine() for _ in range(6)]
+
+    assert chosen == [first, second, second, first, second, second]
+    assert len(checks) == 1
+    assert ReplicaRouter(primary, [broken]).engine() is primary
@@ -0,0 +1,123 @@
+"""Интеграционные тесты потоковой выгрузки данных."""
+
+import csv
+import gzip
+import json
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+
+from warehouse_management.domain.models import Customer, Order, OrderLine, Product
+from warehouse_management.infrastructure.export import export
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.infrastructure.repositories import (
+        SqlAlchemyCustomerRepository,
+        SqlAlchemyOrderRepository,
+        SqlAlchemyProductRepository,
+    )
+
+
+@pytest.fixture
+def exported_data(
+    product_repo: 'SqlAlchemyProductRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    customer_repo: 'SqlAlchemyCustomerRepository',
+) -> None:
+    """Создает два товара, клиента, заказ с двумя строками и пустой заказ."""
+    product_repo.add_many([Product(id=None, name=f'Товар {i}', quantity=10, price=2.0) for i in range(2)])
+    customer_repo.add(Customer(id=None, name='Partner', birth_date=date(1990, 1, 1)))
+    order_repo.add_many(
+        [
+            Order(
+                id=None, customer_id=1, lines=[OrderLine(product_id=2, quantity=1), OrderLine(product_id=1, quantity=3)]
+            ),
+            Order(id=None, customer_id=None, lines=[]),
+        ]
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures('exported_data')
+def test_export__csv(db_session: 'Session', tmp_path: 'Path') -> None:
+    """Тест выгрузки в CSV.
+
+    Ожидаемый результат:
+    - Товары и клиенты выгружаются по строке на запись с заголовком.
+    - Заказ выгружается по строке на каждую строку заказа, пустой заказ — строкой без товара.
+    """
+    products_path, orders_path = tmp_path / 'products.csv', tmp_path / 'orders.csv'
+
+    assert export(db_session, 'products', products_path, batch_size=1) == 2  # noqa: PLR2004
+    assert export(db_session, 'orders', orders_path, batch_size=1) == 3  # noqa: PLR2004
+
+    with products_path.open(encoding='utf-8', newline='') as file:
+        assert list(csv.reader(file)) == [
+            ['id', 'name', 'quantity', 'price'],
+            ['1', 'Товар 0', '10', '2.0'],
+            ['2', 'Товар 1', '10', '2.0'],
+        ]
+    with orders_path.open(encoding='utf-8', newline='') as file:
+        assert list(csv.reader(file)) == [
+            ['order_id', 'customer_id', 'product_id', 'quantity', 'unit_price'],
+            ['1', '1', '1', '3', '2.0'],
+            ['1', '1', '2', '1', '2.0'],
+            ['2', '', '', '', ''],
+        ]
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures('exported_data')
+def test_export__jsonl_gzip(db_session: 'Session', tmp_path: 'Path') -> None:
+    """Тест выгрузки в сжатый JSONL.
+
+    Ожидаемый результат:
+    - Файл с расширением `.jsonl.gz` сжимается gzip и содержит по объекту на строку.
+    - Строки заказа объединяются в список `lines`, даты записываются в формате ISO.
+    - Неподдерживаемый формат отклоняется.
+    """
+    orders_path, customers_path = tmp_path / 'orders.jsonl.gz', tmp_path / 'customers.jsonl.gz'
+
+    assert export(db_session, 'orders', orders_path) == 2  # noqa: PLR2004
+    assert export(db_session, 'customers', customers_path) == 1
+
+    with gzip.open(orders_path, 'rt', encoding='utf-8') as file:
+        assert [json.loads(line) for line in file] == [
+            {
+                'id': 1,
+                'customer_id': 1,
+                'lines': [
+                    {'product_id': 1, 'quantity': 3, 'unit_price': 2.0},
+                    {'product_id': 2, 'quantity': 1, 'unit_price': 2.0},
+                ],
+            },
+            {'id': 2, 'customer_id': None, 'lines': []},
+        ]
+    with gzip.open(customers_path, 'rt', encoding='utf-8') as file:
+        assert [json.loads(line) for line in file] == [{'id': 1, 'name': 'Partner', 'birth_date': '1990-01-01'}]
+    with pytest.raises(ValueError, match='Unsupported export format'):
+        export(db_session, 'products', tmp_path / 'products.xml')
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures('exported_data')
+def test_export__jsonl_keeps_non_ascii(db_session: 'Session', tmp_path: 'Path') -> None:
+    """Тест записи не-ASCII символов в сжатый и несжатый JSONL.
+
+    Ожидаемый результат:
+    - Названия записываются как есть, без экранирования Unicode-последовательностями.
+    - Сжатый и несжатый файлы содержат одинаковый текст.
+    """
+    plain_path, compressed_path = tmp_path / 'products.jsonl', tmp_path / 'products.jsonl.gz'
+
+    export(db_session, 'products', plain_path, batch_size=1)
+    export(db_session, 'products', compressed_path, batch_size=1)
+
+    text = plain_path.read_text(encoding='utf-8')
+    assert '"name": "Товар 0"' in text
+    assert gzip.decompress(compressed_path.read_bytes()).decode('utf-8') == text
@@ -0,0 +1,128 @@
+"""Интеграционные тесты Unit of Work с групповой фиксацией."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from warehouse_management.domain.models import Product
+from warehouse_management.infrastructure.database import get_session_factory
+from warehouse_management.infrastructure.group_commit import GroupCommitUnitOfWork
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.infrastructure.repositories import SqlAlchemyProductRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def engine(tmp_path: 'Path') -> 'Generator[Engine]':
+    """Создает движок файловой базы SQLite со схемой приложения."""
+    engine = create_engine(f'sqlite:///{tmp_path / "warehouse.db"}')
+    upgrade(engine)
+    yield engine
+    engine.dispose()
+
+
+def _add_product(name: str) -> 'Callable[[Session], int]':
+    """Возвращает операцию, добавляющую товар и возвращающую его ID."""
+
+    def operation(session: 'Session') -> int:
+        product = Product(id=None, name=name, quantity=1, price=1.0)
+        SqlAlchemyProductRepository(session).add(product)
+        assert product.id is not None
+        if name == 'Broken':
+            raise ValueError('broken operation')
+        return product.id
+
+    return operation
+
+
+@pytest.mark.integration
+def test_group_commit__savepoint_per_caller(engine: 'Engine') -> None:
+    """Тест групповой фиксации операций конкурентных вызывающих.
+
+    Ожидаемый результат:
+    - Операции из разных потоков фиксируются меньшим числом транзакций, чем операций.
+    - Ошибка одной операции передается в ее Future, а ее изменения откатываются до точки сохранения.
+    - Остальные операции пакета фиксируются, их Future возвращают результат.
+    """
+    commits: list[object] = []
+    event.listen(engine, 'commit', commits.append)
+    names = [f'Item {i}' for i in range(19)] + ['Broken']
+
+    with (
+        GroupCommitUnitOfWork(get_session_factory(engine), max_batch_size=50, max_delay_ms=50) as group_commit,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        futures = list(executor.map(lambda name: group_commit.submit(_add_product(name)), names))
+        with pytest.raises(ValueError, match='broken operation'):
+            futures[-1].result()
+        ids = [future.result() for future in futures[:-1]]
+
+    with get_session_factory(engine)() as session:
+        products = SqlAlchemyProductRepository(session).list()
+    product_ids = [product.id for product in products if product.id is not None]
+    assert len(product_ids) == len(products)
+    assert sorted(product_ids) == sorted(ids)
+    assert 'Broken' not in {product.name for product in products}
+    assert len(commits) < len(names)
+
+
+@pytest.mark.integration
+def test_group_commit__batch_size_and_close(engine: 'Engine') -> None:
+    """Тест ограничения размера пакета и закрытия Unit of Work.
+
+    Ожидаемый результат:
+    - Пакет фиксируется, как только в нем набирается `max_batch_size` операций.
+    - close() фиксирует неполный пакет, не дожидаясь `max_delay_ms`.
+    - После закрытия новые операции не принимаются.
+    """
+    commits: list[object] = []
+    event.listen(engine, 'commit', commits.append)
+    group_commit = GroupCommitUnitOfWork(get_session_factory(engine), max_batch_size=2, max_delay_ms=60_000)
+
+    futures = [group_commit.submit(_add_product(f'Item {i}')) for i in range(5)]
+    group_commit.close()
+
+    assert [future.result() for future in futures] == [1, 2, 3, 4, 5]
+    assert len(commits) == 3  # noqa: PLR2004
+    with pytest.raises(RuntimeError, match='closed'):
+        group_commit.submit(_add_product('Late'))
+
+
+@pytest.mark.integration
+def test_group_commit__futures_resolved_after_failed_commit(engine: 'Engine') -> None:
+    """Тест ошибки фиксации пакета с операцией, завершившейся ошибкой.
+
+    Ожидаемый результат:
+    - К моменту фиксации пакета ни одна Future еще не завершена, включая Future неудачной операции.
+    - После ошибки фиксации успешная операция получает ошибку фиксации, неудачная — свою ошибку.
+    - Изменения пакета не сохраняются.
+    """
+    session_factory = get_session_factory(engine)
+    done_at_commit: list[bool] = []
+    futures: list[Future[int]] = []
+
+    def fail_commit(_session: 'Session') -> None:
+        if not done_at_commit:
+            done_at_commit.extend(future.done() for future in futures)
+        raise RuntimeError('commit failed')
+
+    event.listen(session_factory, 'before_commit', fail_commit)
+    with GroupCommitUnitOfWork(session_factory, max_batch_size=2, max_delay_ms=1000) as group_commit:
+        futures.extend(group_commit.submit(_add_product(name)) for name in ('Broken', 'Saved'))
+        with pytest.raises(ValueError, match='broken operation'):
+            futures[0].result()
+        with pytest.raises(RuntimeError, match='commit failed'):
+            futures[1].result()
+
+    assert done_at_commit == [False, False]
+    with get_session_factory(engine)() as session:
+        assert SqlAlchemyProductRepository(session).list() == []
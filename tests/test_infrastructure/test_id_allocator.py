@@ -0,0 +1,159 @@
+"""Интеграционные тесты назначения ID блоками из таблицы последовательностей."""
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from warehouse_management.domain.models import Customer, Product
+from warehouse_management.infrastructure.database import get_session_factory
+from warehouse_management.infrastructure.group_commit import GroupCommitUnitOfWork
+from warehouse_management.infrastructure.id_allocator import SequenceIdAllocator
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.infrastructure.orm import ProductORM
+from warehouse_management.infrastructure.repositories import SqlAlchemyCustomerRepository, SqlAlchemyProductRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+
+
+@pytest.fixture
+def engine(tmp_path: 'Path') -> 'Generator[Engine]':
+    """Создает движок файловой базы SQLite со схемой приложения."""
+    engine = create_engine(f'sqlite:///{tmp_path / "warehouse.db"}')
+    upgrade(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.integration
+def test_sequence_id_allocator__blocks(engine: 'Engine') -> None:
+    """Тест резервирования блоков ID.
+
+    Ожидаемый результат:
+    - Первый блок начинается после максимального ID таблицы.
+    - Аллокаторы, работающие с одной базой, получают непересекающиеся блоки.
+    - Запрос больше размера блока резервирует блок нужного размера.
+    """
+    with engine.begin() as connection:
+        connection.execute(insert(ProductORM), [{'name': f'Item {i}', 'quantity': 1, 'price': 1.0} for i in range(7)])
+    first, second = SequenceIdAllocator(engine, block_size=3), SequenceIdAllocator(engine, block_size=3)
+
+    assert first.allocate('products', 2) == [8, 9]
+    assert second.allocate('products') == [11]
+    assert first.allocate('products', 5) == [10, 14, 15, 16, 17]
+    assert first.allocate('customers') == [1]
+
+
+@pytest.mark.integration
+def test_repositories__id_allocator_defers_inserts(engine: 'Engine') -> None:
+    """Тест добавления товаров и клиентов с ID, назначенными на клиенте.
+
+    Ожидаемый результат:
+    - add() назначает ID сразу, не выполняя запросов к базе.
+    - Отложенные вставки отправляются при фиксации одним executemany на таблицу.
+    - add_many() вставляет товары одним executemany без RETURNING.
+    """
+    allocator = SequenceIdAllocator(engine, block_size=10)
+    allocator.allocate('products')
+    allocator.allocate('customers')
+    statements: list[tuple[str, bool]] = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append((args[2], args[5])))
+
+    with Session(engine) as session:
+        product_repo = SqlAlchemyProductRepository(session, id_allocator=allocator)
+        customer_repo = SqlAlchemyCustomerRepository(session, id_allocator=allocator)
+        products = [Product(id=None, name=f'Item {i}', quantity=1, price=1.0) for i in range(3)]
+        for product in products:
+            product_repo.add(product)
+        customer = Customer(id=None, name='Partner', birth_date=date(1990, 1, 1))
+        customer_repo.add(customer)
+        assert statements == []
+        session.commit()
+        inserts_on_commit = [statement for statement in statements if statement[0].startswith('INSERT')]
+
+        statements.clear()
+        batch = [Product(id=None, name=f'Batch {i}', quantity=1, price=1.0) for i in range(20)]
+        product_repo.add_many(batch, chunk_size=50)
+        session.commit()
+
+        assert [product.id for product in products] == [2, 3, 4]
+        assert customer.id == 2  # noqa: PLR2004
+        assert sorted((statement.split()[2], many) for statement, many in inserts_on_commit) == [
+            ('customers', False),
+            ('products', True),
+        ]
+        assert [(statement.split()[0], many) for statement, many in statements] == [
+            ('UPDATE', False),
+            ('SELECT', False),
+            ('INSERT', True),
+        ]
+        assert 'RETURNING' not in statements[-1][0]
+        assert [product.id for product in product_repo.list()] == [2, 3, 4, *range(5, 25)]
+
+
+@pytest.mark.integration
+def test_sequence_id_allocator__reserves_inside_write_transaction(engine: 'Engine') -> None:
+    """Тест резервирования блока, когда сессия уже держит блокировку записи SQLite.
+
+    Ожидаемый результат:
+    - После flush новый блок резервируется в транзакции сессии без ожидания блокировки.
+    - При откате транзакции блок отбрасывается вместе с резервированием.
+    - После фиксации остаток блока выдается другим сессиям.
+    """
+    allocator = SequenceIdAllocator(engine, block_size=2)
+
+    with Session(engine) as session:
+        repo = SqlAlchemyProductRepository(session, id_allocator=allocator)
+        for i in range(3):
+            repo.add(Product(id=None, name=f'Rolled back {i}', quantity=1, price=1.0))
+            session.flush()
+        session.rollback()
+
+        products = [Product(id=None, name=f'Item {i}', quantity=1, price=1.0) for i in range(3)]
+        for product in products:
+            repo.add(product)
+            session.flush()
+        session.commit()
+
+    with Session(engine) as session:
+        customer = Customer(id=None, name='Partner', birth_date=date(1990, 1, 1))
+        SqlAlchemyCustomerRepository(session, id_allocator=allocator).add(customer)
+        product = Product(id=None, name='Next', quantity=1, price=1.0)
+        SqlAlchemyProductRepository(session, id_allocator=allocator).add(product)
+        session.commit()
+
+        # ID 1 и 2 выданы откаченным строкам из общего блока, блок [3, 4] отброшен вместе с откатом.
+        assert [product.id for product in products] == [3, 4, 5]
+        assert product.id == 6  # noqa: PLR2004
+        assert customer.id == 1
+        assert [p.id for p in SqlAlchemyProductRepository(session).list()] == [3, 4, 5, 6]
+
+
+@pytest.mark.integration
+def test_sequence_id_allocator__group_commit(engine: 'Engine') -> None:
+    """Тест назначения ID в операциях групповой фиксации.
+
+    Ожидаемый результат:
+    - Блоки резервируются внутри транзакции `BEGIN IMMEDIATE` пакета без ожидания блокировки.
+    - Операции одного пакета получают разные ID, все товары сохраняются.
+    """
+    allocator = SequenceIdAllocator(engine, block_size=2)
+
+    def add_product(session: Session) -> int:
+        product = Product(id=None, name='Item', quantity=1, price=1.0)
+        SqlAlchemyProductRepository(session, id_allocator=allocator).add(product)
+        assert product.id is not None
+        return product.id
+
+    with GroupCommitUnitOfWork(get_session_factory(engine), max_batch_size=10, max_delay_ms=50) as group_commit:
+        futures = [group_commit.submit(add_product) for _ in range(5)]
+        ids = [future.result() for future in futures]
+
+    with Session(engine) as session:
+        assert [product.id for product in SqlAlchemyProductRepository(session).list()] == sorted(ids) == [1, 2, 3, 4, 5]
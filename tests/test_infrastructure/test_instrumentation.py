@@ -0,0 +1,85 @@
+"""Интеграционные тесты инструментирования SQL-запросов Unit of Work."""
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import Session
+
+from warehouse_management.domain.models import Product
+from warehouse_management.infrastructure.instrumentation import SqlInstrumentation
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.infrastructure.orm import ProductORM
+from warehouse_management.infrastructure.repositories import SqlAlchemyProductRepository
+from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from sqlalchemy.engine import Engine
+
+
+@pytest.fixture
+def engine() -> 'Generator[Engine]':
+    """Создает движок базы данных в памяти со схемой приложения."""
+    engine = create_engine('sqlite://')
+    upgrade(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.integration
+def test_unit_of_work__stats_and_n_plus_one(engine: 'Engine', caplog: pytest.LogCaptureFixture) -> None:
+    """Тест статистики запросов Unit of Work и поиска N+1.
+
+    Ожидаемый результат:
+    - После выхода из блока `with` статистика содержит число запросов, затронутых строк и время.
+    - Запрос, повторенный в одном Unit of Work больше порога, отмечается как вероятный N+1.
+    - Запросы вне блока `with` в статистику не попадают.
+    """
+    with engine.begin() as connection:
+        connection.execute(insert(ProductORM), [{'name': f'Item {i}', 'quantity': 1, 'price': 1.0} for i in range(5)])
+    instrumentation = SqlInstrumentation(engine, n_plus_one_threshold=3)
+    with Session(engine) as session:
+        repository = SqlAlchemyProductRepository(session)
+        uow = SqlAlchemyUnitOfWork(session, instrumentation=instrumentation)
+        with caplog.at_level(logging.WARNING), uow:
+            products = [repository.get(product_id) for product_id in range(1, 6)]
+            session.execute(update(ProductORM).values(quantity=0).execution_options(synchronize_session=False))
+        session.execute(select(ProductORM.id))
+    instrumentation.close()
+
+    assert len(products) == 5  # noqa: PLR2004
+    assert uow.stats is not None
+    assert uow.stats.statements == 6  # noqa: PLR2004
+    assert uow.stats.rows == 5  # noqa: PLR2004
+    assert uow.stats.duration_s > 0
+    assert list(uow.stats.repeated_statements.values()) == [5]
+    assert 'Possible N+1' in caplog.text
+
+
+@pytest.mark.integration
+def test_sql_instrumentation__slow_query_log(engine: 'Engine', caplog: pytest.LogCaptureFixture) -> None:
+    """Тест журнала медленных запросов.
+
+    Ожидаемый результат:
+    - Запросы не быстрее порога записываются в журнал и в статистику Unit of Work.
+    - Без порога журнал медленных запросов не ведется.
+    """
+    instrumentation = SqlInstrumentation(engine, slow_query_threshold_ms=0)
+    with Session(engine) as session, caplog.at_level(logging.WARNING):
+        uow = SqlAlchemyUnitOfWork(session, instrumentation=instrumentation)
+        with uow:
+            SqlAlchemyProductRepository(session).add(Product(id=None, name='Slow', quantity=1, price=1.0))
+        slow_stats = uow.stats
+        instrumentation.slow_query_threshold_ms = None
+        with uow:
+            SqlAlchemyProductRepository(session).list()
+    instrumentation.close()
+
+    assert slow_stats is not None and uow.stats is not None
+    assert caplog.text.count('Slow query') == 1
+    assert [statement.split()[0] for statement, _ in slow_stats.slow_statements] == ['INSERT']
+    assert uow.stats.statements == 1
+    assert uow.stats.slow_statements == []
@@ -0,0 +1,106 @@
+"""Интеграционные тесты для обновления схемы базы данных."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from warehouse_management.infrastructure.migrations import MIGRATIONS, upgrade
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+
+LEGACY_SCHEMA = (
+    'CREATE TABLE products (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL, quantity INTEGER NOT NULL, '
+    'price FLOAT NOT NULL)',
+    'CREATE TABLE orders (id INTEGER PRIMARY KEY)',
+    'CREATE TABLE customers (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL, birth_date DATE NOT NULL)',
+    'CREATE TABLE order_product_associations (order_id INTEGER REFERENCES orders (id), '
+    'product_id INTEGER REFERENCES products (id))',
+    "INSERT INTO products (id, name, quantity, price) VALUES (1, 'Laptop', 1, 10.0), (2, 'Phone', 2, 5.0)",
+    'INSERT INTO orders (id) VALUES (1), (2)',
+    'INSERT INTO order_product_associations (order_id, product_id) VALUES (1, 1), (1, 1), (1, 2), (2, 2)',
+)
+
+
+@pytest.fixture
+def file_engine(tmp_path: 'Path') -> 'Engine':
+    """Создает движок для временного файла SQLite."""
+    return create_engine(f'sqlite:///{tmp_path / "warehouse.db"}')
+
+
+def _index_names(engine: 'Engine', table: str) -> set[str | None]:
+    return {index['name'] for index in inspect(engine).get_indexes(table)}
+
+
+@pytest.mark.integration
+def test_upgrade__legacy_database(file_engine: 'Engine') -> None:
+    """Тест обновления базы, созданной до появления индексов и `orders.customer_id`.
+
+    Ожидаемый результат:
+    - Добавляются колонка и индексы.
+    - Связи переносятся в `order_lines` с количеством, равным числу повторов связи, и текущей ценой товара.
+    - Повторный запуск ничего не меняет.
+    """
+    with file_engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.execute(text(statement))
+
+    assert upgrade(file_engine) == [migration.version for migration in MIGRATIONS]
+    assert upgrade(file_engine) == []
+
+    inspector = inspect(file_engine)
+    assert 'customer_id' in {column['name'] for column in inspector.get_columns('orders')}
+    assert not inspector.has_table('order_product_associations')
+    assert inspector.get_pk_constraint('order_lines')['constrained_columns'] == ['order_id', 'product_id']
+    assert 'ix_orders_customer_id' in _index_names(file_engine, 'orders')
+    assert 'ix_products_name' in _index_names(file_engine, 'products')
+    assert 'ix_products_updated_at' in _index_names(file_engine, 'products')
+    assert 'ix_order_lines_product_id' in _index_names(file_engine, 'order_lines')
+    with file_engine.connect() as connection:
+        rows = connection.execute(text('SELECT order_id, product_id, quantity, unit_price FROM order_lines')).all()
+    assert sorted(tuple(row) for row in rows) == [(1, 1, 2, 10.0), (1, 2, 1, 5.0), (2, 2, 1, 5.0)]
+
+
+@pytest.mark.integration
+def test_upgrade__duplicate_associations_keep_quantity(file_engine: 'Engine') -> None:
+    """Тест переноса повторяющихся связей заказа с товаром.
+
+    Ожидаемый результат:
+    - Миграция 0001 объединяет повторы пары (order_id, product_id) в одну строку с их числом в `quantity`.
+    - Миграция 0002 переносит это число в количество строки заказа.
+    """
+    with file_engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.execute(text(statement))
+        connection.execute(text('INSERT INTO order_product_associations (order_id, product_id) VALUES (2, 2), (2, 2)'))
+        MIGRATIONS[0].apply(connection)
+        associations = connection.execute(
+            text('SELECT order_id, product_id, quantity FROM order_product_associations ORDER BY order_id, product_id')
+        ).all()
+
+    upgrade(file_engine)
+
+    with file_engine.connect() as connection:
+        lines = connection.execute(
+            text('SELECT order_id, product_id, quantity FROM order_lines ORDER BY order_id, product_id')
+        ).all()
+    assert [tuple(row) for row in associations] == [(1, 1, 2), (1, 2, 1), (2, 2, 3)]
+    assert [tuple(row) for row in lines] == [(1, 1, 2), (1, 2, 1), (2, 2, 3)]
+
+
+@pytest.mark.integration
+def test_upgrade__new_database(file_engine: 'Engine') -> None:
+    """Тест инициализации пустой базы.
+
+    Ожидаемый результат:
+    - Схема создается в актуальном виде, миграции помечаются примененными без выполнения.
+    """
+    assert upgrade(file_engine) == []
+
+    with file_engine.connect() as connection:
+        versions = connection.scalars(text('SELECT version FROM schema_migrations')).all()
+    assert versions == [migration.version for migration in MIGRATIONS]
+    assert 'ix_products_name' in _index_names(file_engine, 'products')
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 import pytest
 from sqlalchemy.exc import IntegrityError
 
-from warehouse_management.infrastructure.orm import OrderORM, ProductORM
+from warehouse_management.infrastructure.orm import OrderLineORM, OrderORM, ProductORM
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -86,12 +86,12 @@ def test_order_orm__create_with_products(db_session: 'Session', products: list[d
 
     Ожидаемый результат:
     - Заказ сохраняется в базе.
-    - Продукты связываются с заказом.
+    - Продукты связываются с заказом через строки заказа.
     """
     product_orms = [ProductORM(**product) for product in products]
 
     order = OrderORM()
-    order.products = product_orms
+    order.lines = [OrderLineORM(product=p, quantity=1, unit_price=p.price) for p in product_orms]
 
     db_session.add_all(product_orms + [order])
     db_session.commit()
@@ -1,16 +1,26 @@
 """Интеграционные тесты для SQLAlchemy репозиториев."""
 
+from datetime import date
 from typing import TYPE_CHECKING
 
 import pytest
+from sqlalchemy import select
 
 from warehouse_management.domain.exceptions import NotFoundError
-from warehouse_management.infrastructure.orm import ProductORM
+from warehouse_management.domain.models import Customer, Order, OrderLine, Product
+from warehouse_management.infrastructure.orm import OrderORM, ProductORM
+from warehouse_management.infrastructure.repositories import (
+    SqlAlchemyCustomerRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyProductRepository,
+)
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
-    from warehouse_management.infrastructure.repositories import SqlAlchemyProductRepository
+
+def _count_selects(statements: list[str]) -> int:
+    return sum(statement.lstrip().upper().startswith('SELECT') for statement in statements)
 
 
 @pytest.mark.integration
@@ -68,3 +78,508 @@ def test_product_repository__get_invalid_id(
     """
     with pytest.raises(expected_exception):
         product_repo.get(invalid_id)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+def test_product_repository__add_many(product_repo: 'SqlAlchemyProductRepository', chunk_size: int) -> None:
+    """Тест пакетного добавления товаров.
+
+    Ожидаемый результат:
+    - Каждому товару присваивается ID в порядке входных данных.
+    - Товары извлекаются по присвоенным ID.
+    """
+    products = [Product(id=None, name=f'Bulk {i}', quantity=i, price=10.0 * i) for i in range(5)]
+
+    product_repo.add_many(products, chunk_size=chunk_size)
+
+    assert all(product.id is not None for product in products)
+    assert len({product.id for product in products}) == len(products)
+    for product in products:
+        stored_product = product_repo.get(int(product.id))  # type: ignore[arg-type]
+        assert stored_product == product
+
+
+@pytest.mark.integration
+def test_product_repository__add_many_invalid_chunk_size(product_repo: 'SqlAlchemyProductRepository') -> None:
+    """Тест обработки некорректного размера пакета.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError`.
+    """
+    with pytest.raises(ValueError):
+        product_repo.add_many([Product(id=None, name='Bulk', quantity=1, price=1.0)], chunk_size=0)
+
+
+@pytest.mark.integration
+def test_order_repository__add_many_resolves_products_in_one_query(
+    product_repo: 'SqlAlchemyProductRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    db_session: 'Session',
+    executed_statements: list[str],
+) -> None:
+    """Тест пакетного добавления заказов.
+
+    Ожидаемый результат:
+    - Товары всех заказов загружаются одним SELECT-запросом.
+    - Заказы сохраняются со всеми товарами.
+    """
+    products = [Product(id=None, name=f'Order item {i}', quantity=1, price=1.0) for i in range(4)]
+    product_repo.add_many(products)
+    db_session.expunge_all()
+
+    orders = [
+        Order(id=None, customer_id=None, products=products[:3]),
+        Order(id=None, customer_id=None, products=products[1:]),
+    ]
+    executed_statements.clear()
+
+    order_repo.add_many(orders)
+    db_session.flush()
+
+    assert _count_selects(executed_statements) == 1
+    stored = db_session.scalars(select(OrderORM).order_by(OrderORM.id)).all()
+    assert [[p.id for p in o.products] for o in stored] == [[p.id for p in o.products] for o in orders]
+
+
+@pytest.mark.integration
+def test_order_repository__add_missing_products(
+    product_repo: 'SqlAlchemyProductRepository', order_repo: 'SqlAlchemyOrderRepository'
+) -> None:
+    """Тест добавления заказа с несуществующими товарами.
+
+    Ожидаемый результат:
+    - Выбрасывается одна ошибка `NotFoundError` со всеми отсутствующими ID.
+    """
+    existing = Product(id=None, name='Existing', quantity=1, price=1.0)
+    product_repo.add(existing)
+    order = Order(
+        id=None,
+        customer_id=None,
+        products=[
+            existing,
+            Product(id=1001, name='Ghost', quantity=1, price=1.0),
+            Product(id=1002, name='Ghost', quantity=1, price=1.0),
+        ],
+    )
+
+    with pytest.raises(NotFoundError, match=r'\[1001, 1002\]'):
+        order_repo.add(order)
+
+
+@pytest.mark.integration
+def test_order_repository__lines_and_totals(
+    product_repo: 'SqlAlchemyProductRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    db_session: 'Session',
+    executed_statements: list[str],
+) -> None:
+    """Тест сохранения строк заказа и расчета стоимости в SQL.
+
+    Ожидаемый результат:
+    - В строках сохраняются заказанное количество и цена на момент заказа.
+    - Изменение цены товара не влияет на стоимость оформленных заказов.
+    - `totals()` выполняет один SELECT с GROUP BY; заказ без строк стоит 0.0.
+    """
+    laptop = Product(id=None, name='Laptop', quantity=10, price=100.0)
+    mouse = Product(id=None, name='Mouse', quantity=50, price=5.0)
+    product_repo.add_many([laptop, mouse])
+    orders = [
+        Order(id=1, customer_id=None, lines=[OrderLine(laptop.id, 2), OrderLine(mouse.id, 3, unit_price=4.0)]),
+        Order(id=2, customer_id=None, products=[mouse, mouse]),
+        Order(id=3, customer_id=None),
+    ]
+    order_repo.add_many(orders)
+    db_session.flush()
+    db_session.get_one(ProductORM, laptop.id).price = 999.0
+    db_session.flush()
+    db_session.expunge_all()
+    executed_statements.clear()
+
+    totals = order_repo.totals([1, 2, 3, 404])
+
+    assert _count_selects(executed_statements) == 1
+    assert 'GROUP BY' in executed_statements[0].upper()
+    assert totals == {1: 212.0, 2: 10.0, 3: 0.0}
+    stored = order_repo.get(1)
+    assert stored is not None
+    assert stored.lines == [OrderLine(laptop.id, 2, 100.0), OrderLine(mouse.id, 3, 4.0)]
+    assert stored.get_total_price() == totals[1]
+    assert [order.get_total_price() for order in order_repo.page(limit=10)] == [212.0, 10.0, 0.0]
+
+
+@pytest.mark.integration
+def test_order_repository__repeated_products(
+    product_repo: 'SqlAlchemyProductRepository', order_repo: 'SqlAlchemyOrderRepository', db_session: 'Session'
+) -> None:
+    """Тест сохранения заказа, в списке товаров которого товар повторяется.
+
+    Ожидаемый результат:
+    - Повторы товара сохраняются одной строкой с количеством, равным числу повторов.
+    - Стоимость в SQL совпадает с `Order.get_total_price()` до сохранения.
+    """
+    laptop = Product(id=None, name='Laptop', quantity=10, price=100.0)
+    mouse = Product(id=None, name='Mouse', quantity=50, price=5.0)
+    product_repo.add_many([laptop, mouse])
+    order = Order(id=1, customer_id=None, products=[mouse, laptop, mouse, mouse])
+    order_repo.add(order)
+    db_session.flush()
+    db_session.expunge_all()
+
+    stored = order_repo.get(1)
+
+    assert stored is not None
+    assert stored.lines == [OrderLine(laptop.id, 1, 100.0), OrderLine(mouse.id, 3, 5.0)]
+    assert order_repo.totals([1]) == {1: order.get_total_price()} == {1: 115.0}
+
+
+@pytest.mark.integration
+def test_product_repository__reserve_and_release(
+    product_repo: 'SqlAlchemyProductRepository', db_session: 'Session', executed_statements: list[str]
+) -> None:
+    """Тест атомарного резервирования остатков.
+
+    Ожидаемый результат:
+    - Все товары резервируются одним UPDATE без предварительного SELECT.
+    - Товары с недостаточным остатком и отсутствующие товары не изменяются.
+    - Загруженные в сессию объекты отражают новые остатки; `release()` возвращает количество.
+    """
+    products = [Product(id=None, name=f'Stock {i}', quantity=5, price=1.0) for i in range(3)]
+    product_repo.add_many(products)
+    ids: list[int] = [p.id for p in products]  # type: ignore[misc]
+    loaded = db_session.get_one(ProductORM, ids[0])
+    executed_statements.clear()
+
+    reserved = product_repo.reserve({ids[0]: 5, ids[1]: 6, ids[2]: 1, 404: 1})
+
+    assert reserved == {ids[0], ids[2]}
+    assert len(executed_statements) == 1
+    assert executed_statements[0].lstrip().upper().startswith('UPDATE')
+    assert loaded.quantity == 0
+    assert [product_repo.get(product_id).quantity for product_id in ids] == [0, 5, 4]
+
+    product_repo.release({ids[0]: 2, ids[2]: 1})
+
+    assert [product_repo.get(product_id).quantity for product_id in ids] == [2, 5, 5]
+
+
+@pytest.mark.integration
+def test_order_repository__invalid_line_quantity(order_repo: 'SqlAlchemyOrderRepository') -> None:
+    """Тест добавления строки заказа с неположительным количеством.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError`.
+    """
+    with pytest.raises(ValueError, match='quantity'):
+        order_repo.add(Order(id=None, customer_id=None, lines=[OrderLine(product_id=1, quantity=0)]))
+
+
+@pytest.mark.integration
+def test_order_repository__conflicting_line_prices(
+    product_repo: 'SqlAlchemyProductRepository', order_repo: 'SqlAlchemyOrderRepository', db_session: 'Session'
+) -> None:
+    """Тест добавления заказа, в котором один товар указан с разными ценами.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError`, ни один заказ пакета не добавляется в сессию.
+    - Повторы товара с одинаковой ценой объединяются в одну строку.
+    """
+    mouse = Product(id=None, name='Mouse', quantity=50, price=5.0)
+    product_repo.add(mouse)
+    valid = Order(id=1, customer_id=None, lines=[OrderLine(mouse.id, 1, 4.0), OrderLine(mouse.id, 2, 4.0)])
+    conflicting = Order(id=2, customer_id=None, lines=[OrderLine(mouse.id, 1, 4.0), OrderLine(mouse.id, 2, 3.0)])
+
+    with pytest.raises(ValueError, match='conflicting unit prices'):
+        order_repo.add_many([valid, conflicting])
+    assert not db_session.new
+
+    order_repo.add(valid)
+    db_session.flush()
+    db_session.expunge_all()
+
+    stored = order_repo.get(1)
+
+    assert stored is not None
+    assert stored.lines == [OrderLine(mouse.id, 3, 4.0)]
+
+
+@pytest.fixture
+def customers_with_orders(
+    product_repo: 'SqlAlchemyProductRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    db_session: 'Session',
+) -> list['Customer']:
+    """Создает трех клиентов с двумя заказами по два товара у каждого."""
+    products = [Product(id=None, name=f'Graph item {i}', quantity=1, price=2.0) for i in range(2)]
+    product_repo.add_many(products)
+
+    customers = [Customer(id=None, name=f'Customer {i}', birth_date=date(1990, 1, i + 1)) for i in range(3)]
+    for customer in customers:
+        customer_repo.add(customer)
+        order_repo.add_many([Order(id=None, customer_id=customer.id, products=products) for _ in range(2)])
+
+    db_session.flush()
+    db_session.expunge_all()
+    return customers
+
+
+@pytest.mark.integration
+def test_repositories__exists_and_get_reference(
+    customers_with_orders: list['Customer'],
+    product_repo: 'SqlAlchemyProductRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    executed_statements: list[str],
+) -> None:
+    """Тест проверки существования и получения ссылок по первичному ключу.
+
+    Ожидаемый результат:
+    - `exists()` выполняет один SELECT по первичному ключу для каждого вызова.
+    - `get_reference()` выполняет один SELECT по первичному ключу и не загружает связанные объекты.
+    - Для отсутствующих объектов `get_reference()` выбрасывает `NotFoundError`.
+    """
+    customer_id = customers_with_orders[0].id
+    assert customer_id is not None
+    repositories = (product_repo, order_repo, customer_repo)
+    executed_statements.clear()
+
+    existing = [repository.exists(1) for repository in repositories]
+    missing = [repository.exists(404) for repository in repositories]
+    probes = _count_selects(executed_statements)
+    executed_statements.clear()
+    customer = customer_repo.get_reference(customer_id)
+    order = order_repo.get_reference(1)
+
+    assert (existing, missing, probes) == ([True] * 3, [False] * 3, 6)
+    assert _count_selects(executed_statements) == 2  # noqa: PLR2004
+    assert customer == Customer(id=customer_id, name='Customer 0', birth_date=date(1990, 1, 1))
+    assert order == Order(id=1, customer_id=customer_id)
+    assert product_repo.get_reference(1).name == 'Graph item 0'
+    for repository in repositories:
+        with pytest.raises(NotFoundError):
+            repository.get_reference(404)
+
+
+@pytest.mark.integration
+def test_customer_repository__summary(
+    customers_with_orders: list['Customer'],
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    executed_statements: list[str],
+) -> None:
+    """Тест сводки по клиенту с постраничными последними заказами.
+
+    Ожидаемый результат:
+    - Сводка читается двумя SELECT без загрузки заказов и товаров.
+    - Количество заказов и выручка считаются по всем заказам клиента.
+    - Страницы идут от новых заказов к старым, курсор последней страницы равен None.
+    """
+    customer_id = customers_with_orders[2].id
+    assert customer_id is not None
+    executed_statements.clear()
+
+    first = customer_repo.summary(customer_id, orders_limit=1)
+    selects = _count_selects(executed_statements)
+    second = customer_repo.summary(customer_id, orders_limit=1, before_id=first.next_cursor)
+
+    assert selects == 2  # noqa: PLR2004
+    assert first.customer == Customer(id=customer_id, name='Customer 2', birth_date=date(1990, 1, 3))
+    assert (first.order_count, first.revenue) == (2, 8.0)
+    assert first.recent_orders == {6: 4.0}
+    assert first.next_cursor == 6  # noqa: PLR2004
+    assert second.recent_orders == {5: 4.0}
+    assert second.next_cursor is None
+    with pytest.raises(NotFoundError):
+        customer_repo.summary(404)
+
+
+@pytest.mark.integration
+def test_repositories__core_reads(customers_with_orders: list['Customer'], db_session: 'Session') -> None:
+    """Тест чтения моделей запросами Core без ORM-объектов.
+
+    Ожидаемый результат:
+    - `get()` и `list()` возвращают те же доменные модели, что и чтение через ORM.
+    - В identity map сессии не появляется ни одного объекта.
+    - Отсутствующие товар и клиент по-прежнему приводят к `NotFoundError`, заказ — к None.
+    """
+    orm_reads = (
+        SqlAlchemyProductRepository(db_session).list(),
+        SqlAlchemyOrderRepository(db_session).list(),
+        SqlAlchemyCustomerRepository(db_session).list(),
+    )
+    db_session.expunge_all()
+    products = SqlAlchemyProductRepository(db_session, core_reads=True)
+    orders = SqlAlchemyOrderRepository(db_session, core_reads=True)
+    customers = SqlAlchemyCustomerRepository(db_session, core_reads=True)
+    customer_id = customers_with_orders[0].id
+    assert customer_id is not None
+
+    assert (products.list(), orders.list(), customers.list()) == orm_reads
+    assert products.get(1) == orm_reads[0][0]
+    assert orders.get(1) == orm_reads[1][0]
+    assert customers.get(customer_id) == orm_reads[2][0]
+    assert len(db_session.identity_map) == 0
+    assert orders.get(404) is None
+    with pytest.raises(NotFoundError):
+        products.get(404)
+    with pytest.raises(NotFoundError):
+        customers.get(404)
+
+
+@pytest.mark.integration
+def test_order_repository__iter_totals(
+    customers_with_orders: list['Customer'], order_repo: 'SqlAlchemyOrderRepository', executed_statements: list[str]
+) -> None:
+    """Тест потокового расчета стоимости заказов порциями.
+
+    Ожидаемый результат:
+    - Каждая порция считается одним SELECT с GROUP BY и содержит не больше `batch_size` заказов
+      в порядке ID; обход завершается пустой порцией.
+    - Фильтры по клиенту и `after_id` ограничивают обход.
+    """
+    executed_statements.clear()
+
+    chunks = list(order_repo.iter_totals(batch_size=4))
+    selects = _count_selects(executed_statements)
+    by_customer = [order_id for chunk in order_repo.iter_totals(customers_with_orders[1].id) for order_id in chunk]
+    resumed = [order_id for chunk in order_repo.iter_totals(after_id=4) for order_id in chunk]
+
+    assert [list(chunk) for chunk in chunks] == [[1, 2, 3, 4], [5, 6]]
+    assert all(total == 4.0 for chunk in chunks for total in chunk.values())  # noqa: PLR2004
+    assert selects == 3  # noqa: PLR2004
+    assert 'GROUP BY' in executed_statements[0].upper()
+    assert by_customer == [3, 4]
+    assert resumed == [5, 6]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    'load_orders, load_products, expected_selects, expected_orders, expected_products',
+    [
+        (True, True, 3, 2, 2),
+        (True, False, 2, 2, 0),
+        (False, True, 1, 0, 0),
+    ],
+)
+def test_customer_repository__list_load_strategies(  # noqa: PLR0913
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    customers_with_orders: list['Customer'],
+    executed_statements: list[str],
+    load_orders: bool,
+    load_products: bool,
+    expected_selects: int,
+    expected_orders: int,
+    expected_products: int,
+) -> None:
+    """Тест загрузки графа клиентов фиксированным числом запросов.
+
+    Ожидаемый результат:
+    - Число SELECT-запросов не зависит от количества клиентов и заказов.
+    - Заказы и товары заполняются только при соответствующих флагах.
+    """
+    executed_statements.clear()
+
+    customers = customer_repo.list(load_orders=load_orders, load_products=load_products)
+
+    assert _count_selects(executed_statements) == expected_selects
+    assert [c.id for c in customers] == [c.id for c in customers_with_orders]
+    for customer in customers:
+        assert len(customer.orders) == expected_orders
+        assert all(len(order.products) == expected_products for order in customer.orders)
+
+
+@pytest.mark.integration
+def test_order_repository__list_without_products(
+    order_repo: 'SqlAlchemyOrderRepository',
+    customers_with_orders: list['Customer'],
+    executed_statements: list[str],
+) -> None:
+    """Тест загрузки заказов без товаров.
+
+    Ожидаемый результат:
+    - Выполняется один SELECT-запрос.
+    - Списки товаров пустые, `customer_id` заполнен.
+    """
+    executed_statements.clear()
+
+    orders = order_repo.list(load_products=False)
+
+    assert _count_selects(executed_statements) == 1
+    assert len(orders) == len(customers_with_orders) * 2
+    assert all(order.products == [] and order.customer_id is not None for order in orders)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('batch_size', [1, 2, 1000])
+def test_product_repository__iter_all_and_page(
+    product_repo: 'SqlAlchemyProductRepository', db_session: 'Session', batch_size: int
+) -> None:
+    """Тест потокового перебора и keyset-пагинации товаров.
+
+    Ожидаемый результат:
+    - `iter_all()` возвращает все товары в порядке ID.
+    - Страницы `page()` покрывают все товары без пропусков и повторов.
+    - Загруженные строки не попадают в identity map сессии.
+    """
+    products = [Product(id=None, name=f'Stream {i}', quantity=i, price=1.0) for i in range(5)]
+    product_repo.add_many(products)
+    db_session.expunge_all()
+
+    assert list(product_repo.iter_all(batch_size=batch_size)) == products
+
+    pages: list[list[Product]] = []
+    after_id = None
+    while page := product_repo.page(after_id=after_id, limit=2):
+        pages.append(page)
+        after_id = page[-1].id
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [product for page in pages for product in page] == products
+    assert len(db_session.identity_map) == 0
+
+
+@pytest.mark.integration
+def test_order_repository__iter_all_and_page(
+    order_repo: 'SqlAlchemyOrderRepository', customers_with_orders: list['Customer']
+) -> None:
+    """Тест потокового перебора и keyset-пагинации заказов.
+
+    Ожидаемый результат:
+    - `iter_all()` и `page()` возвращают те же заказы, что и `list()`.
+    """
+    expected = order_repo.list()
+
+    assert len(expected) == len(customers_with_orders) * 2
+    assert list(order_repo.iter_all(batch_size=4)) == expected
+    assert order_repo.page(after_id=expected[1].id, limit=3) == expected[2:5]
+    assert all(order.products == [] for order in order_repo.page(limit=2, load_products=False))
+
+
+@pytest.mark.integration
+def test_customer_repository__iter_all_and_page(
+    customer_repo: 'SqlAlchemyCustomerRepository', customers_with_orders: list['Customer']
+) -> None:
+    """Тест потокового перебора и keyset-пагинации клиентов.
+
+    Ожидаемый результат:
+    - `iter_all()` и `page()` возвращают тех же клиентов с заказами, что и `list()`.
+    """
+    expected = customer_repo.list()
+
+    assert list(customer_repo.iter_all(batch_size=2)) == expected
+    assert customer_repo.page(after_id=customers_with_orders[0].id, limit=1) == expected[1:2]
+    assert customer_repo.page(limit=10, load_orders=False)[0].orders == []
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('method, kwargs', [('iter_all', {'batch_size': 0}), ('page', {'limit': 0})])
+def test_product_repository__stream_invalid_size(
+    product_repo: 'SqlAlchemyProductRepository', method: str, kwargs: dict[str, int]
+) -> None:
+    """Тест обработки некорректного размера пакета или страницы.
+
+    Ожидаемый результат:
+    - Выбрасывается `ValueError`.
+    """
+    with pytest.raises(ValueError):
+        list(getattr(product_repo, method)(**kwargs))
@@ -0,0 +1,166 @@
+"""Тесты шардирования клиентов и заказов по ID клиента."""
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from warehouse_management.domain.models import Customer, Order, OrderLine, Product
+from warehouse_management.infrastructure.id_allocator import SequenceIdAllocator
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.infrastructure.orm import CustomerORM, OrderORM
+from warehouse_management.infrastructure.repositories import SqlAlchemyProductRepository
+from warehouse_management.infrastructure.sharding import (
+    jump_hash,
+    rebalance,
+    ShardedCustomerRepository,
+    ShardedOrderRepository,
+    ShardedUnitOfWork,
+    ShardSet,
+    sync_products,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+
+
+@pytest.fixture
+def make_engine(tmp_path: 'Path') -> 'Generator[Callable[[str], Engine]]':
+    """Создает движки файловых баз SQLite со схемой приложения."""
+    engines: list[Engine] = []
+
+    def make(name: str) -> 'Engine':
+        engine = create_engine(f'sqlite:///{tmp_path / name}.db')
+        upgrade(engine)
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.dispose()
+
+
+def _populate(primary: 'Engine', shards: ShardSet, customers_count: int) -> list[Customer]:
+    """Заполняет каталог товаров основной базы, копирует его на шарды и добавляет клиентов с заказами."""
+    with Session(primary) as session:
+        SqlAlchemyProductRepository(session).add_many(
+            [Product(id=None, name=f'Item {i}', quantity=100, price=float(i + 1)) for i in range(3)]
+        )
+        session.commit()
+        sync_products(session, shards)
+
+    allocator = SequenceIdAllocator(primary, block_size=10)
+    customer_repo = ShardedCustomerRepository(shards, allocator)
+    order_repo = ShardedOrderRepository(shards, allocator)
+    customers = [Customer(id=None, name=f'Customer {i}', birth_date=date(1990, 1, 1)) for i in range(customers_count)]
+    with ShardedUnitOfWork(shards):
+        for customer in customers:
+            customer_repo.add(customer)
+        order_repo.add_many(
+            [
+                Order(id=None, customer_id=customer.id, lines=[OrderLine(product_id=product_id, quantity=2)])
+                for customer in customers
+                for product_id in (1, 2)
+            ]
+        )
+    return customers
+
+
+@pytest.mark.unit
+def test_jump_hash__adding_bucket_moves_few_keys() -> None:
+    """Тест устойчивости jump consistent hash к добавлению корзины.
+
+    Ожидаемый результат:
+    - Ключи распределяются по всем корзинам.
+    - При переходе с 2 на 3 корзины ключи перемещаются только в новую корзину, примерно треть ключей.
+    """
+    keys = range(1, 3001)
+    before = [jump_hash(key, 2) for key in keys]
+    after = [jump_hash(key, 3) for key in keys]
+    moved = [(old, new) for old, new in zip(before, after, strict=True) if old != new]
+
+    assert set(after) == {0, 1, 2}
+    assert all(new == 2 for _, new in moved)  # noqa: PLR2004
+    assert 800 < len(moved) < 1200  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_sharded_repositories__routing_and_scatter_gather(make_engine: 'Callable[[str], Engine]') -> None:
+    """Тест шардированных репозиториев клиентов и заказов.
+
+    Ожидаемый результат:
+    - Клиент и его заказы хранятся на шарде, определенном по ID клиента.
+    - Списки и страницы объединяют шарды в порядке ID.
+    - Заказ находится по ID без указания клиента, стоимость заказов считается по всем шардам.
+    """
+    primary = make_engine('primary')
+    sessions = [Session(make_engine(f'shard{i}')) for i in range(3)]
+    shards = ShardSet(sessions)
+    customers = _populate(primary, shards, customers_count=12)
+    customer_repo = ShardedCustomerRepository(shards, SequenceIdAllocator(primary))
+    order_repo = ShardedOrderRepository(shards, SequenceIdAllocator(primary))
+
+    for customer in customers:
+        session = sessions[shards.shard_for(customer.id)]
+        assert session.get(CustomerORM, customer.id) is not None
+        assert session.scalar(select(func.count()).where(OrderORM.customer_id == customer.id)) == 2  # noqa: PLR2004
+    assert len({shards.shard_for(customer.id) for customer in customers}) == 3  # noqa: PLR2004
+
+    orders = order_repo.list()
+    assert [order.id for order in orders] == list(range(1, 25))
+    assert [customer.id for customer in customer_repo.page(after_id=4, limit=3)] == [5, 6, 7]
+    assert [order.id for order in order_repo.page(after_id=20, limit=10)] == [21, 22, 23, 24]
+
+    order = order_repo.get(7)
+    assert order is not None
+    assert order.customer_id == customers[3].id
+    assert order_repo.get(7, customer_id=customers[3].id) == order
+    assert order_repo.get(999) is None
+    assert customer_repo.existing_ids([1, 5, 999]) == {1, 5}
+    summary = customer_repo.summary(customers[0].id or 0)
+    assert (summary.order_count, summary.revenue) == (2, 2 * 1.0 + 2 * 2.0)
+
+    totals = [total for chunk in order_repo.iter_totals(batch_size=5) for total in chunk.items()]
+    assert [order_id for order_id, _ in totals] == list(range(1, 25))
+    assert order_repo.totals([1, 2, 24]) == {1: 2.0, 2: 4.0, 24: 4.0}
+    shards.close()
+
+
+@pytest.mark.integration
+def test_rebalance__moves_customers_to_new_shard(make_engine: 'Callable[[str], Engine]') -> None:
+    """Тест перераспределения клиентов после добавления шарда.
+
+    Ожидаемый результат:
+    - Клиенты, которым соответствует новый шард, перемещаются на него вместе с заказами.
+    - После перераспределения все данные доступны через шардированные репозитории.
+    - Повторный запуск ничего не перемещает.
+    """
+    primary = make_engine('primary')
+    engines = [make_engine('shard0'), make_engine('shard1')]
+    old_shards = ShardSet([Session(engine) for engine in engines])
+    customers = _populate(primary, old_shards, customers_count=30)
+    old_shards.close()
+
+    engines.append(make_engine('shard2'))
+    sessions = [Session(engine) for engine in engines]
+    shards = ShardSet(sessions)
+    report = rebalance(shards, batch_size=4)
+
+    moved = [customer for customer in customers if shards.shard_for(customer.id) == 2]  # noqa: PLR2004
+    assert (report.customers, report.orders) == (len(moved), 2 * len(moved))
+    assert sorted(sessions[2].scalars(select(CustomerORM.id)).all()) == [customer.id for customer in moved]
+    for index, session in enumerate(sessions):
+        assert all(
+            shards.shard_for(customer_id) == index for customer_id in session.scalars(select(OrderORM.customer_id))
+        )
+
+    order_repo = ShardedOrderRepository(shards, SequenceIdAllocator(primary))
+    assert len(order_repo.list()) == 2 * len(customers)
+    assert len(ShardedCustomerRepository(shards, SequenceIdAllocator(primary)).list()) == len(customers)
+    assert rebalance(shards).customers == 0
+    shards.close()
@@ -0,0 +1,205 @@
+"""Интеграционные тесты для Unit of Work с потоколокальными сессиями."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session
+
+from warehouse_management.domain.models import OrderLine, Product
+from warehouse_management.domain.services import WarehouseService
+from warehouse_management.infrastructure.cache import CachedProductRepository
+from warehouse_management.infrastructure.database import get_session_factory, ReplicaRouter
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.infrastructure.orm import ProductORM
+from warehouse_management.infrastructure.repositories import SqlAlchemyOrderRepository, SqlAlchemyProductRepository
+from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def file_engine(tmp_path: 'Path') -> 'Generator[Engine]':
+    """Создает движок для временного файла SQLite со схемой приложения."""
+    engine = create_engine(f'sqlite:///{tmp_path / "warehouse.db"}', connect_args={'check_same_thread': False})
+    upgrade(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.integration
+def test_unit_of_work__session_per_thread(file_engine: 'Engine') -> None:
+    """Тест работы общих репозиториев из пула потоков.
+
+    Ожидаемый результат:
+    - Каждый поток получает собственную сессию, все изменения фиксируются.
+    - После выхода из блока `with` сессия удаляется из реестра потока.
+    """
+    session = scoped_session(get_session_factory(file_engine))
+    repository = SqlAlchemyProductRepository(session)  # type: ignore[arg-type]
+    sessions: list[Session] = []
+
+    def create(index: int) -> None:
+        with SqlAlchemyUnitOfWork(session):
+            sessions.append(session())
+            repository.add(Product(id=None, name=f'Threaded {index}', quantity=index, price=1.0))
+        assert not session.registry.has()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(create, range(40)))
+
+    with SqlAlchemyUnitOfWork(session):
+        stored = repository.list()
+
+    assert sorted(product.name for product in stored) == sorted(f'Threaded {index}' for index in range(40))
+    assert len({id(s) for s in sessions}) > 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('expire_on_commit, expected_selects', [(False, 0), (True, 1)])
+def test_unit_of_work__expire_on_commit(file_engine: 'Engine', expire_on_commit: bool, expected_selects: int) -> None:
+    """Тест настройки `expire_on_commit`.
+
+    Ожидаемый результат:
+    - При отключенной настройке атрибуты объекта после commit() читаются без SELECT.
+    """
+    session = get_session_factory(file_engine, expire_on_commit=expire_on_commit)()
+    product = ProductORM(name='Committed', quantity=1, price=1.0)
+    with SqlAlchemyUnitOfWork(session):
+        session.add(product)
+
+    statements: list[str] = []
+    event.listen(file_engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    assert product.name == 'Committed'
+    session.close()
+
+    assert len(statements) == expected_selects
+
+
+@pytest.mark.integration
+def test_unit_of_work__concurrent_reservations(file_engine: 'Engine') -> None:
+    """Тест конкурентного резервирования одного товара из пула потоков.
+
+    Ожидаемый результат:
+    - Резерв получают ровно столько заказов, сколько единиц товара было на складе.
+    - Остаток не уходит в минус и не теряет обновлений.
+    """
+    session = scoped_session(get_session_factory(file_engine))
+    service = WarehouseService(SqlAlchemyProductRepository(session), SqlAlchemyOrderRepository(session))  # type: ignore[arg-type]
+    with SqlAlchemyUnitOfWork(session):
+        hot = service.create_product('Hot SKU', quantity=10, price=1.0)
+        cold = service.create_product('Cold SKU', quantity=100, price=1.0)
+
+    def checkout(_index: int) -> bool:
+        with SqlAlchemyUnitOfWork(session):
+            return service.reserve_stock([OrderLine(cold.id, 1), OrderLine(hot.id, 1)]).is_complete
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(checkout, range(25)))
+
+    with SqlAlchemyUnitOfWork(session):
+        assert hot.id is not None and cold.id is not None
+        quantities = [service.product_repo.get(hot.id).quantity, service.product_repo.get(cold.id).quantity]
+
+    assert results.count(True) == 10  # noqa: PLR2004
+    assert quantities == [0, 90]
+
+
+@pytest.mark.integration
+def test_unit_of_work__read_only_replica(file_engine: 'Engine', tmp_path: 'Path') -> None:
+    """Тест Unit of Work только для чтения с репликой во втором файле SQLite.
+
+    Ожидаемый результат:
+    - Блок только для чтения выполняет запросы тех же репозиториев на реплике.
+    - Flush изменений и commit() в блоке только для чтения запрещены.
+    - Обычный Unit of Work продолжает читать и писать в основную базу.
+    """
+    replica = create_engine(f'sqlite:///{tmp_path / "replica.db"}')
+    upgrade(replica)
+    with get_session_factory(replica)() as replica_session:
+        SqlAlchemyProductRepository(replica_session).add(Product(id=None, name='Replicated', quantity=1, price=1.0))
+        replica_session.commit()
+    session = scoped_session(get_session_factory(file_engine))
+    repository = SqlAlchemyProductRepository(session)  # type: ignore[arg-type]
+    read_only = SqlAlchemyUnitOfWork(session, read_only=True, replica_router=ReplicaRouter(file_engine, [replica]))
+
+    with read_only:
+        replica_names = [product.name for product in repository.list()]
+        with pytest.raises(RuntimeError, match='cannot write'):
+            repository.add(Product(id=None, name='Lost', quantity=1, price=1.0))
+    with pytest.raises(RuntimeError, match='cannot commit'), read_only:
+        read_only.commit()
+    with SqlAlchemyUnitOfWork(session):
+        repository.add(Product(id=None, name='Primary', quantity=1, price=1.0))
+    with SqlAlchemyUnitOfWork(session):
+        primary_names = [product.name for product in repository.list()]
+    replica.dispose()
+
+    assert replica_names == ['Replicated']
+    assert primary_names == ['Primary']
+
+
+@pytest.mark.integration
+def test_unit_of_work__read_only_after_plain_read(file_engine: 'Engine', tmp_path: 'Path') -> None:
+    """Тест Unit of Work только для чтения после чтения вне Unit of Work.
+
+    Ожидаемый результат:
+    - Сессия потока, в которой выполнялось только чтение, закрывается, и блок читает реплику.
+    - Если в сессии потока есть незафиксированная запись, блок только для чтения не начинается.
+    """
+    replica = create_engine(f'sqlite:///{tmp_path / "replica.db"}')
+    upgrade(replica)
+    with get_session_factory(replica)() as replica_session:
+        SqlAlchemyProductRepository(replica_session).add(Product(id=None, name='Replicated', quantity=1, price=1.0))
+        replica_session.commit()
+    session = scoped_session(get_session_factory(file_engine))
+    repository = SqlAlchemyProductRepository(session)  # type: ignore[arg-type]
+    router = ReplicaRouter(file_engine, [replica])
+
+    assert repository.list() == []
+    with SqlAlchemyUnitOfWork(session, read_only=True, replica_router=router):
+        replica_names = [product.name for product in repository.list()]
+    repository.add(Product(id=None, name='Unsaved', quantity=1, price=1.0))
+    with (
+        pytest.raises(RuntimeError, match='uncommitted changes'),
+        SqlAlchemyUnitOfWork(session, read_only=True, replica_router=router),
+    ):
+        pass
+    session.remove()
+    replica.dispose()
+
+    assert replica_names == ['Replicated']
+
+
+@pytest.mark.integration
+def test_unit_of_work__read_only_replica_does_not_populate_cache(file_engine: 'Engine', tmp_path: 'Path') -> None:
+    """Тест кэша товаров при чтении с отстающей реплики.
+
+    Ожидаемый результат:
+    - Товар, прочитанный с реплики, не сохраняется в кэш.
+    - Следующее чтение из основной базы возвращает зафиксированный остаток, а не значение реплики.
+    """
+    replica = create_engine(f'sqlite:///{tmp_path / "replica.db"}')
+    upgrade(replica)
+    for engine in (file_engine, replica):
+        with get_session_factory(engine)() as setup_session:
+            SqlAlchemyProductRepository(setup_session).add(Product(id=None, name='Item', quantity=10, price=1.0))
+            setup_session.commit()
+    session = scoped_session(get_session_factory(file_engine))
+    cache = CachedProductRepository(SqlAlchemyProductRepository(session), session=session)  # type: ignore[arg-type]
+
+    with SqlAlchemyUnitOfWork(session, product_cache=cache):
+        cache.reserve({1: 3})
+    with SqlAlchemyUnitOfWork(session, read_only=True, replica_router=ReplicaRouter(file_engine, [replica])):
+        replica_quantity = cache.get(1).quantity
+    with SqlAlchemyUnitOfWork(session, product_cache=cache):
+        primary_quantity = cache.get(1).quantity
+    replica.dispose()
+
+    assert (replica_quantity, primary_quantity) == (10, 7)
@@ -1,13 +1,21 @@
 """End-to-End тесты для всего приложения."""
 
+from datetime import date
 from typing import TYPE_CHECKING
 
 import pytest
 
+from warehouse_management.application import customer_service as customer_service_module
+from warehouse_management.application.customer_service import CustomerService
+from warehouse_management.domain.models import Order, OrderLine
 from warehouse_management.domain.services import WarehouseService
 
 if TYPE_CHECKING:
-    from warehouse_management.infrastructure.repositories import SqlAlchemyOrderRepository, SqlAlchemyProductRepository
+    from warehouse_management.infrastructure.repositories import (
+        SqlAlchemyCustomerRepository,
+        SqlAlchemyOrderRepository,
+        SqlAlchemyProductRepository,
+    )
 
 
 @pytest.fixture
@@ -70,3 +78,100 @@ def test_create_order__e2e(warehouse_service: 'WarehouseService') -> None:
     assert len(order.products) == expected_product_count, f'Order должен содержать {expected_product_count} продукта'
     assert order.products[0].name == 'E2E Product 1'
     assert order.products[1].name == 'E2E Product 2'
+
+
+@pytest.mark.e2e
+def test_get_customer_summary__e2e(
+    warehouse_service: 'WarehouseService',
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+) -> None:
+    """Тест получения сводки по клиенту с постраничным списком заказов.
+
+    Ожидаемый результат:
+    - Количество заказов и выручка учитывают все заказы клиента.
+    - Заказы отдаются страницами от новых к старым по курсору `next_cursor`.
+    """
+    customer_service = CustomerService(customer_repo, order_repo)
+    customer = customer_service.register_customer('E2E Customer', date(1990, 5, 17))
+    product = warehouse_service.create_product(name='E2E Cable', quantity=100, price=2.5)
+    orders = [Order(id=None, customer_id=customer.id, lines=[OrderLine(product.id, n)]) for n in range(1, 6)]
+    order_repo.add_many(orders)
+    assert customer.id is not None
+
+    pages = [customer_service.get_customer_summary(customer.id, orders_limit=2)]
+    while pages[-1]['next_cursor'] is not None:
+        pages.append(
+            customer_service.get_customer_summary(customer.id, orders_limit=2, before_id=pages[-1]['next_cursor'])
+        )
+
+    assert pages[0]['name'] == 'E2E Customer'
+    assert (pages[0]['order_count'], pages[0]['revenue']) == (5, 37.5)
+    assert [[order['total_price'] for order in page['orders']] for page in pages] == [[12.5, 10.0], [7.5, 5.0], [2.5]]
+
+
+@pytest.mark.e2e
+def test_create_customer_order__e2e(
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    executed_statements: list[str],
+) -> None:
+    """Тест оформления заказа клиентом с длинной историей заказов.
+
+    Ожидаемый результат:
+    - Существование клиента проверяется одним запросом, заказы клиента не читаются.
+    - Заказ для отсутствующего клиента отклоняется с `ValueError`.
+    """
+    customer_service = CustomerService(customer_repo, order_repo)
+    customer = customer_service.register_customer('E2E Wholesaler', date(1980, 1, 1))
+    assert customer.id is not None
+    order_repo.add_many([Order(id=None, customer_id=customer.id) for _ in range(50)])
+    executed_statements.clear()
+
+    order = customer_service.create_order(customer.id, order_id=1000, product='E2E Pallet', quantity=1, price=10.0)
+
+    selects = [statement for statement in executed_statements if statement.lstrip().upper().startswith('SELECT')]
+    assert order.customer_id == customer.id
+    assert len(selects) == 1
+    assert 'orders' not in selects[0]
+    with pytest.raises(ValueError, match='не найден'):
+        customer_service.create_order(404, order_id=1001, product='E2E Pallet', quantity=1, price=10.0)
+
+
+@pytest.mark.e2e
+def test_get_customer_info__e2e(
+    warehouse_service: 'WarehouseService',
+    customer_repo: 'SqlAlchemyCustomerRepository',
+    order_repo: 'SqlAlchemyOrderRepository',
+    executed_statements: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Тест получения информации о клиенте со всеми заказами.
+
+    Ожидаемый результат:
+    - Каждый заказ содержит прежние ключи `id`, `product`, `quantity`, `price` и `total_price`.
+    - Заказы со всех страниц сводки возвращаются в порядке возрастания ID.
+    - Стоимость заказа считается в базе, строки заказов и товары не загружаются.
+    - Для отсутствующего клиента выбрасывается `ValueError`.
+    """
+    monkeypatch.setattr(customer_service_module, '_ORDERS_PAGE_SIZE', 2)
+    customer_service = CustomerService(customer_repo, order_repo)
+    customer = customer_service.register_customer('E2E Customer', date(1990, 5, 17))
+    product = warehouse_service.create_product(name='E2E Cable', quantity=100, price=2.5)
+    order_repo.add_many(
+        [Order(id=None, customer_id=customer.id, lines=[OrderLine(product.id, quantity)]) for quantity in (4, 1, 2)]
+    )
+    assert customer.id is not None
+    executed_statements.clear()
+
+    info = customer_service.get_customer_info(customer.id)
+
+    assert info['name'] == 'E2E Customer'
+    assert info['orders'] == [
+        {'id': 1, 'product': None, 'quantity': None, 'price': None, 'total_price': 10.0},
+        {'id': 2, 'product': None, 'quantity': None, 'price': None, 'total_price': 2.5},
+        {'id': 3, 'product': None, 'quantity': None, 'price': None, 'total_price': 5.0},
+    ]
+    assert not any('products' in statement for statement in executed_statements)
+    with pytest.raises(ValueError, match='не найден'):
+        customer_service.get_customer_info(404)
@@ -1,14 +1,18 @@
 """Сервис для управления клиентами и их заказами."""
 
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
+from warehouse_management.domain.exceptions import NotFoundError
 from warehouse_management.domain.models import Customer, Order
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import date
 
     from warehouse_management.domain.repositories import CustomerRepository, OrderRepository
 
+_ORDERS_PAGE_SIZE = 1000
+
 
 class CustomerService:
     """Обрабатывает бизнес-логику управления клиентами."""
@@ -37,9 +41,22 @@ class CustomerService:
         self.customer_repo.add(new_customer)
         return new_customer
 
+    def existing_customer_ids(self, customer_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает ID существующих клиентов одним запросом к репозиторию.
+
+        Args:
+            customer_ids: Проверяемые идентификаторы клиентов.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        return self.customer_repo.existing_ids(customer_ids)
+
     def create_order(self, customer_id: int, order_id: int, product: str, quantity: int, price: float) -> Order:
         """Создаёт заказ для существующего клиента.
 
+        Существование клиента проверяется запросом по первичному ключу, без загрузки его заказов.
+
         Args:
             customer_id: ID клиента, оформляющего заказ.
             order_id: ID заказа.
@@ -53,8 +70,7 @@ class CustomerService:
         Raises:
             ValueError: Если клиент не найден.
         """
-        customer = self.customer_repo.get(customer_id)
-        if not customer:
+        if not self.customer_repo.exists(customer_id):
             raise ValueError(f'Клиент с ID {customer_id} не найден')
 
         new_order = Order(
@@ -64,39 +80,86 @@ class CustomerService:
             quantity=quantity,
             price=price,
         )
-        customer.place_order(new_order)
         self.order_repo.add(new_order)
 
         return new_order
 
-    def get_customer_info(self, customer_id: int) -> dict:
-        """Возвращает информацию о клиенте.
+    def get_customer_info(self, customer_id: int) -> dict[str, Any]:
+        """Возвращает информацию о клиенте и всех его заказах.
+
+        Строится на той же сводке `CustomerRepository.summary()`, что и `get_customer_summary()`:
+        стоимость заказов считается в базе данных, а страницы заказов читаются по курсору
+        без загрузки строк и товаров.
 
         Args:
             customer_id: ID клиента.
 
         Returns:
-            Словарь с информацией о клиенте и его заказах.
+            Словарь с информацией о клиенте и его заказах в порядке возрастания ID.
 
         Raises:
             ValueError: Если клиент не найден.
         """
-        customer = self.customer_repo.get(customer_id)
-        if not customer:
-            raise ValueError(f'Клиент с ID {customer_id} не найден')
+        try:
+            summary = self.customer_repo.summary(customer_id, orders_limit=_ORDERS_PAGE_SIZE)
+        except NotFoundError:
+            raise ValueError(f'Клиент с ID {customer_id} не найден') from None
+        order_totals = dict(summary.recent_orders)
+        while summary.next_cursor is not None:
+            summary = self.customer_repo.summary(
+                customer_id, orders_limit=_ORDERS_PAGE_SIZE, before_id=summary.next_cursor
+            )
+            order_totals.update(summary.recent_orders)
+        customer = summary.customer
 
         return {
             'id': customer.id,
             'name': customer.name,
             'age': customer.get_age(),
+            # Сохраненные заказы состоят из строк, поля одиночного товара у них не заполняются.
             'orders': [
                 {
-                    'id': order.id,
-                    'product': order.product,
-                    'quantity': order.quantity,
-                    'price': order.price,
-                    'total_price': order.get_total_price(),
+                    'id': order_id,
+                    'product': None,
+                    'quantity': None,
+                    'price': None,
+                    'total_price': order_totals[order_id],
                 }
-                for order in customer.orders
+                for order_id in sorted(order_totals)
+            ],
+        }
+
+    def get_customer_summary(
+        self, customer_id: int, orders_limit: int = 20, before_id: int | None = None
+    ) -> dict[str, Any]:
+        """Возвращает сводку по клиенту и страницу его последних заказов.
+
+        Количество заказов и выручка считаются в базе данных, а заказы читаются
+        постранично от новых к старым, поэтому время ответа не зависит от длины
+        истории заказов клиента.
+
+        Args:
+            customer_id: ID клиента.
+            orders_limit: Количество заказов на странице.
+            before_id: Курсор `next_cursor` предыдущей страницы или None для первой страницы.
+
+        Returns:
+            Словарь с информацией о клиенте, агрегатами по заказам и страницей заказов `{id, total_price}`.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        summary = self.customer_repo.summary(customer_id, orders_limit=orders_limit, before_id=before_id)
+        customer = summary.customer
+
+        return {
+            'id': customer.id,
+            'name': customer.name,
+            'age': customer.get_age(),
+            'order_count': summary.order_count,
+            'revenue': summary.revenue,
+            'orders': [
+                {'id': order_id, 'total_price': total_price} for order_id, total_price in summary.recent_orders.items()
             ],
+            'next_cursor': summary.next_cursor,
         }
@@ -0,0 +1,378 @@
+"""Потоковый импорт заказов из файлов CSV и JSONL.
+
+Каждая запись файла описывает строку заказа: `order_ref` (ключ заказа во внешней
+системе), `customer_id` (может быть пустым), `product_id`, `quantity` и необязательную
+`unit_price`; без цены фиксируется текущая цена товара. Записи одного заказа должны
+идти подряд.
+
+Файл читается построчно, заказы накапливаются пакетами по `chunk_size`, товары и
+клиенты пакета проверяются одним запросом на каждый тип, после чего пакет
+сохраняется в отдельной транзакции. Число обработанных записей (контрольная точка)
+сохраняется в таблице `import_progress` в той же транзакции, что и заказы пакета,
+поэтому прерванный импорт продолжается с первого незафиксированного пакета, а
+зафиксированные пакеты не импортируются повторно.
+
+Записи, которые не удалось разобрать (некорректный JSON, значение не JSON-объект,
+ошибка CSV), пропускаются по одной и учитываются в `ImportReport.malformed_rows`;
+они не останавливают импорт и не блокируют его продолжение.
+
+Запуск:
+
+    python -m warehouse_management.application.order_import orders.csv --checkpoint partner-orders
+"""
+
+import argparse
+import csv
+import json
+import logging
+import time
+from dataclasses import dataclass
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Any, cast, TYPE_CHECKING
+
+from warehouse_management.domain.models import Order, OrderLine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from warehouse_management.application.customer_service import CustomerService
+    from warehouse_management.domain.repositories import ImportProgressRepository
+    from warehouse_management.domain.services import WarehouseService
+    from warehouse_management.domain.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+
+
+@dataclass
+class ImportReport:
+    """Итоги импорта.
+
+    Attributes:
+        rows: Количество записей, обработанных в этом запуске.
+        orders: Количество сохраненных заказов.
+        failed_orders: Количество заказов, пропущенных из-за ошибок.
+        failed_rows: Количество записей в пропущенных заказах.
+        malformed_rows: Количество записей, которые не удалось разобрать.
+        offset: Количество записей файла, обработанных с учетом предыдущих запусков.
+        elapsed_s: Время выполнения, секунд.
+    """
+
+    rows: int = 0
+    orders: int = 0
+    failed_orders: int = 0
+    failed_rows: int = 0
+    malformed_rows: int = 0
+    offset: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Возвращает скорость обработки записей в секунду."""
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+@dataclass(eq=False)
+class InvalidRecord:
+    """Запись файла, которую не удалось разобрать.
+
+    Attributes:
+        error: Описание ошибки.
+    """
+
+    error: str
+
+
+def read_records(path: Path, import_format: str) -> 'Iterator[dict[str, Any] | InvalidRecord]':
+    """Построчно читает записи из файла CSV (с заголовком) или JSONL.
+
+    Args:
+        path: Путь к файлу.
+        import_format: Формат файла: `csv` или `jsonl`.
+
+    Yields:
+        Записи в виде словарей или `InvalidRecord` для записей, которые не удалось разобрать;
+        пустые строки JSONL пропускаются.
+
+    Raises:
+        ValueError: Если формат не поддерживается.
+    """
+    if import_format not in IMPORT_FORMATS:
+        raise ValueError(f'Unsupported import format: {import_format}')
+
+    with path.open(encoding='utf-8', newline='') as file:
+        if import_format == 'csv':
+            reader = csv.DictReader(file)
+            while True:
+                try:
+                    yield next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as error:
+                    yield InvalidRecord(f'некорректная строка CSV: {error}')
+        else:
+            for line in file:
+                if line.strip():
+                    yield _parse_json_record(line)
+
+
+class OrderImporter:
+    """Импортирует заказы пакетами в отдельных транзакциях с контрольной точкой."""
+
+    def __init__(
+        self,
+        unit_of_work: 'UnitOfWork',
+        warehouse_service: 'WarehouseService',
+        customer_service: 'CustomerService',
+        chunk_size: int = 1000,
+        progress_repo: 'ImportProgressRepository | None' = None,
+        checkpoint: str | None = None,
+    ) -> None:
+        """Инициализирует импорт.
+
+        Args:
+            unit_of_work: Unit of Work, в котором сохраняется каждый пакет заказов.
+            warehouse_service: Сервис склада для проверки товаров и создания заказов.
+            customer_service: Сервис клиентов для проверки клиентов.
+            chunk_size: Количество заказов в одной транзакции.
+            progress_repo: Репозиторий, в котором контрольная точка сохраняется вместе с пакетом.
+            checkpoint: Ключ контрольной точки источника или None, чтобы не сохранять прогресс.
+
+        Raises:
+            ValueError: Если `chunk_size` меньше 1 или ключ контрольной точки задан без репозитория.
+        """
+        if chunk_size < 1:
+            raise ValueError('Размер пакета должен быть положительным')
+        if checkpoint is not None and progress_repo is None:
+            raise ValueError('Для контрольной точки нужен репозиторий прогресса импорта')
+
+        self.unit_of_work = unit_of_work
+        self.warehouse_service = warehouse_service
+        self.customer_service = customer_service
+        self.chunk_size = chunk_size
+        self.progress_repo = progress_repo
+        self.checkpoint = checkpoint
+
+    def run(self, records: 'Iterable[dict[str, Any] | InvalidRecord]') -> ImportReport:
+        """Импортирует записи, пропуская уже обработанные по контрольной точке.
+
+        Заказ с некорректной записью, отсутствующим товаром или клиентом пропускается
+        целиком и записывается в журнал; остальные заказы пакета сохраняются.
+        Неразобранная запись (`InvalidRecord`) пропускается отдельно от соседних.
+
+        Args:
+            records: Записи строк заказов в порядке файла.
+
+        Returns:
+            Итоги импорта.
+        """
+        started = time.perf_counter()
+        report = ImportReport(offset=self._load_checkpoint())
+        groups = groupby(islice(records, report.offset, None), key=_order_key)
+        orders = (list(lines) for _order_ref, lines in groups)
+
+        while chunk := list(islice(orders, self.chunk_size)):
+            self._import_chunk(chunk, report)
+            report.elapsed_s = time.perf_counter() - started
+            logger.info(
+                'Imported %d orders, skipped %d, offset %d, %.0f rows/s',
+                report.orders,
+                report.failed_orders,
+                report.offset,
+                report.rows_per_second,
+            )
+
+        report.elapsed_s = time.perf_counter() - started
+        return report
+
+    def _import_chunk(self, chunk: 'Sequence[list[dict[str, Any] | InvalidRecord]]', report: ImportReport) -> None:
+        """Проверяет и сохраняет пакет заказов и контрольную точку в одной транзакции.
+
+        Args:
+            chunk: Записи заказов пакета, сгруппированные по заказам.
+            report: Итоги импорта, обновляемые по результатам пакета.
+        """
+        first_record = report.offset + 1
+        parsed: list[tuple[int, Order | InvalidRecord | str]] = []
+        for records in chunk:
+            head = records[0]
+            if isinstance(head, InvalidRecord):
+                parsed.append((first_record, head))
+            else:
+                parsed.append((first_record, _parse_order(cast('list[dict[str, Any]]', records))))
+            first_record += len(records)
+
+        with self.unit_of_work:
+            orders = [order for _record, order in parsed if isinstance(order, Order)]
+            product_ids = self.warehouse_service.existing_product_ids(
+                line.product_id for order in orders for line in order.lines if line.product_id is not None
+            )
+            customer_ids = self.customer_service.existing_customer_ids(
+                order.customer_id for order in orders if order.customer_id is not None
+            )
+
+            valid: list[Order] = []
+            for (record, order), records in zip(parsed, chunk, strict=True):
+                if isinstance(order, InvalidRecord):
+                    logger.warning('Skipping malformed record %d: %s', record, order.error)
+                    report.malformed_rows += 1
+                    continue
+                if isinstance(order, str):
+                    error: str | None = order
+                else:
+                    error = _missing_references(order, product_ids, customer_ids)
+                    if error is None:
+                        valid.append(order)
+                        continue
+                logger.warning('Skipping order %r at record %d: %s', _order_key(records[0]), record, error)
+                report.failed_orders += 1
+                report.failed_rows += len(records)
+            self.warehouse_service.create_orders(valid)
+            rows = sum(len(records) for records in chunk)
+            if self.progress_repo is not None and self.checkpoint is not None:
+                self.progress_repo.save_offset(self.checkpoint, report.offset + rows)
+
+        report.rows += rows
+        report.offset += rows
+        report.orders += len(valid)
+
+    def _load_checkpoint(self) -> int:
+        """Возвращает число записей, обработанных предыдущими запусками."""
+        if self.progress_repo is None or self.checkpoint is None:
+            return 0
+        with self.unit_of_work:
+            return self.progress_repo.get_offset(self.checkpoint)
+
+
+def _parse_json_record(line: str) -> 'dict[str, Any] | InvalidRecord':
+    """Разбирает строку JSONL.
+
+    Args:
+        line: Непустая строка файла.
+
+    Returns:
+        Запись или `InvalidRecord`, если строка не является JSON-объектом.
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as error:
+        return InvalidRecord(f'некорректный JSON: {error}')
+    if not isinstance(record, dict):
+        return InvalidRecord(f'ожидался JSON-объект, получено {type(record).__name__}')
+    return record
+
+
+def _order_key(record: 'dict[str, Any] | InvalidRecord') -> object:
+    """Возвращает ключ группировки записей по заказам.
+
+    Каждая неразобранная запись образует отдельную группу.
+
+    Args:
+        record: Запись файла.
+
+    Returns:
+        `order_ref` записи или сама неразобранная запись.
+    """
+    return record if isinstance(record, InvalidRecord) else record.get('order_ref')
+
+
+def _parse_order(records: 'Sequence[dict[str, Any]]') -> Order | str:
+    """Преобразует записи одного заказа в доменную модель.
+
+    Args:
+        records: Записи строк заказа.
+
+    Returns:
+        Заказ или описание ошибки первой некорректной записи.
+    """
+    customer_id = records[0].get('customer_id', '')
+    lines = []
+    try:
+        for record in records:
+            quantity = int(record['quantity'])
+            if quantity < 1:
+                raise ValueError('количество должно быть положительным')
+            unit_price = record.get('unit_price', '')
+            lines.append(
+                OrderLine(
+                    product_id=int(record['product_id']),
+                    quantity=quantity,
+                    unit_price=float(unit_price) if unit_price not in (None, '') else None,
+                )
+            )
+        return Order(id=None, customer_id=int(customer_id) if customer_id not in (None, '') else None, lines=lines)
+    except KeyError as error:
+        return f'отсутствует поле {error}'
+    except (TypeError, ValueError) as error:
+        return str(error)
+
+
+def _missing_references(order: Order, product_ids: set[int], customer_ids: set[int]) -> str | None:
+    """Проверяет, что товары и клиент заказа существуют.
+
+    Args:
+        order: Заказ.
+        product_ids: ID существующих товаров пакета.
+        customer_ids: ID существующих клиентов пакета.
+
+    Returns:
+        Описание ошибки или None, если все ссылки найдены.
+    """
+    if order.customer_id is not None and order.customer_id not in customer_ids:
+        return f'клиент с ID {order.customer_id} не найден'
+    missing = sorted({line.product_id for line in order.lines if line.product_id is not None} - product_ids)
+    if missing:
+        return f'товары с ID {missing} не найдены'
+    return None
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Разбирает аргументы командной строки и импортирует заказы в базу из настроек приложения.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из `sys.argv`.
+    """
+    from warehouse_management.application.customer_service import CustomerService
+    from warehouse_management.container import AppContainer
+    from warehouse_management.domain.services import WarehouseService
+    from warehouse_management.infrastructure.database import init_db
+    from warehouse_management.settings import Settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('path', type=Path, help='файл заказов')
+    parser.add_argument('--format', choices=IMPORT_FORMATS, help='формат файла (по умолчанию по расширению)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='заказов в одной транзакции')
+    parser.add_argument('--checkpoint', help='ключ контрольной точки в базе для продолжения импорта')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    container = AppContainer()
+    container.config.from_pydantic(Settings())
+    init_db(container.database_settings())
+
+    importer = OrderImporter(
+        container.unit_of_work(),
+        WarehouseService(container.product_repository(), container.order_repository()),
+        CustomerService(container.customer_repository(), container.order_repository()),
+        chunk_size=args.chunk_size,
+        progress_repo=container.import_progress_repository(),
+        checkpoint=args.checkpoint,
+    )
+    import_format = args.format or args.path.suffix.lstrip('.').lower()
+    report = importer.run(read_records(args.path, import_format))
+    logger.info(
+        'Done: %d rows, %d orders imported, %d orders (%d rows) skipped, %d malformed rows, %.1f s, %.0f rows/s',
+        report.rows,
+        report.orders,
+        report.failed_orders,
+        report.failed_rows,
+        report.malformed_rows,
+        report.elapsed_s,
+        report.rows_per_second,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -4,24 +4,214 @@
 в различных частях приложения.
 """
 
+from typing import TYPE_CHECKING, TypeVar
+
 from dependency_injector import containers, providers
+from sqlalchemy.orm import scoped_session
 
-from warehouse_management.infrastructure.database import SessionFactory
-from warehouse_management.infrastructure.repositories import SqlAlchemyOrderRepository, SqlAlchemyProductRepository
+from warehouse_management.infrastructure.async_database import get_async_engine, get_async_session_factory
+from warehouse_management.infrastructure.async_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from warehouse_management.infrastructure.cache import CachedProductRepository
+from warehouse_management.infrastructure.database import get_engine, get_replica_router, get_session_factory
+from warehouse_management.infrastructure.group_commit import GroupCommitUnitOfWork
+from warehouse_management.infrastructure.id_allocator import SequenceIdAllocator
+from warehouse_management.infrastructure.instrumentation import SqlInstrumentation
+from warehouse_management.infrastructure.repositories import (
+    SqlAlchemyCustomerRepository,
+    SqlAlchemyImportProgressRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyProductRepository,
+)
+from warehouse_management.infrastructure.sharding import (
+    create_shard_set,
+    ShardedCustomerRepository,
+    ShardedOrderRepository,
+    ShardedUnitOfWork,
+)
 from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+from warehouse_management.settings import DatabaseSettings
+
+if TYPE_CHECKING:
+    from warehouse_management.domain.repositories import ProductRepository
+
+
+_T = TypeVar('_T')
+
+
+def _provide_if_enabled(enabled: bool, provider: 'providers.Provider[_T]') -> '_T | None':
+    """Возвращает компонент, если он включен в настройках.
+
+    Args:
+        enabled: Флаг `enabled` соответствующего раздела конфигурации.
+        provider: Провайдер компонента.
+
+    Returns:
+        Экземпляр компонента или None.
+    """
+    return provider() if enabled else None
+
+
+def _select_product_repository(
+    cache: 'CachedProductRepository | None', repository: 'ProductRepository'
+) -> 'ProductRepository':
+    """Выбирает кэширующий репозиторий товаров, если кэш включен.
+
+    Args:
+        cache: Кэш товаров или None.
+        repository: Репозиторий товаров без кэша.
+
+    Returns:
+        Репозиторий товаров для использования в сервисах.
+    """
+    return cache if cache is not None else repository
 
 
 class AppContainer(containers.DeclarativeContainer):
     """Контейнер инъекции зависимостей для управления компонентами приложения.
 
     Этот контейнер управляет созданием сессий БД, репозиториев и Unit of Work.
+
+    Синхронные репозитории привязаны к потоколокальному реестру сессий `scoped_session`,
+    а Unit of Work создается отдельно для каждого потока: каждый блок `with` работает
+    с новой сессией своего потока, поэтому сервисы можно вызывать из пула потоков.
+    Блок `with read_only_unit_of_work()` направляет запросы тех же репозиториев на реплику.
+    При включенном шардировании клиенты и заказы доступны через `sharded_*_repository`
+    в блоке `with sharded_unit_of_work()`.
     """
 
     config = providers.Configuration()
 
-    session = providers.Singleton(SessionFactory)
+    database_settings = providers.Singleton(DatabaseSettings.model_validate, config.database)
+
+    engine = providers.Singleton(get_engine, settings=database_settings)
+    session_factory = providers.Singleton(
+        get_session_factory,
+        engine=engine,
+        expire_on_commit=database_settings.provided.expire_on_commit,
+    )
+    session = providers.Singleton(scoped_session, session_factory)
+    replica_router = providers.Singleton(get_replica_router, primary=engine, settings=database_settings)
+
+    id_allocator = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.id_allocation.enabled,
+        provider=providers.Singleton(
+            SequenceIdAllocator, engine=engine, block_size=config.id_allocation.block_size
+        ).provider,
+    )
+
+    sql_product_repository = providers.Singleton(
+        SqlAlchemyProductRepository,
+        session=session,
+        core_reads=database_settings.provided.core_reads,
+        id_allocator=id_allocator,
+    )
+    product_cache = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.product_cache.enabled,
+        provider=providers.Singleton(
+            CachedProductRepository,
+            repository=sql_product_repository,
+            max_size=config.product_cache.max_size,
+            ttl_seconds=config.product_cache.ttl_seconds,
+            session=session,
+        ).provider,
+    )
+    product_repository = providers.Singleton(
+        _select_product_repository, cache=product_cache, repository=sql_product_repository
+    )
+    order_repository = providers.Singleton(
+        SqlAlchemyOrderRepository, session=session, core_reads=database_settings.provided.core_reads
+    )
+    customer_repository = providers.Singleton(
+        SqlAlchemyCustomerRepository,
+        session=session,
+        core_reads=database_settings.provided.core_reads,
+        id_allocator=id_allocator,
+    )
+    import_progress_repository = providers.Singleton(SqlAlchemyImportProgressRepository, session=session)
+
+    sql_instrumentation = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.sql_instrumentation.enabled,
+        provider=providers.Singleton(
+            SqlInstrumentation,
+            engine=engine,
+            slow_query_threshold_ms=config.sql_instrumentation.slow_query_threshold_ms,
+            n_plus_one_threshold=config.sql_instrumentation.n_plus_one_threshold,
+        ).provider,
+    )
+
+    unit_of_work: providers.ThreadLocalSingleton[SqlAlchemyUnitOfWork] = providers.ThreadLocalSingleton(
+        SqlAlchemyUnitOfWork, session=session, product_cache=product_cache, instrumentation=sql_instrumentation
+    )
+    read_only_unit_of_work: providers.ThreadLocalSingleton[SqlAlchemyUnitOfWork] = providers.ThreadLocalSingleton(
+        SqlAlchemyUnitOfWork,
+        session=session,
+        instrumentation=sql_instrumentation,
+        read_only=True,
+        replica_router=replica_router,
+    )
+    group_commit_unit_of_work = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.group_commit.enabled,
+        provider=providers.Singleton(
+            GroupCommitUnitOfWork,
+            session_factory=session_factory,
+            max_batch_size=config.group_commit.max_batch_size,
+            max_delay_ms=config.group_commit.max_delay_ms,
+            product_cache=product_cache,
+            instrumentation=sql_instrumentation,
+        ).provider,
+    )
+
+    shard_set = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.sharding.enabled,
+        provider=providers.Singleton(
+            create_shard_set, settings=database_settings, shard_urls=config.sharding.shard_urls
+        ).provider,
+    )
+    # ID клиентов и заказов шардов уникальны глобально, поэтому назначаются из основной базы.
+    shard_id_allocator = providers.Singleton(
+        SequenceIdAllocator, engine=engine, block_size=config.id_allocation.block_size
+    )
+    sharded_order_repository = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.sharding.enabled,
+        provider=providers.Singleton(
+            ShardedOrderRepository,
+            shards=shard_set,
+            id_allocator=shard_id_allocator,
+            core_reads=database_settings.provided.core_reads,
+        ).provider,
+    )
+    sharded_customer_repository = providers.Singleton(
+        _provide_if_enabled,
+        enabled=config.sharding.enabled,
+        provider=providers.Singleton(
+            ShardedCustomerRepository,
+            shards=shard_set,
+            id_allocator=shard_id_allocator,
+            core_reads=database_settings.provided.core_reads,
+        ).provider,
+    )
+    sharded_unit_of_work = providers.ThreadLocalSingleton(
+        _provide_if_enabled,
+        enabled=config.sharding.enabled,
+        provider=providers.Factory(ShardedUnitOfWork, shards=shard_set).provider,
+    )
 
-    product_repository = providers.Singleton(SqlAlchemyProductRepository, session=session)
-    order_repository = providers.Singleton(SqlAlchemyOrderRepository, session=session)
+    async_engine = providers.Singleton(get_async_engine, settings=database_settings)
+    async_session_factory = providers.Singleton(
+        get_async_session_factory,
+        engine=async_engine,
+        expire_on_commit=database_settings.provided.expire_on_commit,
+    )
 
-    unit_of_work: providers.Singleton[SqlAlchemyUnitOfWork] = providers.Singleton(SqlAlchemyUnitOfWork, session=session)
+    async_unit_of_work = providers.Factory(
+        AsyncSqlAlchemyUnitOfWork,
+        session_factory=async_session_factory,
+        product_cache=product_cache,
+        core_reads=database_settings.provided.core_reads,
+    )
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Модель товара в системе управления складом.
 
@@ -21,7 +21,30 @@ class Product:
     price: float
 
 
-@dataclass
+@dataclass(slots=True)
+class OrderLine:
+    """Строка заказа: заказанное количество товара и цена, зафиксированная при оформлении.
+
+    Attributes:
+        product_id: Идентификатор товара.
+        quantity: Заказанное количество единиц товара.
+        unit_price: Цена за единицу на момент заказа (None — взять текущую цену товара при сохранении).
+    """
+
+    product_id: int | None
+    quantity: int = 1
+    unit_price: float | None = None
+
+    def get_total_price(self) -> float:
+        """Возвращает стоимость строки заказа.
+
+        Returns:
+            Произведение количества на цену за единицу (0.0, если цена еще не зафиксирована).
+        """
+        return self.quantity * (self.unit_price or 0.0)
+
+
+@dataclass(slots=True)
 class Order:
     """Модель заказа, содержащая список товаров или единичный товар.
 
@@ -32,6 +55,8 @@ class Order:
         quantity: Количество единиц товара в заказе.
         price: Цена товара.
         products: Список товаров (если заказ содержит несколько товаров).
+        lines: Строки заказа с заказанным количеством и ценой; если не заданы,
+            каждый товар из `products` сохраняется в количестве одной единицы.
     """
 
     id: int | None
@@ -40,23 +65,33 @@ class Order:
     quantity: int | None = None
     price: float | None = None
     products: list[Product] = field(default_factory=list)
+    lines: list[OrderLine] = field(default_factory=list)
 
-    def add_product(self, product: Product) -> None:
+    def add_product(self, product: Product, quantity: int = 1) -> None:
         """Добавляет товар в заказ.
 
         Args:
             product: Товар, который необходимо добавить в заказ.
+            quantity: Заказанное количество единиц товара.
         """
+        if not self.lines:
+            self.lines = [OrderLine(product_id=p.id, unit_price=p.price) for p in self.products]
         self.products.append(product)
+        self.lines.append(OrderLine(product_id=product.id, quantity=quantity, unit_price=product.price))
 
     def get_total_price(self) -> float:
         """Возвращает общую стоимость заказа.
 
+        Стоимость считается по заказанному количеству, а не по остатку товара на складе.
+
         Returns:
             Общая стоимость заказа.
         """
+        if self.lines:
+            return sum(line.get_total_price() for line in self.lines)
+
         if self.products:
-            return sum(product.price * product.quantity for product in self.products)
+            return sum(product.price for product in self.products)
 
         if self.product and self.quantity and self.price:
             return self.quantity * self.price
@@ -64,7 +99,25 @@ class Order:
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True)
+class StockReservation:
+    """Результат резервирования товаров на складе.
+
+    Attributes:
+        reserved: Строки, для которых товар зарезервирован.
+        failed: Строки, которые не удалось зарезервировать из-за нехватки остатка или отсутствия товара.
+    """
+
+    reserved: list[OrderLine] = field(default_factory=list)
+    failed: list[OrderLine] = field(default_factory=list)
+
+    @property
+    def is_complete(self) -> bool:
+        """Возвращает True, если зарезервированы все строки."""
+        return not self.failed
+
+
+@dataclass(slots=True)
 class Customer:
     """Модель клиента в системе управления заказами.
 
@@ -99,3 +152,23 @@ class Customer:
         if (today.month, today.day) < (self.birth_date.month, self.birth_date.day):
             age -= 1
         return age
+
+
+@dataclass(slots=True)
+class CustomerSummary:
+    """Сводка по клиенту: агрегаты по всем заказам и страница последних заказов.
+
+    Attributes:
+        customer: Клиент (без загруженных заказов).
+        order_count: Количество заказов клиента.
+        revenue: Суммарная стоимость заказов клиента.
+        recent_orders: Стоимость заказов страницы `{order_id: стоимость}`, от новых к старым.
+        next_cursor: ID, который нужно передать как `before_id` для следующей страницы, или None,
+            если более старых заказов нет.
+    """
+
+    customer: Customer
+    order_count: int = 0
+    revenue: float = 0.0
+    recent_orders: dict[int, float] = field(default_factory=dict)
+    next_cursor: int | None = None
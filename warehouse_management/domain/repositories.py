@@ -4,7 +4,10 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from warehouse_management.domain.models import Order, Product
+    import builtins
+    from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+
+    from warehouse_management.domain.models import Customer, CustomerSummary, Order, Product
 
 
 class ProductRepository(ABC):
@@ -19,6 +22,18 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_many(self, products: 'Sequence[Product]', chunk_size: int = 1000) -> None:
+        """Добавляет несколько товаров в репозиторий одной пакетной операцией.
+
+        После вызова у каждого товара должен быть заполнен `id`.
+
+        Args:
+            products: Товары для добавления.
+            chunk_size: Максимальное количество строк в одном INSERT-запросе.
+        """
+        pass
+
     @abstractmethod
     def get(self, product_id: int) -> 'Product':
         """Получает товар по его ID.
@@ -31,6 +46,45 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def exists(self, product_id: int) -> bool:
+        """Проверяет существование товара без загрузки его данных.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            True, если товар существует.
+        """
+        pass
+
+    @abstractmethod
+    def get_reference(self, product_id: int) -> 'Product':
+        """Возвращает товар по первичному ключу.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+
+        Raises:
+            NotFoundError: Если товар не найден.
+        """
+        pass
+
+    @abstractmethod
+    def existing_ids(self, product_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих товаров из переданных.
+
+        Args:
+            product_ids: Проверяемые идентификаторы товаров.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        pass
+
     @abstractmethod
     def list(self) -> list['Product']:
         """Возвращает список всех товаров.
@@ -40,6 +94,52 @@ class ProductRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> 'Iterator[Product]':
+        """Лениво перебирает все товары в порядке ID с постоянным потреблением памяти.
+
+        Args:
+            batch_size: Количество строк, получаемых из базы за один раз.
+
+        Yields:
+            Товары по одному.
+        """
+        pass
+
+    @abstractmethod
+    def page(self, after_id: int | None = None, limit: int = 100) -> 'builtins.list[Product]':
+        """Возвращает страницу товаров с ID больше `after_id`.
+
+        Args:
+            after_id: ID последнего товара предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+
+        Returns:
+            Товары страницы в порядке ID.
+        """
+        pass
+
+    @abstractmethod
+    def reserve(self, quantities: 'Mapping[int, int]') -> set[int]:
+        """Уменьшает остатки товаров, если их достаточно, не читая их предварительно.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+
+        Returns:
+            ID товаров, для которых остаток уменьшен; остальные товары не изменяются.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, quantities: 'Mapping[int, int]') -> None:
+        """Возвращает ранее зарезервированное количество товаров на склад.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+        """
+        pass
+
 
 class OrderRepository(ABC):
     """Абстрактный репозиторий для управления заказами."""
@@ -54,26 +154,121 @@ class OrderRepository(ABC):
         pass
 
     @abstractmethod
-    def get(self, order_id: int) -> 'Order':
+    def add_many(self, orders: 'Sequence[Order]') -> None:
+        """Добавляет несколько заказов в репозиторий одной пакетной операцией.
+
+        Args:
+            orders: Заказы для добавления.
+        """
+        pass
+
+    @abstractmethod
+    def get(self, order_id: int, load_products: bool = True) -> 'Order | None':
         """Получает заказ по его ID.
 
+        Args:
+            order_id: Идентификатор заказа.
+            load_products: Загружать ли товары заказа.
+
+        Returns:
+            Найденный заказ или None, если заказ отсутствует.
+        """
+        pass
+
+    @abstractmethod
+    def exists(self, order_id: int) -> bool:
+        """Проверяет существование заказа без загрузки его данных.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            True, если заказ существует.
+        """
+        pass
+
+    @abstractmethod
+    def get_reference(self, order_id: int) -> 'Order':
+        """Возвращает заказ без строк и товаров по первичному ключу.
+
         Args:
             order_id: Идентификатор заказа.
 
         Returns:
             Найденный заказ.
+
+        Raises:
+            NotFoundError: Если заказ не найден.
         """
         pass
 
     @abstractmethod
-    def list(self) -> list['Order']:
+    def list(self, load_products: bool = True) -> list['Order']:
         """Возвращает список всех заказов.
 
+        Args:
+            load_products: Загружать ли товары заказов.
+
         Returns:
             Список заказов.
         """
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000, load_products: bool = True) -> 'Iterator[Order]':
+        """Лениво перебирает все заказы в порядке ID с постоянным потреблением памяти.
+
+        Args:
+            batch_size: Количество заказов, получаемых из базы за один раз.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Заказы по одному.
+        """
+        pass
+
+    @abstractmethod
+    def page(self, after_id: int | None = None, limit: int = 100, load_products: bool = True) -> 'builtins.list[Order]':
+        """Возвращает страницу заказов с ID больше `after_id`.
+
+        Args:
+            after_id: ID последнего заказа предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Заказы страницы в порядке ID.
+        """
+        pass
+
+    @abstractmethod
+    def totals(self, order_ids: 'Iterable[int]') -> dict[int, float]:
+        """Возвращает стоимость заказов по заказанному количеству и зафиксированной цене.
+
+        Args:
+            order_ids: Идентификаторы заказов.
+
+        Returns:
+            Словарь `{order_id: стоимость}` для найденных заказов.
+        """
+        pass
+
+    @abstractmethod
+    def iter_totals(
+        self, customer_id: int | None = None, after_id: int | None = None, batch_size: int = 10_000
+    ) -> 'Iterator[dict[int, float]]':
+        """Потоково возвращает стоимость всех заказов порциями в порядке ID.
+
+        Args:
+            customer_id: Возвращать только заказы этого клиента.
+            after_id: Начать с заказов, ID которых больше указанного.
+            batch_size: Количество заказов в одной порции.
+
+        Yields:
+            Словари `{order_id: стоимость}`.
+        """
+        pass
+
 
 class CustomerRepository(ABC):
     """Абстрактный репозиторий для управления клиентами."""
@@ -88,11 +283,13 @@ class CustomerRepository(ABC):
         pass
 
     @abstractmethod
-    def get(self, customer_id: int) -> 'Customer':
+    def get(self, customer_id: int, load_orders: bool = True, load_products: bool = True) -> 'Customer':
         """Получает клиента по его ID.
 
         Args:
             customer_id: Идентификатор клиента.
+            load_orders: Загружать ли заказы клиента.
+            load_products: Загружать ли товары заказов.
 
         Returns:
             Найденный клиент.
@@ -100,10 +297,518 @@ class CustomerRepository(ABC):
         pass
 
     @abstractmethod
-    def list(self) -> list['Customer']:
+    def exists(self, customer_id: int) -> bool:
+        """Проверяет существование клиента без загрузки его данных.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            True, если клиент существует.
+        """
+        pass
+
+    @abstractmethod
+    def get_reference(self, customer_id: int) -> 'Customer':
+        """Возвращает клиент без заказов по первичному ключу.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Найденный клиент.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        pass
+
+    @abstractmethod
+    def existing_ids(self, customer_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих клиентов из переданных.
+
+        Args:
+            customer_ids: Проверяемые идентификаторы клиентов.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        pass
+
+    @abstractmethod
+    def list(self, load_orders: bool = True, load_products: bool = True) -> list['Customer']:
         """Возвращает список всех клиентов.
 
+        Args:
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
         Returns:
             Список клиентов.
         """
         pass
+
+    @abstractmethod
+    def iter_all(
+        self, batch_size: int = 1000, load_orders: bool = True, load_products: bool = True
+    ) -> 'Iterator[Customer]':
+        """Лениво перебирает всех клиентов в порядке ID с постоянным потреблением памяти.
+
+        Args:
+            batch_size: Количество клиентов, получаемых из базы за один раз.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Клиенты по одному.
+        """
+        pass
+
+    @abstractmethod
+    def page(
+        self, after_id: int | None = None, limit: int = 100, load_orders: bool = True, load_products: bool = True
+    ) -> 'builtins.list[Customer]':
+        """Возвращает страницу клиентов с ID больше `after_id`.
+
+        Args:
+            after_id: ID последнего клиента предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Клиенты страницы в порядке ID.
+        """
+        pass
+
+    @abstractmethod
+    def summary(self, customer_id: int, orders_limit: int = 20, before_id: int | None = None) -> 'CustomerSummary':
+        """Возвращает сводку по клиенту без загрузки всех его заказов.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            orders_limit: Количество последних заказов в странице.
+            before_id: Курсор страницы: вернуть заказы с ID меньше указанного.
+
+        Returns:
+            Сводка по клиенту.
+        """
+        pass
+
+
+class ImportProgressRepository(ABC):
+    """Абстрактный репозиторий прогресса потокового импорта.
+
+    Прогресс сохраняется в той же транзакции, что и импортированные данные, поэтому
+    после сбоя импорт продолжается ровно с первой незафиксированной записи.
+    """
+
+    @abstractmethod
+    def get_offset(self, source: str) -> int:
+        """Возвращает количество обработанных записей источника.
+
+        Args:
+            source: Ключ источника импорта.
+
+        Returns:
+            Количество обработанных записей или 0, если импорт источника еще не выполнялся.
+        """
+        pass
+
+    @abstractmethod
+    def save_offset(self, source: str, offset: int) -> None:
+        """Сохраняет количество обработанных записей источника в текущей транзакции.
+
+        Args:
+            source: Ключ источника импорта.
+            offset: Количество обработанных записей.
+        """
+        pass
+
+
+class AsyncProductRepository(ABC):
+    """Абстрактный асинхронный репозиторий для управления товарами."""
+
+    @abstractmethod
+    async def add(self, product: 'Product') -> None:
+        """Добавляет товар в репозиторий.
+
+        Args:
+            product: Товар для добавления.
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, products: 'Sequence[Product]', chunk_size: int = 1000) -> None:
+        """Добавляет несколько товаров в репозиторий одной пакетной операцией.
+
+        Args:
+            products: Товары для добавления.
+            chunk_size: Максимальное количество строк в одном INSERT-запросе.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, product_id: int) -> 'Product':
+        """Получает товар по его ID.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, product_id: int) -> bool:
+        """Проверяет существование товара без загрузки его данных.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            True, если товар существует.
+        """
+        pass
+
+    @abstractmethod
+    async def get_reference(self, product_id: int) -> 'Product':
+        """Возвращает товар по первичному ключу.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+
+        Raises:
+            NotFoundError: Если товар не найден.
+        """
+        pass
+
+    @abstractmethod
+    async def existing_ids(self, product_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих товаров из переданных.
+
+        Args:
+            product_ids: Проверяемые идентификаторы товаров.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        pass
+
+    @abstractmethod
+    async def list(self) -> list['Product']:
+        """Возвращает список всех товаров.
+
+        Returns:
+            Список товаров.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> 'AsyncIterator[Product]':
+        """Лениво перебирает все товары в порядке ID с постоянным потреблением памяти.
+
+        Args:
+            batch_size: Количество строк, получаемых из базы за один раз.
+
+        Returns:
+            Асинхронный итератор товаров.
+        """
+        pass
+
+    @abstractmethod
+    async def page(self, after_id: int | None = None, limit: int = 100) -> 'builtins.list[Product]':
+        """Возвращает страницу товаров с ID больше `after_id`.
+
+        Args:
+            after_id: ID последнего товара предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+
+        Returns:
+            Товары страницы в порядке ID.
+        """
+        pass
+
+    @abstractmethod
+    async def reserve(self, quantities: 'Mapping[int, int]') -> set[int]:
+        """Уменьшает остатки товаров, если их достаточно, не читая их предварительно.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+
+        Returns:
+            ID товаров, для которых остаток уменьшен; остальные товары не изменяются.
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, quantities: 'Mapping[int, int]') -> None:
+        """Возвращает ранее зарезервированное количество товаров на склад.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+        """
+        pass
+
+
+class AsyncOrderRepository(ABC):
+    """Абстрактный асинхронный репозиторий для управления заказами."""
+
+    @abstractmethod
+    async def add(self, order: 'Order') -> None:
+        """Добавляет заказ в репозиторий.
+
+        Args:
+            order: Заказ для добавления.
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, orders: 'Sequence[Order]') -> None:
+        """Добавляет несколько заказов в репозиторий одной пакетной операцией.
+
+        Args:
+            orders: Заказы для добавления.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, order_id: int, load_products: bool = True) -> 'Order | None':
+        """Получает заказ по его ID.
+
+        Args:
+            order_id: Идентификатор заказа.
+            load_products: Загружать ли товары заказа.
+
+        Returns:
+            Найденный заказ или None, если заказ отсутствует.
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, order_id: int) -> bool:
+        """Проверяет существование заказа без загрузки его данных.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            True, если заказ существует.
+        """
+        pass
+
+    @abstractmethod
+    async def get_reference(self, order_id: int) -> 'Order':
+        """Возвращает заказ без строк и товаров по первичному ключу.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            Найденный заказ.
+
+        Raises:
+            NotFoundError: Если заказ не найден.
+        """
+        pass
+
+    @abstractmethod
+    async def list(self, load_products: bool = True) -> list['Order']:
+        """Возвращает список всех заказов.
+
+        Args:
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Список заказов.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000, load_products: bool = True) -> 'AsyncIterator[Order]':
+        """Лениво перебирает все заказы в порядке ID с постоянным потреблением памяти.
+
+        Args:
+            batch_size: Количество заказов, получаемых из базы за один раз.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Асинхронный итератор заказов.
+        """
+        pass
+
+    @abstractmethod
+    async def page(
+        self, after_id: int | None = None, limit: int = 100, load_products: bool = True
+    ) -> 'builtins.list[Order]':
+        """Возвращает страницу заказов с ID больше `after_id`.
+
+        Args:
+            after_id: ID последнего заказа предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Заказы страницы в порядке ID.
+        """
+        pass
+
+    @abstractmethod
+    async def totals(self, order_ids: 'Iterable[int]') -> dict[int, float]:
+        """Возвращает стоимость заказов по заказанному количеству и зафиксированной цене.
+
+        Args:
+            order_ids: Идентификаторы заказов.
+
+        Returns:
+            Словарь `{order_id: стоимость}` для найденных заказов.
+        """
+        pass
+
+    @abstractmethod
+    def iter_totals(
+        self, customer_id: int | None = None, after_id: int | None = None, batch_size: int = 10_000
+    ) -> 'AsyncIterator[dict[int, float]]':
+        """Потоково возвращает стоимость всех заказов порциями в порядке ID.
+
+        Args:
+            customer_id: Возвращать только заказы этого клиента.
+            after_id: Начать с заказов, ID которых больше указанного.
+            batch_size: Количество заказов в одной порции.
+
+        Yields:
+            Словари `{order_id: стоимость}`.
+        """
+        pass
+
+
+class AsyncCustomerRepository(ABC):
+    """Абстрактный асинхронный репозиторий для управления клиентами."""
+
+    @abstractmethod
+    async def add(self, customer: 'Customer') -> None:
+        """Добавляет клиента в репозиторий.
+
+        Args:
+            customer: Клиент для добавления.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, customer_id: int, load_orders: bool = True, load_products: bool = True) -> 'Customer':
+        """Получает клиента по его ID.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            load_orders: Загружать ли заказы клиента.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Найденный клиент.
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, customer_id: int) -> bool:
+        """Проверяет существование клиента без загрузки его данных.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            True, если клиент существует.
+        """
+        pass
+
+    @abstractmethod
+    async def get_reference(self, customer_id: int) -> 'Customer':
+        """Возвращает клиент без заказов по первичному ключу.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Найденный клиент.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        pass
+
+    @abstractmethod
+    async def existing_ids(self, customer_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих клиентов из переданных.
+
+        Args:
+            customer_ids: Проверяемые идентификаторы клиентов.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        pass
+
+    @abstractmethod
+    async def list(self, load_orders: bool = True, load_products: bool = True) -> list['Customer']:
+        """Возвращает список всех клиентов.
+
+        Args:
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Список клиентов.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self, batch_size: int = 1000, load_orders: bool = True, load_products: bool = True
+    ) -> 'AsyncIterator[Customer]':
+        """Лениво перебирает всех клиентов в порядке ID с постоянным потреблением памяти.
+
+        Args:
+            batch_size: Количество клиентов, получаемых из базы за один раз.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Асинхронный итератор клиентов.
+        """
+        pass
+
+    @abstractmethod
+    async def page(
+        self, after_id: int | None = None, limit: int = 100, load_orders: bool = True, load_products: bool = True
+    ) -> 'builtins.list[Customer]':
+        """Возвращает страницу клиентов с ID больше `after_id`.
+
+        Args:
+            after_id: ID последнего клиента предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Клиенты страницы в порядке ID.
+        """
+        pass
+
+    @abstractmethod
+    async def summary(
+        self, customer_id: int, orders_limit: int = 20, before_id: int | None = None
+    ) -> 'CustomerSummary':
+        """Возвращает сводку по клиенту без загрузки всех его заказов.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            orders_limit: Количество последних заказов в странице.
+            before_id: Курсор страницы: вернуть заказы с ID меньше указанного.
+
+        Returns:
+            Сводка по клиенту.
+        """
+        pass
@@ -1,10 +1,14 @@
 """Сервисный слой для управления товарами и заказами."""
 
+from itertools import batched
 from typing import TYPE_CHECKING
 
-from warehouse_management.domain.models import Order, Product
+from warehouse_management.domain.models import Order, Product, StockReservation
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from warehouse_management.domain.models import OrderLine
     from warehouse_management.domain.repositories import OrderRepository, ProductRepository
 
 
@@ -38,17 +42,49 @@ class WarehouseService:
         Raises:
             ValueError: Если `name` пустой, `quantity` < 0 или `price` < 0.
         """
-        if not name.strip():
-            raise ValueError('Название продукта не может быть пустым')
-        if quantity < 0:
-            raise ValueError('Количество продукта не может быть отрицательным')
-        if price < 0:
-            raise ValueError('Цена продукта не может быть отрицательной')
+        self._validate_product(name, quantity, price)
 
         product = Product(id=None, name=name, quantity=quantity, price=price)
         self.product_repo.add(product)
         return product
 
+    def create_products(self, items: 'Sequence[tuple[str, int, float]]', chunk_size: int = 1000) -> list['Product']:
+        """Создает несколько товаров и добавляет их в репозиторий одной пакетной операцией.
+
+        Все позиции проверяются до обращения к репозиторию, поэтому при ошибке
+        валидации ни один товар не сохраняется.
+
+        Args:
+            items: Последовательность кортежей `(name, quantity, price)`.
+            chunk_size: Максимальное количество строк в одном INSERT-запросе.
+
+        Returns:
+            Созданные товары в порядке входных данных.
+
+        Raises:
+            ValueError: Если хотя бы одна позиция содержит некорректные данные.
+        """
+        for index, (name, quantity, price) in enumerate(items):
+            try:
+                self._validate_product(name, quantity, price)
+            except ValueError as error:
+                raise ValueError(f'Позиция {index}: {error}') from error
+
+        products = [Product(id=None, name=name, quantity=quantity, price=price) for name, quantity, price in items]
+        self.product_repo.add_many(products, chunk_size=chunk_size)
+        return products
+
+    def existing_product_ids(self, product_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает ID существующих товаров одним запросом к репозиторию.
+
+        Args:
+            product_ids: Проверяемые идентификаторы товаров.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        return self.product_repo.existing_ids(product_ids)
+
     def create_order(self, products: list['Product']) -> 'Order':
         """Создает новый заказ и добавляет его в репозиторий.
 
@@ -58,6 +94,116 @@ class WarehouseService:
         Returns:
             Созданный заказ.
         """
-        order = Order(id=None, products=products)
+        order = Order(id=None, customer_id=None, products=products)
         self.order_repo.add(order)
         return order
+
+    def create_orders(self, orders: 'Sequence[Order]') -> 'Sequence[Order]':
+        """Добавляет несколько заказов в репозиторий одной пакетной операцией.
+
+        Все строки проверяются до обращения к репозиторию, поэтому при ошибке
+        валидации ни один заказ не сохраняется.
+
+        Args:
+            orders: Заказы со строками (товар, количество и, при необходимости, цена за единицу).
+
+        Returns:
+            Сохраненные заказы в порядке входных данных.
+
+        Raises:
+            ValueError: Если у строки отсутствует ID товара или количество меньше 1.
+        """
+        for index, order in enumerate(orders):
+            for line in order.lines:
+                if line.product_id is None:
+                    raise ValueError(f'Позиция {index}: не указан ID товара')
+                if line.quantity < 1:
+                    raise ValueError(f'Позиция {index}: количество должно быть положительным')
+
+        self.order_repo.add_many(orders)
+        return orders
+
+    def reserve_stock(self, items: 'Sequence[OrderLine]', partial: bool = False) -> StockReservation:
+        """Резервирует товары на складе для строк заказа.
+
+        Остатки уменьшаются условным UPDATE (`quantity >= заказано`) без предварительного
+        чтения и блокировок, пакетно для всех строк, в транзакции вызывающего Unit of Work.
+        Повторяющиеся товары суммируются.
+
+        Args:
+            items: Строки заказа с ID товара и количеством.
+            partial: Оставлять ли резерв по строкам, которые удалось зарезервировать, если часть
+                строк не прошла; по умолчанию резервирование выполняется по принципу «все или ничего».
+
+        Returns:
+            Зарезервированные строки и строки, которые не удалось зарезервировать; если резерв
+            отменен целиком, список зарезервированных строк пуст.
+
+        Raises:
+            ValueError: Если у строки отсутствует ID товара или количество меньше 1.
+        """
+        quantities: dict[int, int] = {}
+        for index, line in enumerate(items):
+            if line.product_id is None:
+                raise ValueError(f'Позиция {index}: не указан ID товара')
+            if line.quantity < 1:
+                raise ValueError(f'Позиция {index}: количество должно быть положительным')
+            quantities[line.product_id] = quantities.get(line.product_id, 0) + line.quantity
+
+        reserved_ids = self.product_repo.reserve(quantities) if quantities else set()
+        reservation = StockReservation(
+            reserved=[line for line in items if line.product_id in reserved_ids],
+            failed=[line for line in items if line.product_id not in reserved_ids],
+        )
+        if reservation.failed and not partial:
+            if reserved_ids:
+                self.product_repo.release({product_id: quantities[product_id] for product_id in reserved_ids})
+            reservation.reserved = []
+        return reservation
+
+    def order_totals(
+        self, order_ids: 'Iterable[int] | None' = None, customer_id: int | None = None, chunk_size: int = 10_000
+    ) -> 'Iterator[dict[int, float]]':
+        """Потоково считает стоимость заказов агрегатными запросами без загрузки заказов в память.
+
+        Стоимость считается в базе данных по заказанному количеству и зафиксированной цене;
+        результаты отдаются порциями, поэтому обход миллионов заказов выполняется
+        с постоянным потреблением памяти.
+
+        Args:
+            order_ids: Идентификаторы заказов; если не указаны, обходятся все заказы.
+            customer_id: Считать только заказы этого клиента (нельзя сочетать с `order_ids`).
+            chunk_size: Количество заказов в одной порции.
+
+        Returns:
+            Итератор словарей `{order_id: стоимость}`; отсутствующие в базе заказы пропускаются.
+
+        Raises:
+            ValueError: Если одновременно указаны `order_ids` и `customer_id` или `chunk_size` меньше 1.
+        """
+        if chunk_size < 1:
+            raise ValueError('Размер порции должен быть положительным')
+        if order_ids is None:
+            return self.order_repo.iter_totals(customer_id=customer_id, batch_size=chunk_size)
+        if customer_id is not None:
+            raise ValueError('Нельзя одновременно указывать список заказов и клиента')
+        return (self.order_repo.totals(chunk) for chunk in batched(order_ids, chunk_size))
+
+    @staticmethod
+    def _validate_product(name: str, quantity: int, price: float) -> None:
+        """Проверяет атрибуты товара перед сохранением.
+
+        Args:
+            name: Название товара.
+            quantity: Количество товара.
+            price: Цена товара.
+
+        Raises:
+            ValueError: Если `name` пустой, `quantity` < 0 или `price` < 0.
+        """
+        if not name.strip():
+            raise ValueError('Название продукта не может быть пустым')
+        if quantity < 0:
+            raise ValueError('Количество продукта не может быть отрицательным')
+        if price < 0:
+            raise ValueError('Цена продукта не может быть отрицательной')
@@ -47,3 +47,45 @@ class UnitOfWork(ABC):
     def rollback(self) -> None:
         """Откатывает текущую транзакцию."""
         pass
+
+
+class AsyncUnitOfWork(ABC):
+    """Абстрактный асинхронный класс Unit of Work.
+
+    Асинхронный аналог `UnitOfWork` для использования в `async with`.
+    """
+
+    @abstractmethod
+    async def __aenter__(self) -> 'Self':
+        """Начинает контекст управления транзакцией.
+
+        Returns:
+            Текущий экземпляр Unit of Work.
+        """
+        pass
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object | None,
+    ) -> None:
+        """Завершает контекст управления транзакцией.
+
+        Args:
+            exc_type: Тип исключения, если оно произошло.
+            exc_val: Значение исключения.
+            exc_tb: Трассировка исключения.
+        """
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Фиксирует текущую транзакцию."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Откатывает текущую транзакцию."""
+        pass
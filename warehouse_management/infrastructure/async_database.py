@@ -0,0 +1,96 @@
+"""Модуль для создания асинхронного движка и фабрики сессий SQLAlchemy."""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
+
+from warehouse_management.infrastructure.database import engine_options, register_sqlite_pragmas, registered_engine
+from warehouse_management.infrastructure.orm import Base
+from warehouse_management.settings import DatabaseSettings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Асинхронные драйверы, используемые по умолчанию для синхронных URL.
+_ASYNC_DRIVERS = {
+    'sqlite': 'aiosqlite',
+    'postgresql': 'asyncpg',
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Преобразует URL базы данных для использования с асинхронным драйвером.
+
+    URL, в котором драйвер уже указан явно (например, `sqlite+aiosqlite://`), не изменяется.
+
+    Args:
+        database_url: URL базы данных.
+
+    Returns:
+        URL с асинхронным драйвером.
+    """
+    url = make_url(database_url)
+    if url.drivername in _ASYNC_DRIVERS:
+        url = url.set(drivername=f'{url.drivername}+{_ASYNC_DRIVERS[url.drivername]}')
+    return url.render_as_string(hide_password=False)
+
+
+def get_async_engine(settings: 'DatabaseSettings | None' = None) -> 'AsyncEngine':
+    """Возвращает асинхронный движок для настроек, создавая его при первом обращении.
+
+    Движок хранится в том же реестре, что и синхронные (`get_engine()`), поэтому
+    его пул сбрасывается в дочернем процессе после `fork()`.
+
+    Args:
+        settings: Настройки базы данных; по умолчанию читаются из переменных окружения.
+
+    Returns:
+        Экземпляр SQLAlchemy AsyncEngine.
+    """
+    settings = settings or DatabaseSettings()
+    return registered_engine(f'async:{settings.model_dump_json()}', lambda: create_async_database_engine(settings))
+
+
+def create_async_database_engine(settings: 'DatabaseSettings') -> 'AsyncEngine':
+    """Создает асинхронный движок с теми же настройками пула и PRAGMA, что и синхронный.
+
+    Args:
+        settings: Настройки базы данных.
+
+    Returns:
+        Экземпляр SQLAlchemy AsyncEngine.
+    """
+    url = make_url(to_async_url(settings.url))
+    engine = create_async_engine(url, **engine_options(settings, url))
+    if url.get_backend_name() == 'sqlite':
+        register_sqlite_pragmas(engine.sync_engine, settings.sqlite)
+    return engine
+
+
+def get_async_session_factory(
+    engine: 'AsyncEngine', expire_on_commit: bool = False
+) -> 'async_sessionmaker[AsyncSession]':
+    """Создает фабрику асинхронных сессий.
+
+    По умолчанию `expire_on_commit` отключен: после `await commit()` атрибуты
+    объектов нельзя лениво перечитать без явного `await`.
+
+    Args:
+        engine: Асинхронный движок.
+        expire_on_commit: Сбрасывать ли состояние объектов после commit().
+
+    Returns:
+        Фабрика асинхронных сессий.
+    """
+    return async_sessionmaker(bind=engine, expire_on_commit=expire_on_commit)
+
+
+async def init_async_db(engine: 'AsyncEngine') -> None:
+    """Инициализирует базу данных, создавая таблицы, если они отсутствуют.
+
+    Args:
+        engine: Асинхронный движок.
+    """
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
@@ -0,0 +1,477 @@
+"""Асинхронные репозитории для взаимодействия с базой данных через SQLAlchemy.
+
+Запросы выполняются синхронными репозиториями внутри `AsyncSession.run_sync()`,
+поэтому асинхронные реализации сохраняют ту же семантику загрузки и пакетной записи.
+"""
+
+from typing import TYPE_CHECKING
+
+from warehouse_management.domain.repositories import (
+    AsyncCustomerRepository,
+    AsyncOrderRepository,
+    AsyncProductRepository,
+)
+from warehouse_management.infrastructure.queries import check_positive, order_totals_page
+from warehouse_management.infrastructure.repositories import (
+    SqlAlchemyCustomerRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyProductRepository,
+)
+
+if TYPE_CHECKING:
+    import builtins
+    from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from warehouse_management.domain.models import Customer, CustomerSummary, Order, Product
+
+
+class AsyncSqlAlchemyProductRepository(AsyncProductRepository):
+    """Асинхронный репозиторий для управления товарами."""
+
+    def __init__(self, session: 'AsyncSession', core_reads: bool = False) -> None:
+        """Инициализирует репозиторий товаров.
+
+        Args:
+            session: Экземпляр асинхронной SQLAlchemy-сессии.
+            core_reads: Читать модели в `get()` и `list()` запросами Core без ORM-объектов.
+        """
+        self.session = session
+        self.core_reads = core_reads
+
+    async def add(self, product: 'Product') -> None:
+        """Добавляет товар в базу данных.
+
+        Args:
+            product: Экземпляр товара.
+        """
+        await self.session.run_sync(lambda session: SqlAlchemyProductRepository(session, self.core_reads).add(product))
+
+    async def add_many(self, products: 'Sequence[Product]', chunk_size: int = 1000) -> None:
+        """Добавляет товары в базу данных пакетами.
+
+        Args:
+            products: Товары для добавления.
+            chunk_size: Максимальное количество строк в одном INSERT-запросе.
+        """
+        await self.session.run_sync(
+            lambda session: SqlAlchemyProductRepository(session, self.core_reads).add_many(
+                products, chunk_size=chunk_size
+            )
+        )
+
+    async def get(self, product_id: int) -> 'Product':
+        """Получает товар по ID.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyProductRepository(session, self.core_reads).get(product_id)
+        )
+
+    async def exists(self, product_id: int) -> bool:
+        """Проверяет существование товара запросом по первичному ключу.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            True, если товар существует.
+        """
+        return await self.session.run_sync(lambda session: SqlAlchemyProductRepository(session).exists(product_id))
+
+    async def get_reference(self, product_id: int) -> 'Product':
+        """Возвращает товар по первичному ключу без загрузки связанных объектов.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyProductRepository(session).get_reference(product_id)
+        )
+
+    async def existing_ids(self, product_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих товаров из переданных.
+
+        Args:
+            product_ids: Проверяемые идентификаторы товаров.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        ids = list(product_ids)
+        return await self.session.run_sync(lambda session: SqlAlchemyProductRepository(session).existing_ids(ids))
+
+    async def list(self) -> list['Product']:
+        """Возвращает список всех товаров.
+
+        Returns:
+            Список товаров.
+        """
+        return await self.session.run_sync(lambda session: SqlAlchemyProductRepository(session, self.core_reads).list())
+
+    async def iter_all(self, batch_size: int = 1000) -> 'AsyncIterator[Product]':
+        """Лениво перебирает все товары в порядке ID, загружая их страницами по `batch_size`.
+
+        Args:
+            batch_size: Количество строк, получаемых из базы за один раз.
+
+        Yields:
+            Товары по одному.
+        """
+        check_positive(batch_size, 'Batch size')
+        after_id = None
+        while products := await self.page(after_id=after_id, limit=batch_size):
+            for product in products:
+                yield product
+            after_id = products[-1].id
+
+    async def page(self, after_id: int | None = None, limit: int = 100) -> 'builtins.list[Product]':
+        """Возвращает страницу товаров с ID больше `after_id` (keyset-пагинация).
+
+        Args:
+            after_id: ID последнего товара предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+
+        Returns:
+            Товары страницы в порядке ID.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyProductRepository(session, self.core_reads).page(after_id=after_id, limit=limit)
+        )
+
+    async def reserve(self, quantities: 'Mapping[int, int]') -> set[int]:
+        """Уменьшает остатки товаров условным UPDATE, если их достаточно.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+
+        Returns:
+            ID товаров, для которых остаток уменьшен.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyProductRepository(session, self.core_reads).reserve(quantities)
+        )
+
+    async def release(self, quantities: 'Mapping[int, int]') -> None:
+        """Возвращает ранее зарезервированное количество товаров на склад.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+        """
+        await self.session.run_sync(
+            lambda session: SqlAlchemyProductRepository(session, self.core_reads).release(quantities)
+        )
+
+
+class AsyncSqlAlchemyOrderRepository(AsyncOrderRepository):
+    """Асинхронный репозиторий для управления заказами."""
+
+    def __init__(self, session: 'AsyncSession', core_reads: bool = False) -> None:
+        """Инициализирует репозиторий заказов.
+
+        Args:
+            session: Экземпляр асинхронной SQLAlchemy-сессии.
+            core_reads: Читать модели в `get()` и `list()` запросами Core без ORM-объектов.
+        """
+        self.session = session
+        self.core_reads = core_reads
+
+    async def add(self, order: 'Order') -> None:
+        """Добавляет заказ в базу данных.
+
+        Args:
+            order: Экземпляр заказа.
+        """
+        await self.session.run_sync(lambda session: SqlAlchemyOrderRepository(session, self.core_reads).add(order))
+
+    async def add_many(self, orders: 'Sequence[Order]') -> None:
+        """Добавляет несколько заказов в базу данных.
+
+        Args:
+            orders: Заказы для добавления.
+        """
+        await self.session.run_sync(
+            lambda session: SqlAlchemyOrderRepository(session, self.core_reads).add_many(orders)
+        )
+
+    async def get(self, order_id: int, load_products: bool = True) -> 'Order | None':
+        """Получает заказ по ID.
+
+        Args:
+            order_id: Идентификатор заказа.
+            load_products: Загружать ли товары заказа.
+
+        Returns:
+            Найденный заказ или None, если заказ отсутствует.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyOrderRepository(session, self.core_reads).get(
+                order_id, load_products=load_products
+            )
+        )
+
+    async def exists(self, order_id: int) -> bool:
+        """Проверяет существование заказа запросом по первичному ключу.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            True, если заказ существует.
+        """
+        return await self.session.run_sync(lambda session: SqlAlchemyOrderRepository(session).exists(order_id))
+
+    async def get_reference(self, order_id: int) -> 'Order':
+        """Возвращает заказ по первичному ключу без загрузки связанных объектов.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            Найденный заказ.
+        """
+        return await self.session.run_sync(lambda session: SqlAlchemyOrderRepository(session).get_reference(order_id))
+
+    async def list(self, load_products: bool = True) -> list['Order']:
+        """Возвращает список всех заказов.
+
+        Args:
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Список заказов.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyOrderRepository(session, self.core_reads).list(load_products=load_products)
+        )
+
+    async def iter_all(self, batch_size: int = 1000, load_products: bool = True) -> 'AsyncIterator[Order]':
+        """Лениво перебирает все заказы в порядке ID, загружая их страницами по `batch_size`.
+
+        Args:
+            batch_size: Количество заказов, получаемых из базы за один раз.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Заказы по одному.
+        """
+        check_positive(batch_size, 'Batch size')
+        after_id = None
+        while orders := await self.page(after_id=after_id, limit=batch_size, load_products=load_products):
+            for order in orders:
+                yield order
+            after_id = orders[-1].id
+
+    async def page(
+        self, after_id: int | None = None, limit: int = 100, load_products: bool = True
+    ) -> 'builtins.list[Order]':
+        """Возвращает страницу заказов с ID больше `after_id` (keyset-пагинация).
+
+        Args:
+            after_id: ID последнего заказа предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Заказы страницы в порядке ID.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyOrderRepository(session, self.core_reads).page(
+                after_id=after_id, limit=limit, load_products=load_products
+            )
+        )
+
+    async def totals(self, order_ids: 'Iterable[int]') -> dict[int, float]:
+        """Считает стоимость заказов на стороне базы данных.
+
+        Args:
+            order_ids: Идентификаторы заказов.
+
+        Returns:
+            Словарь `{order_id: стоимость}`; заказы без строк имеют стоимость 0.0.
+        """
+        ids = list(order_ids)
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyOrderRepository(session, self.core_reads).totals(ids)
+        )
+
+    async def iter_totals(
+        self, customer_id: int | None = None, after_id: int | None = None, batch_size: int = 10_000
+    ) -> 'AsyncIterator[dict[int, float]]':
+        """Потоково считает стоимость всех заказов порциями в порядке ID (keyset-пагинация).
+
+        Args:
+            customer_id: Считать только заказы этого клиента.
+            after_id: Начать с заказов, ID которых больше указанного.
+            batch_size: Количество заказов в одной порции.
+
+        Yields:
+            Словари `{order_id: стоимость}`; заказы без строк имеют стоимость 0.0.
+        """
+        check_positive(batch_size, 'Batch size')
+        while totals := await self.session.run_sync(order_totals_page, customer_id, after_id, batch_size):
+            yield totals
+            after_id = next(reversed(totals))
+
+
+class AsyncSqlAlchemyCustomerRepository(AsyncCustomerRepository):
+    """Асинхронный репозиторий для управления клиентами."""
+
+    def __init__(self, session: 'AsyncSession', core_reads: bool = False) -> None:
+        """Инициализирует репозиторий клиентов.
+
+        Args:
+            session: Экземпляр асинхронной SQLAlchemy-сессии.
+            core_reads: Читать модели в `get()` и `list()` запросами Core без ORM-объектов.
+        """
+        self.session = session
+        self.core_reads = core_reads
+
+    async def add(self, customer: 'Customer') -> None:
+        """Добавляет клиента в базу данных.
+
+        Args:
+            customer: Экземпляр клиента.
+        """
+        await self.session.run_sync(
+            lambda session: SqlAlchemyCustomerRepository(session, self.core_reads).add(customer)
+        )
+
+    async def get(self, customer_id: int, load_orders: bool = True, load_products: bool = True) -> 'Customer':
+        """Получает клиента по ID.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            load_orders: Загружать ли заказы клиента.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Найденный клиент.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyCustomerRepository(session, self.core_reads).get(
+                customer_id, load_orders=load_orders, load_products=load_products
+            )
+        )
+
+    async def exists(self, customer_id: int) -> bool:
+        """Проверяет существование клиента запросом по первичному ключу.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            True, если клиент существует.
+        """
+        return await self.session.run_sync(lambda session: SqlAlchemyCustomerRepository(session).exists(customer_id))
+
+    async def get_reference(self, customer_id: int) -> 'Customer':
+        """Возвращает клиент по первичному ключу без загрузки связанных объектов.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Найденный клиент.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyCustomerRepository(session).get_reference(customer_id)
+        )
+
+    async def existing_ids(self, customer_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих клиентов из переданных.
+
+        Args:
+            customer_ids: Проверяемые идентификаторы клиентов.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        ids = list(customer_ids)
+        return await self.session.run_sync(lambda session: SqlAlchemyCustomerRepository(session).existing_ids(ids))
+
+    async def list(self, load_orders: bool = True, load_products: bool = True) -> list['Customer']:
+        """Возвращает список всех клиентов.
+
+        Args:
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Список клиентов.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyCustomerRepository(session, self.core_reads).list(
+                load_orders=load_orders, load_products=load_products
+            )
+        )
+
+    async def iter_all(
+        self, batch_size: int = 1000, load_orders: bool = True, load_products: bool = True
+    ) -> 'AsyncIterator[Customer]':
+        """Лениво перебирает всех клиентов в порядке ID, загружая их страницами по `batch_size`.
+
+        Args:
+            batch_size: Количество клиентов, получаемых из базы за один раз.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Клиенты по одному.
+        """
+        check_positive(batch_size, 'Batch size')
+        after_id = None
+        while customers := await self.page(
+            after_id=after_id, limit=batch_size, load_orders=load_orders, load_products=load_products
+        ):
+            for customer in customers:
+                yield customer
+            after_id = customers[-1].id
+
+    async def page(
+        self, after_id: int | None = None, limit: int = 100, load_orders: bool = True, load_products: bool = True
+    ) -> 'builtins.list[Customer]':
+        """Возвращает страницу клиентов с ID больше `after_id` (keyset-пагинация).
+
+        Args:
+            after_id: ID последнего клиента предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Клиенты страницы в порядке ID.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyCustomerRepository(session, self.core_reads).page(
+                after_id=after_id, limit=limit, load_orders=load_orders, load_products=load_products
+            )
+        )
+
+    async def summary(
+        self, customer_id: int, orders_limit: int = 20, before_id: int | None = None
+    ) -> 'CustomerSummary':
+        """Возвращает сводку по клиенту без загрузки всех его заказов.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            orders_limit: Количество последних заказов в странице.
+            before_id: Курсор страницы: вернуть заказы с ID меньше указанного.
+
+        Returns:
+            Сводка по клиенту.
+        """
+        return await self.session.run_sync(
+            lambda session: SqlAlchemyCustomerRepository(session, self.core_reads).summary(
+                customer_id, orders_limit=orders_limit, before_id=before_id
+            )
+        )
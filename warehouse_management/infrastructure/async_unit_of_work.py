@@ -0,0 +1,126 @@
+"""Асинхронная реализация паттерна Unit of Work с использованием SQLAlchemy."""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from warehouse_management.domain.unit_of_work import AsyncUnitOfWork
+from warehouse_management.infrastructure.async_repositories import (
+    AsyncSqlAlchemyCustomerRepository,
+    AsyncSqlAlchemyOrderRepository,
+    AsyncSqlAlchemyProductRepository,
+)
+from warehouse_management.infrastructure.unit_of_work import pop_bulk_written_product_ids, written_product_ids
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+    from sqlalchemy.orm import Session, UOWTransaction
+
+    from warehouse_management.infrastructure.cache import CachedProductRepository
+
+
+class AsyncSqlAlchemyUnitOfWork(AsyncUnitOfWork):
+    """Асинхронная реализация Unit of Work для работы с SQLAlchemy.
+
+    Каждый блок `async with` получает собственную сессию из фабрики, поэтому один
+    экземпляр фабрики и пул соединений могут обслуживать множество конкурентных задач.
+    Репозитории `products`, `orders` и `customers` привязаны к сессии текущего блока.
+    """
+
+    def __init__(
+        self,
+        session_factory: 'async_sessionmaker[AsyncSession]',
+        product_cache: 'CachedProductRepository | None' = None,
+        core_reads: bool = False,
+    ) -> None:
+        """Инициализирует Unit of Work.
+
+        Args:
+            session_factory: Фабрика асинхронных SQLAlchemy-сессий.
+            product_cache: Кэш товаров, записи которого инвалидируются после фиксации изменений.
+            core_reads: Читать модели в репозиториях запросами Core без ORM-объектов.
+        """
+        self.session_factory = session_factory
+        self.product_cache = product_cache
+        self.core_reads = core_reads
+        self._session: AsyncSession | None = None
+        self._written_product_ids: set[int] = set()
+
+    @property
+    def session(self) -> 'AsyncSession':
+        """Возвращает сессию текущего блока `async with`.
+
+        Raises:
+            RuntimeError: Если Unit of Work используется вне `async with`.
+        """
+        if self._session is None:
+            raise RuntimeError('Unit of Work is not active, use it inside "async with"')
+        return self._session
+
+    async def __aenter__(self) -> 'Self':
+        """Открывает сессию и привязывает к ней репозитории.
+
+        Returns:
+            Текущий экземпляр Unit of Work.
+
+        Raises:
+            RuntimeError: Если Unit of Work уже активен.
+        """
+        if self._session is not None:
+            raise RuntimeError('Unit of Work is already active')
+
+        self._session = self.session_factory()
+        if self.product_cache is not None:
+            event.listen(self._session.sync_session, 'after_flush', self._collect_written_products)
+
+        self.products = AsyncSqlAlchemyProductRepository(self._session, self.core_reads)
+        self.orders = AsyncSqlAlchemyOrderRepository(self._session, self.core_reads)
+        self.customers = AsyncSqlAlchemyCustomerRepository(self._session, self.core_reads)
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: object | None
+    ) -> None:
+        """Выходит из контекста Unit of Work, выполняя commit() или rollback(), и закрывает сессию.
+
+        Args:
+            exc_type: Тип исключения.
+            exc_value: Объект исключения.
+            traceback: Трассировка исключения.
+        """
+        try:
+            if exc_type:
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
+            await self.session.close()
+            self._session = None
+
+    async def commit(self) -> None:
+        """Фиксирует изменения в базе данных и инвалидирует кэш измененных товаров."""
+        await self.session.commit()
+        self._invalidate_written_products()
+
+    async def rollback(self) -> None:
+        """Откатывает изменения в базе данных и инвалидирует кэш измененных товаров."""
+        await self.session.rollback()
+        self._invalidate_written_products()
+
+    def _collect_written_products(self, session: 'Session', _flush_context: 'UOWTransaction') -> None:
+        """Запоминает ID товаров, записанных при очередном flush.
+
+        Args:
+            session: Синхронная сессия, выполнившая flush.
+            _flush_context: Контекст flush (не используется).
+        """
+        self._written_product_ids.update(written_product_ids(session))
+
+    def _invalidate_written_products(self) -> None:
+        """Удаляет из кэша товары, записанные в рамках текущей транзакции."""
+        self._written_product_ids.update(pop_bulk_written_product_ids(self.session.sync_session))
+        if self.product_cache is not None and self._written_product_ids:
+            self.product_cache.invalidate(self._written_product_ids)
+        self._written_product_ids.clear()
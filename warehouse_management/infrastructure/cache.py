@@ -0,0 +1,317 @@
+"""Кэширующий декоратор репозитория товаров."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import scoped_session
+
+from warehouse_management.domain.repositories import ProductRepository
+from warehouse_management.infrastructure.unit_of_work import has_uncommitted_product_write, is_read_only
+
+if TYPE_CHECKING:
+    import builtins
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.domain.models import Product
+
+
+@dataclass
+class CacheStats:
+    """Счетчики работы кэша.
+
+    Attributes:
+        hits: Количество обращений, обслуженных из кэша.
+        misses: Количество обращений, потребовавших чтения из репозитория.
+        evictions: Количество записей, вытесненных по размеру или TTL.
+        invalidations: Количество записей, удаленных после фиксации изменений.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class CachedProductRepository(ProductRepository):
+    """Read-through кэш поверх любого репозитория товаров.
+
+    Кэширует результаты `get()` в ограниченном LRU-кэше с необязательным TTL.
+    Остальные методы делегируются обернутому репозиторию без кэширования.
+    Записи инвалидируются через `invalidate()`, который вызывает Unit of Work
+    после фиксации транзакции, изменившей товары.
+
+    Промах читает товар без блокировки кэша, поэтому перед сохранением проверяется,
+    что за время чтения запись товара не была инвалидирована: иначе прочитанное до
+    фиксации значение перезаписало бы инвалидацию.
+
+    Если передана сессия обернутого репозитория, кэш обходится в Unit of Work только
+    для чтения (реплика может отставать) и для товаров, измененных в еще не
+    зафиксированной транзакции сессии: такие товары читаются из обернутого
+    репозитория и не сохраняются в кэш.
+    """
+
+    def __init__(
+        self,
+        repository: 'ProductRepository',
+        max_size: int = 10_000,
+        ttl_seconds: float | None = None,
+        clock: 'Callable[[], float]' = time.monotonic,
+        session: 'Session | scoped_session[Session] | None' = None,
+    ) -> None:
+        """Инициализирует кэширующий репозиторий.
+
+        Args:
+            repository: Репозиторий, к которому выполняются обращения при промахе.
+            max_size: Максимальное количество товаров в кэше.
+            ttl_seconds: Время жизни записи в секундах или None, если записи не устаревают.
+            clock: Источник монотонного времени.
+            session: Сессия или реестр сессий обернутого репозитория; по ее состоянию
+                решается, можно ли сохранить прочитанный товар в кэш.
+
+        Raises:
+            ValueError: Если `max_size` меньше 1 или `ttl_seconds` не положительный.
+        """
+        if max_size < 1:
+            raise ValueError('Cache size must be a positive integer')
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError('Cache TTL must be positive')
+
+        self.repository = repository
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self.session = session
+        self._entries: OrderedDict[int, tuple[Product, float]] = OrderedDict()
+        # Метки идущих чтений при промахе; `invalidate()` удаляет метку, отменяя сохранение.
+        self._loading: dict[int, object] = {}
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Возвращает снимок счетчиков кэша."""
+        with self._lock:
+            return replace(self._stats)
+
+    def __len__(self) -> int:
+        """Возвращает количество записей в кэше."""
+        return len(self._entries)
+
+    def add(self, product: 'Product') -> None:
+        """Добавляет товар через обернутый репозиторий.
+
+        Args:
+            product: Товар для добавления.
+        """
+        self.repository.add(product)
+
+    def add_many(self, products: 'Sequence[Product]', chunk_size: int = 1000) -> None:
+        """Добавляет товары через обернутый репозиторий.
+
+        Args:
+            products: Товары для добавления.
+            chunk_size: Максимальное количество строк в одном INSERT-запросе.
+        """
+        self.repository.add_many(products, chunk_size=chunk_size)
+
+    def get(self, product_id: int) -> 'Product':
+        """Возвращает товар из кэша или загружает его из обернутого репозитория.
+
+        Возвращается копия закэшированного объекта, чтобы изменения вызывающей стороны не портили кэш.
+        В Unit of Work только для чтения и для товара, измененного в незафиксированной
+        транзакции сессии, кэш не используется: товар читается из обернутого репозитория
+        и не сохраняется. Товар также не сохраняется, если его запись инвалидирована во время чтения.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+        """
+        if not self._uses_cache(product_id):
+            return self.repository.get(product_id)
+
+        token = object()
+        with self._lock:
+            cached = self._lookup(product_id)
+            if cached is None:
+                self._loading[product_id] = token
+        if cached is not None:
+            return replace(cached)
+
+        product: Product | None = None
+        try:
+            product = self.repository.get(product_id)
+            return product
+        finally:
+            with self._lock:
+                if self._loading.get(product_id) is token:
+                    del self._loading[product_id]
+                    if product is not None and self._uses_cache(product_id):
+                        self._store(product_id, replace(product))
+
+    def exists(self, product_id: int) -> bool:
+        """Проверяет существование товара: закэшированный товар не запрашивается из базы.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            True, если товар существует.
+        """
+        if not self._uses_cache(product_id):
+            return self.repository.exists(product_id)
+        with self._lock:
+            cached = self._lookup(product_id)
+        return cached is not None or self.repository.exists(product_id)
+
+    def get_reference(self, product_id: int) -> 'Product':
+        """Возвращает товар из кэша или загружает его из обернутого репозитория.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+        """
+        return self.get(product_id)
+
+    def existing_ids(self, product_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих товаров из обернутого репозитория.
+
+        Args:
+            product_ids: Проверяемые идентификаторы товаров.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        return self.repository.existing_ids(product_ids)
+
+    def list(self) -> list['Product']:
+        """Возвращает список всех товаров из обернутого репозитория.
+
+        Returns:
+            Список товаров.
+        """
+        return self.repository.list()
+
+    def iter_all(self, batch_size: int = 1000) -> 'Iterator[Product]':
+        """Лениво перебирает все товары обернутого репозитория.
+
+        Args:
+            batch_size: Количество строк, получаемых из базы за один раз.
+
+        Returns:
+            Итератор товаров.
+        """
+        return self.repository.iter_all(batch_size=batch_size)
+
+    def page(self, after_id: int | None = None, limit: int = 100) -> 'builtins.list[Product]':
+        """Возвращает страницу товаров из обернутого репозитория.
+
+        Args:
+            after_id: ID последнего товара предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+
+        Returns:
+            Товары страницы в порядке ID.
+        """
+        return self.repository.page(after_id=after_id, limit=limit)
+
+    def reserve(self, quantities: 'Mapping[int, int]') -> set[int]:
+        """Резервирует товары в базовом репозитории.
+
+        Измененные записи инвалидируются Unit of Work при commit() или rollback().
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+
+        Returns:
+            ID товаров, для которых остаток уменьшен.
+        """
+        return self.repository.reserve(quantities)
+
+    def release(self, quantities: 'Mapping[int, int]') -> None:
+        """Возвращает товары на склад через базовый репозиторий.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+        """
+        self.repository.release(quantities)
+
+    def invalidate(self, product_ids: 'Iterable[int]') -> None:
+        """Удаляет из кэша записи указанных товаров.
+
+        Args:
+            product_ids: Идентификаторы измененных товаров.
+        """
+        with self._lock:
+            for product_id in product_ids:
+                self._loading.pop(product_id, None)
+                if self._entries.pop(product_id, None) is not None:
+                    self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Очищает кэш, не сбрасывая счетчики."""
+        with self._lock:
+            self._entries.clear()
+            self._loading.clear()
+
+    def _uses_cache(self, product_id: int) -> bool:
+        """Проверяет, можно ли читать товар из кэша и сохранять его туда в текущей сессии.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            False, если сессия работает в Unit of Work только для чтения или товар
+            изменен в ее незафиксированной транзакции.
+        """
+        if self.session is None:
+            return True
+        session = self.session() if isinstance(self.session, scoped_session) else self.session
+        return not (is_read_only(session) or has_uncommitted_product_write(session, product_id))
+
+    def _lookup(self, product_id: int) -> 'Product | None':
+        """Ищет товар в кэше и обновляет счетчики. Вызывается под блокировкой.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Закэшированный товар или None при промахе.
+        """
+        entry = self._entries.get(product_id)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        product, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[product_id]
+            self._stats.evictions += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(product_id)
+        self._stats.hits += 1
+        return product
+
+    def _store(self, product_id: int, product: 'Product') -> None:
+        """Сохраняет товар в кэш, вытесняя самые старые записи. Вызывается под блокировкой.
+
+        Args:
+            product_id: Идентификатор товара.
+            product: Товар для сохранения.
+        """
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else float('inf')
+        self._entries[product_id] = (product, expires_at)
+        self._entries.move_to_end(product_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
@@ -0,0 +1,224 @@
+"""Колоночный снимок каталога товаров для быстрых агрегатов."""
+
+import math
+from array import array
+from bisect import bisect_right
+from itertools import compress
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from warehouse_management.infrastructure.orm import ProductORM
+from warehouse_management.infrastructure.queries import check_positive
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
+
+_SNAPSHOT_COLUMNS = (ProductORM.id, ProductORM.name, ProductORM.quantity, ProductORM.price, ProductORM.updated_at)
+
+
+class ProductCatalogSnapshot:
+    """Снимок каталога товаров в компактных колонках `array`.
+
+    ID, остатки и цены хранятся в типизированных массивах (8 байт на значение)
+    вместо объекта `Product` на каждую строку; агрегаты считаются встроенными
+    функциями над массивами без создания промежуточных объектов.
+
+    `refresh()` догружает только строки, у которых `updated_at` не меньше
+    максимального значения из предыдущей загрузки. Изменения транзакций,
+    зафиксированных позже, но с более ранней отметкой времени, попадут в снимок
+    только при полной перезагрузке через `load()`. Удаленные товары не оставляют
+    строк с отметкой времени, поэтому `refresh()` дополнительно сверяет ID снимка
+    со столбцом `id` таблицы и убирает отсутствующие товары из колонок.
+    """
+
+    def __init__(self, session: 'Session', batch_size: int = 10_000) -> None:
+        """Инициализирует пустой снимок.
+
+        Args:
+            session: Экземпляр SQLAlchemy-сессии.
+            batch_size: Количество строк, получаемых из курсора за один раз.
+
+        Raises:
+            ValueError: Если `batch_size` меньше 1.
+        """
+        check_positive(batch_size, 'Batch size')
+        self.session = session
+        self.batch_size = batch_size
+        self.ids = array('q')
+        self.quantities = array('q')
+        self.prices = array('d')
+        self.names: list[str] = []
+        self.index_by_name: dict[str, int] = {}
+        self._index_by_id: dict[int, int] = {}
+        self._watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        """Возвращает количество товаров в снимке."""
+        return len(self.ids)
+
+    def load(self) -> None:
+        """Полностью перезагружает снимок из базы данных."""
+        self.ids = array('q')
+        self.quantities = array('q')
+        self.prices = array('d')
+        self.names = []
+        self.index_by_name = {}
+        self._index_by_id = {}
+        self._watermark = None
+        self._apply(select(*_SNAPSHOT_COLUMNS).order_by(ProductORM.id))
+
+    def refresh(self) -> int:
+        """Догружает товары, добавленные или измененные после предыдущей загрузки, и убирает удаленные.
+
+        Если снимок еще не загружался, выполняется полная загрузка.
+
+        Returns:
+            Количество прочитанных строк товаров (без строк сверки ID).
+        """
+        if self._watermark is None:
+            self.load()
+            return len(self)
+        statement = select(*_SNAPSHOT_COLUMNS).where(ProductORM.updated_at >= self._watermark).order_by(ProductORM.id)
+        rows = self._apply(statement)
+        if deleted_ids := self._deleted_ids():
+            self._remove(deleted_ids)
+        return rows
+
+    def index_of(self, name: str) -> int | None:
+        """Возвращает позицию товара в колонках по названию.
+
+        При совпадении названий возвращается позиция последнего загруженного товара.
+
+        Args:
+            name: Название товара.
+
+        Returns:
+            Позиция товара или None, если товар отсутствует.
+        """
+        return self.index_by_name.get(name)
+
+    def total_stock_value(self) -> float:
+        """Возвращает стоимость всех остатков на складе (сумма `quantity * price`)."""
+        return math.sumprod(self.quantities, self.prices)
+
+    def price_histogram(self, edges: 'Sequence[float]') -> list[int]:
+        """Считает количество товаров в ценовых интервалах.
+
+        Интервалы полуоткрытые `[edges[i], edges[i + 1])`, последний включает правую границу,
+        как в `numpy.histogram`. Цены вне `[edges[0], edges[-1]]` не учитываются.
+
+        Args:
+            edges: Возрастающие границы интервалов (не меньше двух).
+
+        Returns:
+            Количество товаров в каждом из `len(edges) - 1` интервалов.
+
+        Raises:
+            ValueError: Если границ меньше двух или они не возрастают.
+        """
+        if len(edges) < 2 or any(left >= right for left, right in zip(edges, edges[1:], strict=False)):  # noqa: PLR2004
+            raise ValueError('Histogram edges must be an increasing sequence of at least two values')
+
+        counts = [0] * (len(edges) - 1)
+        last = len(counts) - 1
+        low, high = edges[0], edges[-1]
+        for price in self.prices:
+            if low <= price <= high:
+                counts[min(bisect_right(edges, price) - 1, last)] += 1
+        return counts
+
+    def low_stock_mask(self, threshold: int) -> array[int]:
+        """Возвращает маску товаров с остатком ниже порога.
+
+        Args:
+            threshold: Порог остатка.
+
+        Returns:
+            Массив из 0 и 1 в порядке колонок снимка.
+        """
+        return array('B', (quantity < threshold for quantity in self.quantities))
+
+    def low_stock_ids(self, threshold: int) -> list[int]:
+        """Возвращает ID товаров с остатком ниже порога.
+
+        Args:
+            threshold: Порог остатка.
+
+        Returns:
+            ID товаров в порядке колонок снимка.
+        """
+        return list(compress(self.ids, self.low_stock_mask(threshold)))
+
+    def _deleted_ids(self) -> set[int]:
+        """Находит товары снимка, отсутствующие в базе.
+
+        ID из базы читаются по возрастанию и сливаются с отсортированными ID снимка,
+        поэтому в памяти не строится множество всех ID каталога.
+
+        Returns:
+            ID удаленных товаров.
+        """
+        known = sorted(self._index_by_id)
+        deleted: set[int] = set()
+        position = 0
+        statement = select(ProductORM.id).order_by(ProductORM.id).execution_options(yield_per=self.batch_size)
+        for product_id in self.session.scalars(statement):
+            while position < len(known) and known[position] < product_id:
+                deleted.add(known[position])
+                position += 1
+            if position < len(known) and known[position] == product_id:
+                position += 1
+        deleted.update(known[position:])
+        return deleted
+
+    def _remove(self, product_ids: set[int]) -> None:
+        """Удаляет товары из колонок и перестраивает индексы.
+
+        Args:
+            product_ids: ID удаляемых товаров.
+        """
+        keep = array('B', (product_id not in product_ids for product_id in self.ids))
+        self.ids = array('q', compress(self.ids, keep))
+        self.quantities = array('q', compress(self.quantities, keep))
+        self.prices = array('d', compress(self.prices, keep))
+        self.names = list(compress(self.names, keep))
+        self._index_by_id = {product_id: index for index, product_id in enumerate(self.ids)}
+        self.index_by_name = {name: index for index, name in enumerate(self.names)}
+
+    def _apply(self, statement: 'Select[tuple[int, str, int, float, datetime]]') -> int:
+        """Применяет строки запроса к колонкам: обновляет известные товары и добавляет новые.
+
+        Args:
+            statement: Запрос колонок `id, name, quantity, price, updated_at`.
+
+        Returns:
+            Количество прочитанных строк.
+        """
+        rows = 0
+        for product_id, name, quantity, price, updated_at in self.session.execute(
+            statement.execution_options(yield_per=self.batch_size)
+        ):
+            rows += 1
+            index = self._index_by_id.get(product_id)
+            if index is None:
+                index = self._index_by_id[product_id] = len(self.ids)
+                self.ids.append(product_id)
+                self.quantities.append(quantity)
+                self.prices.append(price)
+                self.names.append(name)
+            else:
+                self.quantities[index] = quantity
+                self.prices[index] = price
+                if self.names[index] != name:
+                    if self.index_by_name.get(self.names[index]) == index:
+                        del self.index_by_name[self.names[index]]
+                    self.names[index] = name
+            self.index_by_name[name] = index
+            if self._watermark is None or updated_at > self._watermark:
+                self._watermark = updated_at
+        return rows
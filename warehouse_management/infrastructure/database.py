@@ -1,36 +1,305 @@
-"""Модуль для инициализации базы данных и управления соединением."""
+"""Модуль для инициализации базы данных и управления соединением.
 
-from typing import TYPE_CHECKING
+Движки создаются лениво при первом обращении и переиспользуются для одинаковых
+настроек. После `fork()` дочерний процесс сбрасывает пулы соединений, унаследованные
+от родителя, поэтому воркеры можно запускать по модели pre-fork.
 
-from dependency_injector.wiring import inject, Provide
-from sqlalchemy import create_engine
+Если в настройках заданы реплики, `ReplicaRouter` распределяет между ними
+Unit of Work только для чтения по кругу, пропуская недоступные реплики.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, cast, TYPE_CHECKING, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import sessionmaker
 
-from warehouse_management.container import AppContainer
-from warehouse_management.infrastructure.orm import Base
+from warehouse_management.infrastructure.migrations import upgrade
+from warehouse_management.settings import DatabaseSettings
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Engine
+    from collections.abc import Callable, Sequence
+
+    from sqlalchemy.engine import Engine, URL
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.settings import SqliteSettings
+
+logger = logging.getLogger(__name__)
+
+_engines: dict[str, 'Engine | AsyncEngine'] = {}
+_engines_lock = threading.Lock()
 
+_EngineT = TypeVar('_EngineT', 'Engine', AsyncEngine)
 
-@inject
-def get_engine(database_url: str = Provide[AppContainer.config.database.url]) -> 'Engine':
-    """Создает движок базы данных с использованием зависимости из контейнера.
+
+def get_engine(settings: 'DatabaseSettings | None' = None) -> 'Engine':
+    """Возвращает движок для настроек, создавая его при первом обращении.
+
+    Для одинаковых настроек возвращается один и тот же движок с общим пулом соединений.
 
     Args:
-        database_url: URL базы данных, полученный из DI-контейнера.
+        settings: Настройки базы данных; по умолчанию читаются из переменных окружения.
 
     Returns:
         Экземпляр SQLAlchemy Engine.
     """
-    return create_engine(database_url)
+    settings = settings or DatabaseSettings()
+    return registered_engine(settings.model_dump_json(), lambda: create_database_engine(settings))
+
+
+def registered_engine(key: str, create: 'Callable[[], _EngineT]') -> '_EngineT':
+    """Возвращает движок из общего реестра, создавая его при первом обращении.
+
+    Реестр общий для синхронных и асинхронных движков: все они закрываются
+    `dispose_engines()` и сбрасываются в дочернем процессе после `fork()`.
+
+    Args:
+        key: Ключ движка в реестре.
+        create: Функция, создающая движок, если его еще нет в реестре.
+
+    Returns:
+        Движок, зарегистрированный под ключом `key`.
+    """
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = create()
+    return cast('_EngineT', engine)
+
+
+def create_database_engine(settings: 'DatabaseSettings') -> 'Engine':
+    """Создает новый движок базы данных с настройками пула и PRAGMA для SQLite.
+
+    Args:
+        settings: Настройки базы данных.
+
+    Returns:
+        Экземпляр SQLAlchemy Engine.
+    """
+    url = make_url(settings.url)
+    engine = create_engine(url, **engine_options(settings, url))
+    if url.get_backend_name() == 'sqlite':
+        register_sqlite_pragmas(engine, settings.sqlite)
+    return engine
+
+
+def get_engine_for_url(settings: 'DatabaseSettings', url: str) -> 'Engine':
+    """Возвращает движок другой базы (реплики или шарда) с теми же параметрами пула и PRAGMA.
+
+    Args:
+        settings: Настройки основной базы данных.
+        url: URL базы данных.
+
+    Returns:
+        Экземпляр SQLAlchemy Engine.
+    """
+    return get_engine(settings.model_copy(update={'url': url, 'replica_urls': []}))
+
+
+def get_replica_router(primary: 'Engine', settings: 'DatabaseSettings') -> 'ReplicaRouter | None':
+    """Создает маршрутизатор чтения по репликам из настроек.
+
+    Движки реплик создаются с теми же параметрами пула, что и основной движок.
+
+    Args:
+        primary: Движок основной базы, на которую переключается чтение, если все реплики недоступны.
+        settings: Настройки базы данных.
+
+    Returns:
+        Маршрутизатор или None, если реплики не заданы.
+    """
+    if not settings.replica_urls:
+        return None
+    replicas = [get_engine_for_url(settings, url) for url in settings.replica_urls]
+    return ReplicaRouter(primary, replicas, settings.replica_health_check_interval_s)
+
+
+class ReplicaRouter:
+    """Выбирает движок реплики для чтения по кругу с проверкой доступности.
+
+    Доступность реплики проверяется запросом `SELECT 1` не чаще одного раза за
+    `health_check_interval_s`; недоступная реплика пропускается до следующей проверки.
+    Если недоступны все реплики, возвращается основной движок.
+    """
+
+    def __init__(self, primary: 'Engine', replicas: 'Sequence[Engine]', health_check_interval_s: float = 30.0) -> None:
+        """Инициализирует маршрутизатор.
+
+        Args:
+            primary: Движок основной базы.
+            replicas: Движки реплик.
+            health_check_interval_s: Интервал между проверками доступности реплики, секунд.
+
+        Raises:
+            ValueError: Если не задано ни одной реплики.
+        """
+        if not replicas:
+            raise ValueError('At least one replica engine is required')
+
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.health_check_interval_s = health_check_interval_s
+        self._next = 0
+        # Время последней проверки и ее результат для каждой реплики.
+        self._health: dict[Engine, tuple[float, bool]] = {}
+        self._lock = threading.Lock()
+
+    def engine(self) -> 'Engine':
+        """Возвращает следующую доступную реплику или основной движок.
+
+        Returns:
+            Движок для Unit of Work только для чтения.
+        """
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self.replicas)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if self._is_healthy(replica):
+                return replica
+        logger.warning('No read replica is available, reading from the primary database')
+        return self.primary
+
+    def _is_healthy(self, replica: 'Engine') -> bool:
+        """Проверяет доступность реплики, если с прошлой проверки прошел интервал.
+
+        Args:
+            replica: Движок реплики.
+
+        Returns:
+            True, если реплика доступна.
+        """
+        now = time.monotonic()
+        with self._lock:
+            checked_at, healthy = self._health.get(replica, (None, True))
+        if checked_at is not None and now - checked_at < self.health_check_interval_s:
+            return healthy
+
+        try:
+            with replica.connect() as connection:
+                connection.exec_driver_sql('SELECT 1')
+            healthy = True
+        except SQLAlchemyError as error:
+            logger.warning('Read replica %s is unavailable: %s', replica.url.render_as_string(), error)
+            healthy = False
+        with self._lock:
+            self._health[replica] = (now, healthy)
+        return healthy
+
+
+def dispose_engines() -> None:
+    """Закрывает соединения всех созданных движков и забывает их.
+
+    Пулы асинхронных движков только сбрасываются: закрыть их соединения можно
+    лишь из цикла событий через `await engine.dispose()`.
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        if isinstance(engine, AsyncEngine):
+            engine.sync_engine.dispose(close=False)
+        else:
+            engine.dispose()
+
 
+def _reset_engines_after_fork() -> None:
+    """Сбрасывает унаследованные от родителя пулы соединений в дочернем процессе.
 
-engine = get_engine()
+    Соединения родителя не закрываются (`close=False`), чтобы не нарушить его работу;
+    движки остаются пригодными и при следующем обращении открывают новые соединения.
+    Для асинхронных движков сбрасывается пул их синхронного движка.
+    """
+    global _engines_lock  # noqa: PLW0603
+    # Блокировка могла быть захвачена другим потоком родителя в момент fork().
+    _engines_lock = threading.Lock()
+    for engine in _engines.values():
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        sync_engine.dispose(close=False)
 
-SessionFactory = sessionmaker(bind=engine)
 
+def engine_options(settings: 'DatabaseSettings', url: 'URL') -> dict[str, Any]:
+    """Формирует параметры `create_engine()` из настроек.
 
-def init_db() -> None:
-    """Инициализирует базу данных, создавая таблицы, если они отсутствуют."""
-    Base.metadata.create_all(engine)
+    Параметры размера пула не передаются для SQLite в памяти: такая база
+    существует только в рамках одного соединения и использует специальный пул.
+
+    Args:
+        settings: Настройки базы данных.
+        url: Разобранный URL базы данных.
+
+    Returns:
+        Именованные аргументы для `create_engine()` или `create_async_engine()`.
+    """
+    options: dict[str, Any] = {
+        'echo': settings.echo,
+        'pool_pre_ping': settings.pool_pre_ping,
+        'pool_recycle': settings.pool_recycle,
+    }
+    if not (url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')):
+        options.update(
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+        )
+    return options
+
+
+def register_sqlite_pragmas(engine: 'Engine', settings: 'SqliteSettings') -> None:
+    """Подписывает движок на применение PRAGMA к каждому новому соединению SQLite.
+
+    Args:
+        engine: Синхронный движок (для асинхронного передается `AsyncEngine.sync_engine`).
+        settings: Настройки PRAGMA.
+    """
+    pragmas = (
+        f'PRAGMA journal_mode = {settings.journal_mode}',
+        f'PRAGMA synchronous = {settings.synchronous}',
+        f'PRAGMA busy_timeout = {settings.busy_timeout_ms:d}',
+        f'PRAGMA cache_size = {settings.cache_size:d}',
+        f'PRAGMA mmap_size = {settings.mmap_size:d}',
+        f'PRAGMA foreign_keys = {"ON" if settings.foreign_keys else "OFF"}',
+    )
+
+    def apply_pragmas(dbapi_connection: Any, _connection_record: object) -> None:  # noqa: ANN401
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    event.listen(engine, 'connect', apply_pragmas)
+
+
+def get_session_factory(engine: 'Engine', expire_on_commit: bool = False) -> 'sessionmaker[Session]':
+    """Создает фабрику сессий.
+
+    Args:
+        engine: Движок базы данных.
+        expire_on_commit: Сбрасывать ли состояние объектов после commit().
+
+    Returns:
+        Фабрика SQLAlchemy-сессий.
+    """
+    return sessionmaker(bind=engine, expire_on_commit=expire_on_commit)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_engines_after_fork)
+
+
+def init_db(settings: 'DatabaseSettings | None' = None) -> None:
+    """Инициализирует базу данных: создает отсутствующие таблицы и применяет миграции схемы.
+
+    Args:
+        settings: Настройки базы данных; по умолчанию читаются из переменных окружения.
+    """
+    upgrade(get_engine(settings))
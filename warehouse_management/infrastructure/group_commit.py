@@ -0,0 +1,234 @@
+"""Групповая фиксация: операции многих вызывающих в одной физической транзакции.
+
+Каждая фиксация транзакции SQLite — это fsync, поэтому при большом потоке мелких
+записей (например, заказов из одной строки) пропускная способность ограничена
+задержкой commit(). `GroupCommitUnitOfWork` принимает операции из любых потоков,
+выполняет их в фоновом потоке пакетами по `max_batch_size` операций или за
+`max_delay_ms` миллисекунд с первой операции пакета и фиксирует пакет одним commit().
+
+Каждая операция выполняется в собственной точке сохранения (SAVEPOINT): ошибка одной
+операции откатывает только ее изменения, а исключение передается в ее `Future`.
+Результаты остальных операций передаются в их `Future` только после успешной
+фиксации пакета; если фиксация не удалась, все операции пакета завершаются ее ошибкой.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING, TypeVar
+
+from warehouse_management.infrastructure.queries import check_positive
+from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Self
+
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.infrastructure.cache import CachedProductRepository
+    from warehouse_management.infrastructure.instrumentation import SqlInstrumentation
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar('_T')
+
+
+@dataclass(slots=True)
+class _PendingOperation:
+    """Операция, ожидающая выполнения в пакете."""
+
+    operation: 'Callable[[Session], Any]'
+    future: 'Future[Any]'
+
+
+class GroupCommitUnitOfWork:
+    """Unit of Work с групповой фиксацией операций конкурентных вызывающих.
+
+    Операция — функция, принимающая сессию пакета; внутри нее создаются репозитории
+    или сервисы, привязанные к этой сессии. Вызывать commit() или rollback() сессии
+    в операции нельзя.
+
+    Пример:
+
+        future = group_commit.submit(lambda session: SqlAlchemyOrderRepository(session).add(order))
+        future.result()  # заказ зафиксирован
+    """
+
+    def __init__(
+        self,
+        session_factory: 'Callable[[], Session]',
+        max_batch_size: int = 100,
+        max_delay_ms: float = 5.0,
+        product_cache: 'CachedProductRepository | None' = None,
+        instrumentation: 'SqlInstrumentation | None' = None,
+    ) -> None:
+        """Инициализирует Unit of Work и запускает фоновый поток фиксации.
+
+        Args:
+            session_factory: Фабрика сессий; для каждого пакета создается новая сессия.
+            max_batch_size: Максимальное количество операций в одной транзакции.
+            max_delay_ms: Сколько миллисекунд пакет ожидает новых операций после первой.
+            product_cache: Кэш товаров, записи которого инвалидируются после фиксации пакета.
+            instrumentation: Инструментирование SQL-запросов движка сессий.
+
+        Raises:
+            ValueError: Если `max_batch_size` меньше 1 или `max_delay_ms` отрицательное.
+        """
+        check_positive(max_batch_size, 'Max batch size')
+        if max_delay_ms < 0:
+            raise ValueError('Max delay must not be negative')
+
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_delay_ms = max_delay_ms
+        self.product_cache = product_cache
+        self.instrumentation = instrumentation
+        self._queue: queue.SimpleQueue[_PendingOperation | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='group-commit', daemon=True)
+        self._worker.start()
+
+    def __enter__(self) -> 'Self':
+        """Возвращает текущий экземпляр для использования в `with`.
+
+        Returns:
+            Текущий экземпляр Unit of Work.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: object | None
+    ) -> None:
+        """Фиксирует принятые операции и останавливает фоновый поток.
+
+        Args:
+            exc_type: Тип исключения.
+            exc_value: Объект исключения.
+            traceback: Трассировка исключения.
+        """
+        self.close()
+
+    def submit(self, operation: 'Callable[[Session], _T]') -> 'Future[_T]':
+        """Ставит операцию в очередь ближайшего пакета.
+
+        Args:
+            operation: Функция, выполняющая изменения в переданной сессии.
+
+        Returns:
+            Future с результатом операции, доступным после фиксации пакета.
+
+        Raises:
+            RuntimeError: Если Unit of Work закрыт.
+        """
+        future: Future[_T] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Group commit unit of work is closed')
+            self._queue.put(_PendingOperation(operation, future))
+        return future
+
+    def run(self, operation: 'Callable[[Session], _T]') -> '_T':
+        """Выполняет операцию в ближайшем пакете и ожидает его фиксации.
+
+        Args:
+            operation: Функция, выполняющая изменения в переданной сессии.
+
+        Returns:
+            Результат операции.
+        """
+        return self.submit(operation).result()
+
+    def close(self) -> None:
+        """Фиксирует уже принятые операции и останавливает фоновый поток.
+
+        Повторный вызов ничего не делает.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        """Собирает операции из очереди в пакеты и фиксирует их до получения сигнала остановки."""
+        stopping = False
+        while not stopping:
+            pending = self._queue.get()
+            if pending is None:
+                break
+            batch = [pending]
+            deadline = time.monotonic() + self.max_delay_ms / 1000
+            while len(batch) < self.max_batch_size:
+                try:
+                    pending = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: 'list[_PendingOperation]') -> None:
+        """Выполняет операции пакета в точках сохранения одной транзакции и фиксирует ее.
+
+        Future всех операций, включая завершившиеся ошибкой, получают результат только
+        после фиксации или отката пакета: до этого вызывающий не узнает об ошибке своей
+        операции, пока транзакция пакета еще открыта.
+
+        Args:
+            batch: Операции пакета в порядке поступления.
+        """
+        completed: list[tuple[Future[Any], Any]] = []
+        failed: dict[Future[Any], Exception] = {}
+        try:
+            with (
+                self.session_factory() as session,
+                SqlAlchemyUnitOfWork(session, self.product_cache, self.instrumentation),
+            ):
+                begin_write_transaction(session)
+                for pending in batch:
+                    if not pending.future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with session.begin_nested():
+                            result = pending.operation(session)
+                    except Exception as error:
+                        failed[pending.future] = error
+                    else:
+                        completed.append((pending.future, result))
+        except Exception as error:
+            logger.exception('Group commit of %d operations failed', len(batch))
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(failed.get(pending.future, error))
+            return
+
+        for future, operation_error in failed.items():
+            future.set_exception(operation_error)
+        for future, result in completed:
+            future.set_result(result)
+        logger.debug('Group commit: %d of %d operations committed', len(completed), len(batch))
+
+
+def begin_write_transaction(session: 'Session') -> None:
+    """Начинает транзакцию сессии на запись.
+
+    Драйвер `sqlite3` открывает транзакцию неявно только перед INSERT, UPDATE и DELETE,
+    поэтому SAVEPOINT в начале пакета открыл бы собственную транзакцию, а его RELEASE
+    зафиксировал бы изменения раньше общего commit(). Для SQLite транзакция открывается
+    явно командой `BEGIN IMMEDIATE`, которая сразу захватывает блокировку записи; для
+    остальных СУБД транзакцию открывает сама сессия.
+
+    Args:
+        session: Сессия, еще не выполнявшая запросов в текущей транзакции.
+    """
+    connection = session.connection()
+    if connection.dialect.name == 'sqlite' and not connection.connection.dbapi_connection.in_transaction:  # type: ignore[union-attr]
+        connection.exec_driver_sql('BEGIN IMMEDIATE')
@@ -0,0 +1,245 @@
+"""Назначение идентификаторов на клиенте блоками из таблицы последовательностей.
+
+Без аллокатора репозиторий узнает автоинкрементный ID только после INSERT, поэтому
+`add()` выполняет flush на каждую сущность, а `add_many()` в SQLite отправляет
+`INSERT ... RETURNING` построчно. Аллокатор резервирует в отдельной короткой
+транзакции блок из `block_size` значений (схема hi/lo в варианте pooled: в таблице
+`id_sequences` хранится следующее свободное значение) и выдает ID из блока в памяти;
+вставки откладываются до flush и отправляются пакетным `executemany`.
+
+SQLite допускает только одну пишущую транзакцию, поэтому, если сессия вызывающего
+уже держит транзакцию (после flush или `BEGIN IMMEDIATE` групповой фиксации), блок
+резервируется в ее соединении: отдельная транзакция ждала бы освобождения блокировки
+этой же сессией. Такой блок принадлежит сессии до фиксации ее транзакции и
+отбрасывается при откате, вместе с которым откатывается и резервирование.
+
+Если аллокатор включен, все вставки в таблицу должны получать ID из него: строка,
+вставленная с автоинкрементным ID, может занять значение из уже зарезервированного блока.
+"""
+
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event, func, insert, select, Table, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import scoped_session
+
+from warehouse_management.infrastructure.orm import Base, IdSequenceORM
+from warehouse_management.infrastructure.unit_of_work import holds_sqlite_write_transaction
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.orm import Session, SessionTransaction
+
+
+class IdAllocator(ABC):
+    """Источник идентификаторов, назначаемых сущностям до вставки в базу."""
+
+    @abstractmethod
+    def allocate(
+        self, sequence: str, count: int = 1, session: 'Session | scoped_session[Session] | None' = None
+    ) -> list[int]:
+        """Выдает новые уникальные идентификаторы.
+
+        Args:
+            sequence: Имя последовательности (имя таблицы).
+            count: Количество идентификаторов.
+            session: Сессия, в которой будут вставлены строки с выданными ID.
+
+        Returns:
+            Список из `count` возрастающих идентификаторов.
+        """
+        pass
+
+
+class SequenceIdAllocator(IdAllocator):
+    """Аллокатор, резервирующий блоки ID в таблице `id_sequences`.
+
+    Потокобезопасен: один экземпляр можно использовать из всех потоков процесса.
+    Несколько процессов получают непересекающиеся блоки. Неиспользованный остаток
+    блока теряется при перезапуске процесса или откате транзакции, в которой блок
+    зарезервирован, поэтому в ID возможны пропуски.
+    """
+
+    def __init__(self, engine: 'Engine', block_size: int = 100) -> None:
+        """Инициализирует аллокатор.
+
+        Args:
+            engine: Движок базы данных; блоки резервируются в отдельных соединениях пула,
+                кроме случая, когда сессия вызывающего уже держит транзакцию SQLite.
+            block_size: Количество ID, резервируемых одним запросом к базе.
+
+        Raises:
+            ValueError: Если `block_size` меньше 1.
+        """
+        if block_size < 1:
+            raise ValueError('Block size must be a positive integer')
+
+        self.engine = engine
+        self.block_size = block_size
+        # Зафиксированные блоки, доступные всем сессиям.
+        self._blocks: dict[str, list[range]] = {}
+        # Блоки, зарезервированные в еще не зафиксированных транзакциях сессий.
+        self._session_blocks: weakref.WeakKeyDictionary[Session, dict[str, list[range]]] = weakref.WeakKeyDictionary()
+        # Повторно входимая: события завершения транзакции сессии могут сработать во время резервирования.
+        self._lock = threading.RLock()
+
+    def allocate(
+        self, sequence: str, count: int = 1, session: 'Session | scoped_session[Session] | None' = None
+    ) -> list[int]:
+        """Выдает ID из зарезервированного блока, резервируя новые блоки по мере необходимости.
+
+        Args:
+            sequence: Имя таблицы, для которой выдаются ID.
+            count: Количество идентификаторов.
+            session: Сессия, в которой будут вставлены строки; если она держит транзакцию
+                SQLite, новый блок резервируется в этой транзакции.
+
+        Returns:
+            Список из `count` возрастающих идентификаторов.
+        """
+        if isinstance(session, scoped_session):
+            session = session()
+        ids: list[int] = []
+        with self._lock:
+            own_blocks = self._session_blocks.get(session, {}) if session is not None else {}
+            _take(own_blocks.get(sequence, []), count, ids)
+            _take(self._blocks.setdefault(sequence, []), count, ids)
+            while len(ids) < count:
+                size = max(self.block_size, count - len(ids))
+                if session is not None and holds_sqlite_write_transaction(session):
+                    block = _reserve(session.connection(), sequence, size)
+                    self._own_blocks(session).setdefault(sequence, []).append(block)
+                    _take(self._own_blocks(session)[sequence], count, ids)
+                else:
+                    self._blocks[sequence].append(self._reserve(sequence, size))
+                    _take(self._blocks[sequence], count, ids)
+        return ids
+
+    def _reserve(self, sequence: str, size: int) -> range:
+        """Резервирует блок ID в отдельной транзакции.
+
+        Args:
+            sequence: Имя таблицы.
+            size: Размер блока.
+
+        Returns:
+            Диапазон зарезервированных ID.
+        """
+        while True:
+            try:
+                with self.engine.begin() as connection:
+                    return _reserve(connection, sequence, size)
+            except IntegrityError:
+                # Строку последовательности одновременно создал другой процесс: повторяем через UPDATE.
+                continue
+
+    def _own_blocks(self, session: 'Session') -> dict[str, list[range]]:
+        """Возвращает блоки транзакции сессии, подписываясь на завершение ее транзакций.
+
+        Args:
+            session: Сессия вызывающего.
+
+        Returns:
+            Блоки сессии по именам последовательностей.
+        """
+        if session not in self._session_blocks:
+            self._session_blocks[session] = {}
+            if not event.contains(session, 'after_commit', self._publish_session_blocks):
+                event.listen(session, 'after_commit', self._publish_session_blocks)
+                event.listen(session, 'after_soft_rollback', self._discard_session_blocks)
+                event.listen(session, 'after_transaction_end', self._discard_on_close)
+        return self._session_blocks[session]
+
+    def _publish_session_blocks(self, session: 'Session') -> None:
+        """Передает остаток блоков зафиксированной транзакции в общий пул.
+
+        Args:
+            session: Сессия, зафиксировавшая транзакцию.
+        """
+        with self._lock:
+            for sequence, blocks in self._session_blocks.pop(session, {}).items():
+                self._blocks.setdefault(sequence, []).extend(block for block in blocks if block)
+
+    def _discard_session_blocks(self, session: 'Session', _previous_transaction: 'SessionTransaction') -> None:
+        """Отбрасывает блоки сессии при откате транзакции или точки сохранения.
+
+        Блок мог быть зарезервирован в откатываемой точке сохранения, поэтому
+        остаток отбрасывается целиком.
+
+        Args:
+            session: Сессия, выполнившая откат.
+            _previous_transaction: Откатываемая транзакция (не используется).
+        """
+        with self._lock:
+            self._session_blocks.pop(session, None)
+
+    def _discard_on_close(self, session: 'Session', transaction: 'SessionTransaction') -> None:
+        """Отбрасывает блоки сессии, если внешняя транзакция завершилась без фиксации.
+
+        Args:
+            session: Сессия.
+            transaction: Завершившаяся транзакция.
+        """
+        if transaction.parent is None:
+            self._discard_session_blocks(session, transaction)
+
+
+def _take(blocks: list[range], count: int, ids: list[int]) -> None:
+    """Переносит ID из блоков в `ids`, пока их меньше `count`, удаляя исчерпанные блоки.
+
+    Args:
+        blocks: Блоки последовательности.
+        count: Требуемое количество ID.
+        ids: Уже выданные ID.
+    """
+    while blocks and len(ids) < count:
+        taken = blocks[0][: count - len(ids)]
+        ids.extend(taken)
+        blocks[0] = blocks[0][len(taken) :]
+        if not blocks[0]:
+            blocks.pop(0)
+
+
+def _reserve(connection: 'Connection', sequence: str, size: int) -> range:
+    """Резервирует блок ID в транзакции соединения.
+
+    Первое резервирование создает строку последовательности, начиная ее с
+    максимального ID таблицы плюс один.
+
+    Args:
+        connection: Соединение с открытой транзакцией.
+        sequence: Имя таблицы.
+        size: Размер блока.
+
+    Returns:
+        Диапазон зарезервированных ID.
+    """
+    # UPDATE выполняется первым, чтобы сразу получить блокировку записи.
+    bumped = connection.execute(
+        update(IdSequenceORM).where(IdSequenceORM.name == sequence).values(next_value=IdSequenceORM.next_value + size)
+    ).rowcount
+    if bumped:
+        end: int = connection.execute(
+            select(IdSequenceORM.next_value).where(IdSequenceORM.name == sequence)
+        ).scalar_one()
+        return range(end - size, end)
+    start = _max_id(connection, sequence) + 1
+    connection.execute(insert(IdSequenceORM).values(name=sequence, next_value=start + size))
+    return range(start, start + size)
+
+
+def _max_id(connection: 'Connection', table_name: str) -> int:
+    """Возвращает максимальный ID таблицы или 0 для пустой таблицы.
+
+    Args:
+        connection: Соединение с открытой транзакцией.
+        table_name: Имя таблицы с колонкой `id`.
+
+    Returns:
+        Максимальный идентификатор.
+    """
+    table: Table = Base.metadata.tables[table_name]
+    return connection.scalar(select(func.coalesce(func.max(table.c.id), 0))) or 0
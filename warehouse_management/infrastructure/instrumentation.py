@@ -0,0 +1,147 @@
+"""Инструментирование SQL-запросов: статистика Unit of Work, журнал медленных запросов и поиск N+1.
+
+`SqlInstrumentation` подписывается на события выполнения запросов движка и учитывает
+каждый запрос в статистике того Unit of Work, который активен в текущем потоке или
+задаче (`contextvars`), поэтому один движок могут использовать несколько потоков.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Connection, Engine, ExceptionContext
+    from sqlalchemy.engine.interfaces import DBAPICursor
+
+logger = logging.getLogger(__name__)
+
+# Ключ `Connection.info` для стека отметок времени начала выполняемых запросов.
+_QUERY_STARTED_AT = 'query_started_at'
+
+_current_stats: 'ContextVar[QueryStats | None]' = ContextVar('current_query_stats', default=None)
+
+
+@dataclass
+class QueryStats:
+    """Статистика SQL-запросов одного Unit of Work.
+
+    Attributes:
+        statements: Количество выполненных запросов (пакетный `executemany` считается одним запросом).
+        rows: Количество строк, затронутых INSERT, UPDATE и DELETE по данным драйвера; для SELECT
+            DB-API не сообщает число строк до их чтения, поэтому такие строки не учитываются.
+        duration_s: Суммарное время выполнения запросов драйвером, секунд.
+        statement_counts: Количество выполнений каждого параметризованного запроса.
+        slow_statements: Запросы дольше порога и время их выполнения, секунд.
+        repeated_statements: Запросы, выполненные больше допустимого числа раз (вероятный N+1);
+            заполняется по завершении Unit of Work.
+    """
+
+    statements: int = 0
+    rows: int = 0
+    duration_s: float = 0.0
+    statement_counts: Counter[str] = field(default_factory=Counter)
+    slow_statements: list[tuple[str, float]] = field(default_factory=list)
+    repeated_statements: dict[str, int] = field(default_factory=dict)
+
+
+class SqlInstrumentation:
+    """Счетчики SQL-запросов движка с разбивкой по Unit of Work.
+
+    Запросы дольше `slow_query_threshold_ms` записываются в журнал с уровнем WARNING
+    независимо от того, выполняются ли они внутри Unit of Work. Запрос, выполненный
+    в одном Unit of Work больше `n_plus_one_threshold` раз, отмечается как вероятный N+1.
+    """
+
+    def __init__(
+        self, engine: 'Engine', slow_query_threshold_ms: float | None = None, n_plus_one_threshold: int = 10
+    ) -> None:
+        """Инициализирует инструментирование и подписывается на события движка.
+
+        Args:
+            engine: Движок базы данных.
+            slow_query_threshold_ms: Порог времени выполнения запроса, мс, или None, чтобы не вести журнал.
+            n_plus_one_threshold: Сколько раз один запрос может выполниться в Unit of Work без предупреждения.
+
+        Raises:
+            ValueError: Если `n_plus_one_threshold` меньше 1 или порог времени отрицательный.
+        """
+        if n_plus_one_threshold < 1:
+            raise ValueError('N+1 threshold must be a positive integer')
+        if slow_query_threshold_ms is not None and slow_query_threshold_ms < 0:
+            raise ValueError('Slow query threshold must not be negative')
+
+        self.engine = engine
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.listen(engine, 'handle_error', self._handle_error)
+
+    def close(self) -> None:
+        """Отписывается от событий движка."""
+        event.remove(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.remove(self.engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.remove(self.engine, 'handle_error', self._handle_error)
+
+    @contextmanager
+    def track(self) -> 'Iterator[QueryStats]':
+        """Учитывает запросы, выполненные в текущем потоке или задаче, в новой статистике.
+
+        При вложенных вызовах запросы учитываются только во внутренней статистике.
+
+        Yields:
+            Статистика, заполняемая по мере выполнения запросов.
+        """
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _current_stats.reset(token)
+            stats.repeated_statements = {
+                statement: count
+                for statement, count in stats.statement_counts.items()
+                if count > self.n_plus_one_threshold
+            }
+            for statement, count in stats.repeated_statements.items():
+                logger.warning('Possible N+1: statement executed %d times in one unit of work: %s', count, statement)
+            logger.debug(
+                'Unit of work executed %d statements, %d rows affected, %.3f s',
+                stats.statements,
+                stats.rows,
+                stats.duration_s,
+            )
+
+    def _before_cursor_execute(self, conn: 'Connection', *_args: Any) -> None:
+        conn.info.setdefault(_QUERY_STARTED_AT, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn: 'Connection', cursor: 'DBAPICursor', statement: str, *_args: Any) -> None:
+        elapsed = time.perf_counter() - conn.info[_QUERY_STARTED_AT].pop()
+        is_slow = self.slow_query_threshold_ms is not None and elapsed * 1000 >= self.slow_query_threshold_ms
+        if is_slow:
+            logger.warning('Slow query (%.1f ms): %s', elapsed * 1000, statement)
+
+        stats = _current_stats.get()
+        if stats is None:
+            return
+        stats.statements += 1
+        stats.rows += max(cursor.rowcount, 0)
+        stats.duration_s += elapsed
+        stats.statement_counts[statement] += 1
+        if is_slow:
+            stats.slow_statements.append((statement, elapsed))
+
+    def _handle_error(self, context: 'ExceptionContext') -> None:
+        # Запрос, завершившийся ошибкой, не доходит до after_cursor_execute.
+        if context.connection is not None and context.cursor is not None:
+            started_at = context.connection.info.get(_QUERY_STARTED_AT)
+            if started_at:
+                started_at.pop()
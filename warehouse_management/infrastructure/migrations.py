@@ -0,0 +1,195 @@
+"""Обновление схемы существующих баз данных до текущей версии ORM-моделей.
+
+Примененные миграции фиксируются в таблице `schema_migrations`. Новая база
+создается сразу в актуальной схеме и помечается как полностью обновленная;
+для существующей базы выполняются только недостающие миграции.
+
+Запуск из командной строки:
+
+    python -m warehouse_management.infrastructure.migrations
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, insert, inspect, MetaData, select, String, Table, text
+
+from warehouse_management.infrastructure.orm import Base
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+schema_migrations = Table(
+    'schema_migrations',
+    MetaData(),
+    Column('version', String(64), primary_key=True),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Шаг обновления схемы.
+
+    Attributes:
+        version: Уникальный идентификатор миграции; миграции применяются в порядке объявления.
+        description: Краткое описание изменений.
+        apply: Функция, выполняющая изменения в рамках переданного соединения.
+    """
+
+    version: str
+    description: str
+    apply: 'Callable[[Connection], None]'
+
+
+def _add_indexes_and_customer_fk(connection: 'Connection') -> None:
+    """Добавляет `orders.customer_id`, составной ключ таблицы связей и индексы.
+
+    SQLite не позволяет добавить первичный ключ к существующей таблице, поэтому
+    таблица связей пересоздается; повторяющиеся пары (order_id, product_id) объединяются
+    в одну строку, а число повторов сохраняется в колонке `quantity`.
+
+    Args:
+        connection: Соединение с открытой транзакцией.
+    """
+    inspector = inspect(connection)
+
+    if 'customer_id' not in {column['name'] for column in inspector.get_columns('orders')}:
+        connection.execute(text('ALTER TABLE orders ADD COLUMN customer_id INTEGER REFERENCES customers (id)'))
+
+    if inspector.has_table('order_product_associations'):
+        primary_key = inspector.get_pk_constraint('order_product_associations')['constrained_columns']
+        if primary_key != ['order_id', 'product_id']:
+            connection.execute(
+                text('ALTER TABLE order_product_associations RENAME TO order_product_associations_legacy')
+            )
+            connection.execute(
+                text(
+                    'CREATE TABLE order_product_associations ('
+                    'order_id INTEGER NOT NULL REFERENCES orders (id), '
+                    'product_id INTEGER NOT NULL REFERENCES products (id), '
+                    'quantity INTEGER NOT NULL DEFAULT 1, '
+                    'PRIMARY KEY (order_id, product_id))'
+                )
+            )
+            connection.execute(
+                text(
+                    'INSERT INTO order_product_associations (order_id, product_id, quantity) '
+                    'SELECT order_id, product_id, COUNT(*) FROM order_product_associations_legacy '
+                    'WHERE order_id IS NOT NULL AND product_id IS NOT NULL '
+                    'GROUP BY order_id, product_id'
+                )
+            )
+            connection.execute(text('DROP TABLE order_product_associations_legacy'))
+        connection.execute(
+            text(
+                'CREATE INDEX IF NOT EXISTS ix_order_product_associations_product_id '
+                'ON order_product_associations (product_id)'
+            )
+        )
+
+    # Индексы перечислены явно: последующие миграции добавляют колонки с собственными индексами.
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_products_name ON products (name)'))
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_orders_customer_id ON orders (customer_id)'))
+
+
+def _add_order_lines(connection: 'Connection') -> None:
+    """Переносит связи заказов с товарами в таблицу строк заказа `order_lines`.
+
+    Количество позиции берется из колонки `quantity`, которую миграция 0001 заполняет
+    числом повторов связи, а если колонки нет — принимается равным 1; цена за единицу
+    равна текущей цене товара. Таблица связей удаляется.
+
+    Args:
+        connection: Соединение с открытой транзакцией.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table('order_product_associations'):
+        return
+
+    columns = {column['name'] for column in inspector.get_columns('order_product_associations')}
+    quantity = 'a.quantity' if 'quantity' in columns else '1'
+    connection.execute(
+        text(
+            'INSERT INTO order_lines (order_id, product_id, quantity, unit_price) '
+            f'SELECT a.order_id, a.product_id, {quantity}, p.price '
+            'FROM order_product_associations AS a JOIN products AS p ON p.id = a.product_id'
+        )
+    )
+    connection.execute(text('DROP TABLE order_product_associations'))
+
+
+def _add_products_updated_at(connection: 'Connection') -> None:
+    """Добавляет `products.updated_at` и индекс по нему.
+
+    SQLite не позволяет добавить колонку с неконстантным значением по умолчанию,
+    поэтому существующие строки заполняются отдельным UPDATE.
+
+    Args:
+        connection: Соединение с открытой транзакцией.
+    """
+    if 'updated_at' not in {column['name'] for column in inspect(connection).get_columns('products')}:
+        connection.execute(text('ALTER TABLE products ADD COLUMN updated_at DATETIME'))
+        connection.execute(text('UPDATE products SET updated_at = CURRENT_TIMESTAMP'))
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_products_updated_at ON products (updated_at)'))
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version='0001_indexes_and_customer_fk',
+        description='orders.customer_id FK, composite PK on order_product_associations, lookup indexes',
+        apply=_add_indexes_and_customer_fk,
+    ),
+    Migration(
+        version='0002_order_lines',
+        description='order_lines with quantity and captured unit price replace order_product_associations',
+        apply=_add_order_lines,
+    ),
+    Migration(
+        version='0003_products_updated_at',
+        description='products.updated_at for incremental catalog refresh',
+        apply=_add_products_updated_at,
+    ),
+)
+
+
+def upgrade(engine: 'Engine') -> list[str]:
+    """Приводит схему базы данных к актуальной версии.
+
+    Все изменения выполняются в одной транзакции.
+
+    Args:
+        engine: Движок базы данных.
+
+    Returns:
+        Идентификаторы миграций, примененных к существующей схеме.
+    """
+    applied: list[str] = []
+    with engine.begin() as connection:
+        is_new_database = not inspect(connection).has_table('products')
+        Base.metadata.create_all(connection)
+        schema_migrations.create(connection, checkfirst=True)
+        done = set(connection.scalars(select(schema_migrations.c.version)))
+
+        for migration in MIGRATIONS:
+            if migration.version in done:
+                continue
+            if not is_new_database:
+                logger.info('Applying migration %s: %s', migration.version, migration.description)
+                migration.apply(connection)
+                applied.append(migration.version)
+            connection.execute(insert(schema_migrations).values(version=migration.version))
+
+    return applied
+
+
+if __name__ == '__main__':
+    from warehouse_management.infrastructure.database import get_engine
+
+    logging.basicConfig(level=logging.INFO)
+    applied_versions = upgrade(get_engine())
+    logger.info('Schema is up to date, applied %d migration(s)', len(applied_versions))
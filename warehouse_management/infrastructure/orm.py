@@ -1,12 +1,14 @@
 """Модуль ORM-моделей для работы с базой данных."""
 
-from typing import TYPE_CHECKING
+from datetime import date, datetime, UTC
 
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-if TYPE_CHECKING:
-    from datetime import date
+
+def utcnow() -> datetime:
+    """Возвращает текущее время UTC без часового пояса (в таком виде время хранится в базе)."""
+    return datetime.now(UTC).replace(tzinfo=None)
 
 
 class Base(DeclarativeBase):
@@ -21,17 +23,28 @@ class ProductORM(Base):
     __tablename__ = 'products'
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False, index=True)
     quantity: Mapped[int] = mapped_column(nullable=False)
     price: Mapped[float] = mapped_column(nullable=False)
+    # Обновляется при любом UPDATE, включая массовые; используется для инкрементальной загрузки изменений.
+    updated_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow, onupdate=utcnow, index=True)
+
+
+class OrderLineORM(Base):
+    """Модель строки заказа в базе данных.
 
+    Хранит заказанное количество и цену за единицу, зафиксированную при оформлении заказа.
+    """
 
-order_product_associations = Table(
-    'order_product_associations',
-    Base.metadata,
-    Column('order_id', ForeignKey('orders.id')),
-    Column('product_id', ForeignKey('products.id')),
-)
+    __tablename__ = 'order_lines'
+    __table_args__ = (Index('ix_order_lines_product_id', 'product_id'),)
+
+    order_id: Mapped[int] = mapped_column(ForeignKey('orders.id'), primary_key=True)
+    product_id: Mapped[int] = mapped_column(ForeignKey('products.id'), primary_key=True)
+    quantity: Mapped[int] = mapped_column(nullable=False)
+    unit_price: Mapped[float] = mapped_column(nullable=False)
+
+    product = relationship('ProductORM')
 
 
 class OrderORM(Base):
@@ -40,8 +53,10 @@ class OrderORM(Base):
     __tablename__ = 'orders'
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    customer_id: Mapped[int | None] = mapped_column(ForeignKey('customers.id'), nullable=True, index=True)
 
-    products = relationship('ProductORM', secondary=order_product_associations)
+    lines = relationship('OrderLineORM', cascade='all, delete-orphan', order_by='OrderLineORM.product_id')
+    products = relationship('ProductORM', secondary='order_lines', viewonly=True, order_by='ProductORM.id')
 
 
 class CustomerORM(Base):
@@ -51,6 +66,28 @@ class CustomerORM(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(nullable=False)
-    birth_date: Mapped['date'] = mapped_column(nullable=False)
+    birth_date: Mapped[date] = mapped_column(nullable=False)
 
     orders = relationship('OrderORM', backref='customer', cascade='all, delete-orphan')
+
+
+class ImportProgressORM(Base):
+    """Модель прогресса потокового импорта: количество обработанных записей источника."""
+
+    __tablename__ = 'import_progress'
+
+    source: Mapped[str] = mapped_column(primary_key=True)
+    processed_rows: Mapped[int] = mapped_column(nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow, onupdate=utcnow)
+
+
+class IdSequenceORM(Base):
+    """Модель последовательности идентификаторов, из которой резервируются блоки ID.
+
+    Хранит следующее свободное значение для каждой таблицы, ID которой назначаются на клиенте.
+    """
+
+    __tablename__ = 'id_sequences'
+
+    name: Mapped[str] = mapped_column(primary_key=True)
+    next_value: Mapped[int] = mapped_column(nullable=False)
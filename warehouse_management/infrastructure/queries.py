@@ -0,0 +1,79 @@
+"""Общие построители запросов и проверки параметров для репозиториев SQLAlchemy."""
+
+from typing import Any, TYPE_CHECKING, TypeVar
+
+from sqlalchemy import func, select
+
+from warehouse_management.infrastructure.orm import OrderLineORM, OrderORM
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.orm import InstrumentedAttribute, Session
+
+# SQLite ограничивает число параметров в одном запросе, поэтому длинные списки IN (...) разбиваются.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+_T = TypeVar('_T', bound=tuple[Any, ...])
+
+
+def check_positive(value: int, name: str) -> None:
+    """Проверяет, что размер пакета или страницы положительный.
+
+    Args:
+        value: Проверяемое значение.
+        name: Название параметра для сообщения об ошибке.
+
+    Raises:
+        ValueError: Если значение меньше 1.
+    """
+    if value < 1:
+        raise ValueError(f'{name} must be a positive integer')
+
+
+def keyset(
+    statement: 'Select[_T]', key: 'InstrumentedAttribute[int]', after_id: int | None, limit: int
+) -> 'Select[_T]':
+    """Добавляет к запросу условия keyset-пагинации.
+
+    Args:
+        statement: Исходный запрос.
+        key: Колонка первичного ключа, по которой идет пагинация.
+        after_id: Последний ключ предыдущей страницы или None.
+        limit: Размер страницы.
+
+    Returns:
+        Запрос с сортировкой, фильтром `key > after_id` и ограничением.
+    """
+    if after_id is not None:
+        statement = statement.where(key > after_id)
+    return statement.order_by(key).limit(limit)
+
+
+def order_totals_select() -> 'Select[tuple[int, float]]':
+    """Возвращает запрос стоимости заказов `id, COALESCE(SUM(quantity * unit_price), 0.0)`."""
+    line_total = func.sum(OrderLineORM.unit_price * OrderLineORM.quantity)
+    return (
+        select(OrderORM.id, func.coalesce(line_total, 0.0))
+        .outerjoin(OrderLineORM, OrderLineORM.order_id == OrderORM.id)
+        .group_by(OrderORM.id)
+    )
+
+
+def order_totals_page(
+    session: 'Session', customer_id: int | None, after_id: int | None, limit: int
+) -> dict[int, float]:
+    """Считает стоимость очередной порции заказов с ID больше `after_id`.
+
+    Args:
+        session: SQLAlchemy-сессия.
+        customer_id: Считать только заказы этого клиента или все заказы, если None.
+        after_id: Последний ID предыдущей порции или None.
+        limit: Размер порции.
+
+    Returns:
+        Словарь `{order_id: стоимость}` в порядке возрастания ID.
+    """
+    statement = keyset(order_totals_select(), OrderORM.id, after_id, limit)
+    if customer_id is not None:
+        statement = statement.where(OrderORM.customer_id == customer_id)
+    return {order_id: total for order_id, total in session.execute(statement)}
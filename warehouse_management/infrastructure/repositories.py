@@ -1,55 +1,201 @@
 """Репозитории для взаимодействия с базой данных через SQLAlchemy."""
 
-from typing import TYPE_CHECKING
+from collections import Counter
+from itertools import batched, starmap
+from typing import Any, TYPE_CHECKING
+
+from sqlalchemy import case, func, insert, select, update
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.orm.util import identity_key
 
 if TYPE_CHECKING:
+    import builtins
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from datetime import date
+
+    from sqlalchemy import Row
     from sqlalchemy.orm import Session
+    from sqlalchemy.orm.interfaces import ORMOption
+
+    from warehouse_management.infrastructure.id_allocator import IdAllocator
 
 from warehouse_management.domain.exceptions import NotFoundError
-from warehouse_management.domain.models import Customer, Order, Product
-from warehouse_management.domain.repositories import CustomerRepository, OrderRepository, ProductRepository
-from warehouse_management.infrastructure.orm import CustomerORM, OrderORM, ProductORM
+from warehouse_management.domain.models import Customer, CustomerSummary, Order, OrderLine, Product
+from warehouse_management.domain.repositories import (
+    CustomerRepository,
+    ImportProgressRepository,
+    OrderRepository,
+    ProductRepository,
+)
+from warehouse_management.infrastructure.orm import CustomerORM, ImportProgressORM, OrderLineORM, OrderORM, ProductORM
+from warehouse_management.infrastructure.queries import (
+    check_positive,
+    IN_CLAUSE_CHUNK_SIZE,
+    keyset,
+    order_totals_page,
+    order_totals_select,
+)
+from warehouse_management.infrastructure.unit_of_work import mark_products_written
+
+# В запросе резервирования каждый товар занимает несколько параметров (IN и два CASE).
+_RESERVE_CHUNK_SIZE = 100
+
+_PRODUCT_COLUMNS = (ProductORM.id, ProductORM.name, ProductORM.quantity, ProductORM.price)
+_ORDER_COLUMNS = (OrderORM.id, OrderORM.customer_id)
+_ORDER_LINE_COLUMNS = (
+    OrderLineORM.order_id,
+    OrderLineORM.quantity.label('line_quantity'),
+    OrderLineORM.unit_price,
+)
+_CUSTOMER_COLUMNS = (CustomerORM.id, CustomerORM.name, CustomerORM.birth_date)
 
 
 class SqlAlchemyProductRepository(ProductRepository):
     """Репозиторий для управления товарами."""
 
-    def __init__(self, session: 'Session') -> None:
+    def __init__(self, session: 'Session', core_reads: bool = False, id_allocator: 'IdAllocator | None' = None) -> None:
         """Инициализирует репозиторий товаров.
 
         Args:
             session: Экземпляр SQLAlchemy-сессии.
+            core_reads: Читать товары в `get()` и `list()` запросами Core по колонкам, создавая
+                доменные модели напрямую, без ORM-объектов и identity map сессии.
+            id_allocator: Аллокатор ID на клиенте; с ним `add()` и `add_many()` не ждут
+                автоинкрементный ID от базы, а вставки отправляются пакетом при flush.
         """
         self.session = session
+        self.core_reads = core_reads
+        self.id_allocator = id_allocator
 
     def add(self, product: 'Product') -> None:
         """Добавляет товар в базу данных.
 
+        Без аллокатора ID выполняется flush, чтобы получить автоинкрементный ID;
+        с аллокатором ID назначается сразу, а INSERT откладывается до flush.
+
         Args:
             product: Экземпляр товара.
         """
         product_orm = ProductORM(name=product.name, quantity=product.quantity, price=product.price)
         self.session.add(product_orm)
-        self.session.flush()
+        if self.id_allocator is not None:
+            [product_orm.id] = self.id_allocator.allocate(ProductORM.__tablename__, session=self.session)
+        else:
+            self.session.flush()
         product.id = product_orm.id
 
-    def get(self, product_id: int) -> 'Product | None':
+    def add_many(self, products: 'Sequence[Product]', chunk_size: int = 1000) -> None:
+        """Добавляет товары в базу данных пакетами без flush на каждую строку.
+
+        Без аллокатора ID каждый пакет отправляется `INSERT ... RETURNING id`, после чего
+        идентификаторы присваиваются доменным объектам в исходном порядке (SQLite при
+        этом выполняет вставки построчно, чтобы сохранить порядок). С аллокатором ID
+        назначаются заранее, и пакет отправляется одним `executemany` без RETURNING.
+
+        Args:
+            products: Товары для добавления.
+            chunk_size: Максимальное количество строк в одном INSERT-запросе.
+
+        Raises:
+            ValueError: Если `chunk_size` меньше 1.
+        """
+        check_positive(chunk_size, 'Chunk size')
+
+        if self.id_allocator is not None:
+            allocated_ids = self.id_allocator.allocate(ProductORM.__tablename__, len(products), self.session)
+            for product, product_id in zip(products, allocated_ids, strict=True):
+                product.id = product_id
+            for chunk in batched(products, chunk_size):
+                self.session.execute(
+                    insert(ProductORM),
+                    [{'id': p.id, 'name': p.name, 'quantity': p.quantity, 'price': p.price} for p in chunk],
+                )
+            return
+
+        statement = insert(ProductORM).returning(ProductORM.id, sort_by_parameter_order=True)
+        for chunk in batched(products, chunk_size):
+            ids = self.session.scalars(
+                statement,
+                [{'name': p.name, 'quantity': p.quantity, 'price': p.price} for p in chunk],
+            ).all()
+            for product, product_id in zip(chunk, ids, strict=True):
+                product.id = product_id
+
+    def get(self, product_id: int) -> 'Product':
         """Получает товар по ID.
 
         Args:
             product_id: Идентификатор товара.
 
         Returns:
-            Найденный товар или None, если товар отсутствует.
+            Найденный товар.
+
+        Raises:
+            ValueError: Если ID товара отрицательный.
+            NotFoundError: Если товар не найден.
         """
         if product_id < 0:
             raise ValueError('Product ID must be a positive integer')
 
+        if self.core_reads:
+            row = self.session.execute(select(*_PRODUCT_COLUMNS).where(ProductORM.id == product_id)).one_or_none()
+            if row is None:
+                raise NotFoundError(f'Product with ID {product_id} not found')
+            return _row_to_product(row)
+
         product_orm = self.session.query(ProductORM).filter_by(id=product_id).first()
         if product_orm is None:
             raise NotFoundError(f'Product with ID {product_id} not found')
 
-        return Product(id=product_orm.id, name=product_orm.name, quantity=product_orm.quantity, price=product_orm.price)
+        return _to_product(product_orm)
+
+    def exists(self, product_id: int) -> bool:
+        """Проверяет существование товара запросом по первичному ключу без чтения колонок.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            True, если товар существует.
+        """
+        return self.session.scalar(select(ProductORM.id).where(ProductORM.id == product_id)) is not None
+
+    def get_reference(self, product_id: int) -> Product:
+        """Возвращает товар по первичному ключу.
+
+        Объект, уже загруженный в сессию, берется из identity map без запроса к базе;
+        иначе выполняется один SELECT по первичному ключу.
+
+        Args:
+            product_id: Идентификатор товара.
+
+        Returns:
+            Найденный товар.
+
+        Raises:
+            NotFoundError: Если товар не найден.
+        """
+        product_orm = self.session.get(ProductORM, product_id)
+        if product_orm is None:
+            raise NotFoundError(f'Product with ID {product_id} not found')
+        return _to_product(product_orm)
+
+    def existing_ids(self, product_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих товаров запросами по первичному ключу.
+
+        На каждые `IN_CLAUSE_CHUNK_SIZE` идентификаторов выполняется один запрос `IN (...)`,
+        читающий только колонку `id`.
+
+        Args:
+            product_ids: Проверяемые идентификаторы товаров.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        found: set[int] = set()
+        for chunk in batched(dict.fromkeys(product_ids), IN_CLAUSE_CHUNK_SIZE):
+            found.update(self.session.scalars(select(ProductORM.id).where(ProductORM.id.in_(chunk))))
+        return found
 
     def list(self) -> list['Product']:
         """Возвращает список всех товаров.
@@ -57,91 +203,392 @@ class SqlAlchemyProductRepository(ProductRepository):
         Returns:
             Список товаров.
         """
-        products_orm = self.session.query(ProductORM).all()
-        return [Product(id=p.id, name=p.name, quantity=p.quantity, price=p.price) for p in products_orm]
+        if self.core_reads:
+            return list(starmap(Product, self.session.execute(select(*_PRODUCT_COLUMNS))))
+        return [_to_product(p) for p in self.session.scalars(select(ProductORM))]
+
+    def iter_all(self, batch_size: int = 1000) -> 'Iterator[Product]':
+        """Лениво перебирает все товары в порядке ID.
+
+        Строки читаются курсором порциями по `batch_size` (`yield_per`) и не попадают
+        в identity map сессии, поэтому потребление памяти не зависит от размера таблицы.
+
+        Args:
+            batch_size: Количество строк, получаемых из курсора за один раз.
+
+        Yields:
+            Товары по одному.
+
+        Raises:
+            ValueError: Если `batch_size` меньше 1.
+        """
+        check_positive(batch_size, 'Batch size')
+        statement = select(*_PRODUCT_COLUMNS).order_by(ProductORM.id).execution_options(yield_per=batch_size)
+        for row in self.session.execute(statement):
+            yield _row_to_product(row)
+
+    def page(self, after_id: int | None = None, limit: int = 100) -> 'builtins.list[Product]':
+        """Возвращает страницу товаров с ID больше `after_id` (keyset-пагинация).
+
+        Args:
+            after_id: ID последнего товара предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+
+        Returns:
+            Товары страницы в порядке ID.
+
+        Raises:
+            ValueError: Если `limit` меньше 1.
+        """
+        check_positive(limit, 'Limit')
+        statement = keyset(select(*_PRODUCT_COLUMNS), ProductORM.id, after_id, limit)
+        return [_row_to_product(row) for row in self.session.execute(statement)]
+
+    def reserve(self, quantities: 'Mapping[int, int]') -> set[int]:
+        """Уменьшает остатки товаров, если их достаточно, не читая их предварительно.
+
+        Для каждых `_RESERVE_CHUNK_SIZE` товаров выполняется один условный запрос
+        `UPDATE products SET quantity = quantity - n WHERE id IN (...) AND quantity >= n ... RETURNING id`,
+        где `n` подставляется для каждого товара через CASE. Проверка и уменьшение
+        остатка атомарны, поэтому конкурентные резервирования не теряют обновлений.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+
+        Returns:
+            ID товаров, для которых остаток уменьшен; остальные товары не изменяются.
+        """
+        reserved: set[int] = set()
+        for chunk in batched(quantities.items(), _RESERVE_CHUNK_SIZE):
+            amounts = dict(chunk)
+            amount = case(amounts, value=ProductORM.id)
+            statement = (
+                update(ProductORM)
+                .where(ProductORM.id.in_(amounts), ProductORM.quantity >= amount)
+                .values(quantity=ProductORM.quantity - amount)
+                .returning(ProductORM.id)
+                .execution_options(synchronize_session='fetch')
+            )
+            reserved.update(self.session.scalars(statement))
+        mark_products_written(self.session, reserved)
+        return reserved
+
+    def release(self, quantities: 'Mapping[int, int]') -> None:
+        """Возвращает ранее зарезервированное количество товаров на склад.
+
+        Args:
+            quantities: Словарь `{product_id: количество}`.
+        """
+        for chunk in batched(quantities.items(), _RESERVE_CHUNK_SIZE):
+            amounts = dict(chunk)
+            statement = (
+                update(ProductORM)
+                .where(ProductORM.id.in_(amounts))
+                .values(quantity=ProductORM.quantity + case(amounts, value=ProductORM.id))
+                .execution_options(synchronize_session='fetch')
+            )
+            self.session.execute(statement)
+        mark_products_written(self.session, quantities)
 
 
 class SqlAlchemyOrderRepository(OrderRepository):
     """Репозиторий для управления заказами через SQLAlchemy."""
 
-    def __init__(self, session: 'Session') -> None:
+    def __init__(self, session: 'Session', core_reads: bool = False) -> None:
         """Инициализирует репозиторий заказов.
 
         Args:
             session: Экземпляр SQLAlchemy-сессии.
+            core_reads: Читать заказы в `get()` и `list()` запросами Core по колонкам, создавая
+                доменные модели напрямую, без ORM-объектов и identity map сессии.
         """
         self.session = session
+        self.core_reads = core_reads
 
     def add(self, order: Order) -> None:
         """Добавляет заказ в базу данных.
 
+        Все товары заказа загружаются одним запросом `IN (...)`.
+
         Args:
             order: Экземпляр заказа.
+
+        Raises:
+            NotFoundError: Если в базе отсутствует хотя бы один товар заказа.
+        """
+        self.add_many([order])
+
+    def add_many(self, orders: 'Sequence[Order]') -> None:
+        """Добавляет несколько заказов в базу данных.
+
+        Товары всех заказов разрешаются одним запросом `IN (...)`;
+        объекты, уже загруженные в сессию, повторно не запрашиваются.
+        Для каждой строки сохраняются количество и цена за единицу: если цена
+        в строке не задана, фиксируется текущая цена товара.
+
+        Args:
+            orders: Заказы для добавления.
+
+        Raises:
+            ValueError: Если количество в строке заказа меньше 1 или один товар указан в заказе с разными ценами.
+            NotFoundError: Если в базе отсутствуют товары; в сообщении перечислены все отсутствующие ID.
+        """
+        order_lines = [_order_lines(order) for order in orders]
+        products_by_id = self._resolve_products(line.product_id for lines in order_lines for line in lines)
+
+        for order, lines in zip(orders, order_lines, strict=True):
+            order_orm = OrderORM(id=order.id, customer_id=order.customer_id)
+            # Пара (order_id, product_id) уникальна, повторы товара в заказе объединяются в одну строку;
+            # их цены совпадают, это проверяет `_order_lines`.
+            quantities: dict[int, int] = {}
+            unit_prices: dict[int, float | None] = {}
+            for line in lines:
+                product_id: int = line.product_id  # type: ignore[assignment]
+                quantities[product_id] = quantities.get(product_id, 0) + line.quantity
+                unit_prices[product_id] = line.unit_price
+            order_orm.lines = [
+                OrderLineORM(
+                    product=products_by_id[product_id],
+                    quantity=quantity,
+                    unit_price=_captured_price(unit_prices[product_id], products_by_id[product_id]),
+                )
+                for product_id, quantity in quantities.items()
+            ]
+            self.session.add(order_orm)
+
+    def _resolve_products(self, product_ids: 'Iterable[int | None]') -> dict[int, ProductORM]:
+        """Загружает ORM-объекты товаров по их идентификаторам.
+
+        Args:
+            product_ids: Идентификаторы товаров (допускаются повторы).
+
+        Returns:
+            Словарь `{id: ProductORM}` для всех запрошенных товаров.
+
+        Raises:
+            ValueError: Если у товара отсутствует ID.
+            NotFoundError: Если часть товаров не найдена.
         """
-        order_orm = OrderORM()
-        order_orm.products = [self.session.query(ProductORM).filter_by(id=p.id).one() for p in order.products]
-        self.session.add(order_orm)
+        requested_ids: set[int] = set()
+        for product_id in product_ids:
+            if product_id is None:
+                raise ValueError('Product in order must have an ID')
+            requested_ids.add(product_id)
+
+        products_by_id: dict[int, ProductORM] = {}
+        unresolved_ids: list[int] = []
+        for product_id in sorted(requested_ids):
+            cached = self.session.identity_map.get(identity_key(ProductORM, product_id))
+            if cached is not None:
+                products_by_id[product_id] = cached
+            else:
+                unresolved_ids.append(product_id)
+
+        for chunk in batched(unresolved_ids, IN_CLAUSE_CHUNK_SIZE):
+            for product_orm in self.session.scalars(select(ProductORM).where(ProductORM.id.in_(chunk))):
+                products_by_id[product_orm.id] = product_orm
 
-    def get(self, order_id: int) -> Order | None:
+        missing_ids = [product_id for product_id in unresolved_ids if product_id not in products_by_id]
+        if missing_ids:
+            raise NotFoundError(f'Products with IDs {missing_ids} not found')
+
+        return products_by_id
+
+    def get(self, order_id: int, load_products: bool = True) -> Order | None:
         """Получает заказ по ID.
 
         Args:
             order_id: Идентификатор заказа.
+            load_products: Загружать ли товары заказа (одним дополнительным запросом).
 
         Returns:
             Найденный заказ или None, если заказ отсутствует.
         """
-        order_orm = self.session.query(OrderORM).filter_by(id=order_id).one_or_none()
+        if self.core_reads:
+            rows = self.session.execute(select(*_ORDER_COLUMNS).where(OrderORM.id == order_id)).all()
+            return next(iter(_rows_to_orders(self.session, rows, load_products)), None)
+
+        statement = select(OrderORM).where(OrderORM.id == order_id).options(*_order_load_options(load_products))
+        order_orm = self.session.scalars(statement).one_or_none()
         if not order_orm:
             return None
-        products = [Product(id=p.id, name=p.name, quantity=p.quantity, price=p.price) for p in order_orm.products]
-        return Order(id=order_orm.id, products=products)
+        return _to_order(order_orm, load_products)
 
-    def list(self) -> list[Order]:
+    def exists(self, order_id: int) -> bool:
+        """Проверяет существование заказа запросом по первичному ключу без чтения колонок.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            True, если заказ существует.
+        """
+        return self.session.scalar(select(OrderORM.id).where(OrderORM.id == order_id)) is not None
+
+    def get_reference(self, order_id: int) -> Order:
+        """Возвращает заказ без строк и товаров по первичному ключу.
+
+        Объект, уже загруженный в сессию, берется из identity map без запроса к базе;
+        иначе выполняется один SELECT по первичному ключу.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            Найденный заказ.
+
+        Raises:
+            NotFoundError: Если заказ не найден.
+        """
+        order_orm = self.session.get(OrderORM, order_id)
+        if order_orm is None:
+            raise NotFoundError(f'Order with ID {order_id} not found')
+        return Order(id=order_orm.id, customer_id=order_orm.customer_id)
+
+    def list(self, load_products: bool = True) -> list[Order]:
         """Возвращает список всех заказов.
 
+        Заказы и их товары загружаются фиксированным числом запросов независимо от количества заказов.
+
+        Args:
+            load_products: Загружать ли товары заказов.
+
         Returns:
             Список заказов.
         """
-        orders_orm = self.session.query(OrderORM).all()
-        return [
-            Order(
-                id=order_orm.id,
-                products=[
-                    Product(id=p.id, name=p.name, quantity=p.quantity, price=p.price) for p in order_orm.products
-                ],
-            )
-            for order_orm in orders_orm
-        ]
+        if self.core_reads:
+            rows = self.session.execute(select(*_ORDER_COLUMNS).order_by(OrderORM.id)).all()
+            return _rows_to_orders(self.session, rows, load_products)
+
+        statement = select(OrderORM).options(*_order_load_options(load_products))
+        return [_to_order(order_orm, load_products) for order_orm in self.session.scalars(statement)]
+
+    def iter_all(self, batch_size: int = 1000, load_products: bool = True) -> 'Iterator[Order]':
+        """Лениво перебирает все заказы в порядке ID.
+
+        Заказы читаются курсором порциями по `batch_size` (`yield_per`); товары каждой
+        порции загружаются одним запросом. ORM-объекты не создаются.
+
+        Args:
+            batch_size: Количество заказов, получаемых из курсора за один раз.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Заказы по одному.
+
+        Raises:
+            ValueError: Если `batch_size` меньше 1.
+        """
+        check_positive(batch_size, 'Batch size')
+        statement = select(*_ORDER_COLUMNS).order_by(OrderORM.id).execution_options(yield_per=batch_size)
+        for rows in self.session.execute(statement).partitions():
+            yield from _rows_to_orders(self.session, rows, load_products)
+
+    def page(self, after_id: int | None = None, limit: int = 100, load_products: bool = True) -> 'builtins.list[Order]':
+        """Возвращает страницу заказов с ID больше `after_id` (keyset-пагинация).
+
+        Args:
+            after_id: ID последнего заказа предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Заказы страницы в порядке ID.
+
+        Raises:
+            ValueError: Если `limit` меньше 1.
+        """
+        check_positive(limit, 'Limit')
+        statement = keyset(select(*_ORDER_COLUMNS), OrderORM.id, after_id, limit)
+        return _rows_to_orders(self.session, self.session.execute(statement).all(), load_products)
+
+    def totals(self, order_ids: 'Iterable[int]') -> dict[int, float]:
+        """Считает стоимость заказов на стороне базы данных.
+
+        Стоимость вычисляется одним запросом `SUM(quantity * unit_price) ... GROUP BY`
+        на каждые `IN_CLAUSE_CHUNK_SIZE` идентификаторов; строки заказов и товары
+        в память не загружаются.
+
+        Args:
+            order_ids: Идентификаторы заказов.
+
+        Returns:
+            Словарь `{order_id: стоимость}`; заказы без строк имеют стоимость 0.0,
+            отсутствующие в базе заказы в словарь не попадают.
+        """
+        totals: dict[int, float] = {}
+        for chunk in batched(dict.fromkeys(order_ids), IN_CLAUSE_CHUNK_SIZE):
+            statement = order_totals_select().where(OrderORM.id.in_(chunk))
+            totals.update((order_id, total) for order_id, total in self.session.execute(statement))
+        return totals
+
+    def iter_totals(
+        self, customer_id: int | None = None, after_id: int | None = None, batch_size: int = 10_000
+    ) -> 'Iterator[dict[int, float]]':
+        """Потоково считает стоимость всех заказов на стороне базы данных.
+
+        Заказы обходятся в порядке ID keyset-пагинацией: каждая порция — один запрос
+        `SUM(quantity * unit_price) ... GROUP BY ... LIMIT batch_size`, поэтому память
+        не растет с числом заказов, а курсор не держится открытым между порциями.
+
+        Args:
+            customer_id: Считать только заказы этого клиента.
+            after_id: Начать с заказов, ID которых больше указанного (для продолжения прерванного обхода).
+            batch_size: Количество заказов в одной порции.
+
+        Yields:
+            Словари `{order_id: стоимость}` в порядке возрастания ID; заказы без строк имеют стоимость 0.0.
+
+        Raises:
+            ValueError: Если `batch_size` меньше 1.
+        """
+        check_positive(batch_size, 'Batch size')
+        while totals := order_totals_page(self.session, customer_id, after_id, batch_size):
+            yield totals
+            after_id = next(reversed(totals))
 
 
 class SqlAlchemyCustomerRepository(CustomerRepository):
     """Репозиторий для управления клиентами через SQLAlchemy."""
 
-    def __init__(self, session: 'Session') -> None:
+    def __init__(self, session: 'Session', core_reads: bool = False, id_allocator: 'IdAllocator | None' = None) -> None:
         """Инициализирует репозиторий клиентов.
 
         Args:
             session: Экземпляр SQLAlchemy-сессии.
+            core_reads: Читать клиентов в `get()` и `list()` запросами Core по колонкам, создавая
+                доменные модели напрямую, без ORM-объектов и identity map сессии.
+            id_allocator: Аллокатор ID на клиенте; с ним `add()` не ждет автоинкрементный ID
+                от базы, а вставки отправляются пакетом при flush.
         """
         self.session = session
+        self.core_reads = core_reads
+        self.id_allocator = id_allocator
 
     def add(self, customer: Customer) -> None:
         """Добавляет клиента в базу данных.
 
+        Без аллокатора ID выполняется flush, чтобы получить автоинкрементный ID;
+        с аллокатором ID назначается сразу, а INSERT откладывается до flush.
+
         Args:
             customer: Экземпляр клиента.
         """
         customer_orm = CustomerORM(name=customer.name, birth_date=customer.birth_date)
         self.session.add(customer_orm)
-        self.session.flush()
+        if self.id_allocator is not None:
+            [customer_orm.id] = self.id_allocator.allocate(CustomerORM.__tablename__, session=self.session)
+        else:
+            self.session.flush()
         customer.id = customer_orm.id
 
-    def get(self, customer_id: int) -> Customer:
+    def get(self, customer_id: int, load_orders: bool = True, load_products: bool = True) -> Customer:
         """Получает клиента по ID.
 
         Args:
             customer_id: Идентификатор клиента.
+            load_orders: Загружать ли заказы клиента.
+            load_products: Загружать ли товары заказов (учитывается только вместе с `load_orders`).
 
         Returns:
             Найденный клиент.
@@ -153,44 +600,438 @@ class SqlAlchemyCustomerRepository(CustomerRepository):
         if customer_id < 0:
             raise ValueError('Customer ID must be a positive integer')
 
-        customer_orm = self.session.query(CustomerORM).filter_by(id=customer_id).one_or_none()
+        if self.core_reads:
+            rows = self.session.execute(select(*_CUSTOMER_COLUMNS).where(CustomerORM.id == customer_id)).all()
+            if not rows:
+                raise NotFoundError(f'Customer with ID {customer_id} not found')
+            return _rows_to_customers(self.session, rows, load_orders, load_products)[0]
+
+        statement = (
+            select(CustomerORM)
+            .where(CustomerORM.id == customer_id)
+            .options(*_customer_load_options(load_orders, load_products))
+        )
+        customer_orm = self.session.scalars(statement).one_or_none()
         if not customer_orm:
             raise NotFoundError(f'Customer with ID {customer_id} not found')
 
-        return Customer(
-            id=customer_orm.id,
-            name=customer_orm.name,
-            birth_date=customer_orm.birth_date,
-            orders=[
-                Order(
-                    id=o.id,
-                    products=[Product(id=p.id, name=p.name, quantity=p.quantity, price=p.price) for p in o.products],
-                )
-                for o in customer_orm.orders
-            ],
-        )
+        return _to_customer(customer_orm, load_orders, load_products)
+
+    def exists(self, customer_id: int) -> bool:
+        """Проверяет существование клиента запросом по первичному ключу без чтения колонок.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            True, если клиент существует.
+        """
+        return self.session.scalar(select(CustomerORM.id).where(CustomerORM.id == customer_id)) is not None
 
-    def list(self) -> list[Customer]:
+    def get_reference(self, customer_id: int) -> Customer:
+        """Возвращает клиент без заказов по первичному ключу.
+
+        Объект, уже загруженный в сессию, берется из identity map без запроса к базе;
+        иначе выполняется один SELECT по первичному ключу.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Найденный клиент.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        customer_orm = self.session.get(CustomerORM, customer_id)
+        if customer_orm is None:
+            raise NotFoundError(f'Customer with ID {customer_id} not found')
+        return Customer(id=customer_orm.id, name=customer_orm.name, birth_date=customer_orm.birth_date)
+
+    def existing_ids(self, customer_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает идентификаторы существующих клиентов запросами по первичному ключу.
+
+        На каждые `IN_CLAUSE_CHUNK_SIZE` идентификаторов выполняется один запрос `IN (...)`,
+        читающий только колонку `id`.
+
+        Args:
+            customer_ids: Проверяемые идентификаторы клиентов.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        found: set[int] = set()
+        for chunk in batched(dict.fromkeys(customer_ids), IN_CLAUSE_CHUNK_SIZE):
+            found.update(self.session.scalars(select(CustomerORM.id).where(CustomerORM.id.in_(chunk))))
+        return found
+
+    def list(self, load_orders: bool = True, load_products: bool = True) -> list[Customer]:
         """Возвращает список всех клиентов.
 
+        Граф клиентов, заказов и товаров загружается не более чем тремя запросами
+        (`selectinload`) вместо 1 + C + O ленивых запросов.
+
+        Args:
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов (учитывается только вместе с `load_orders`).
+
         Returns:
             Список клиентов.
         """
-        customers_orm = self.session.query(CustomerORM).all()
-        return [
-            Customer(
-                id=c.id,
-                name=c.name,
-                birth_date=c.birth_date,
-                orders=[
-                    Order(
-                        id=o.id,
-                        products=[
-                            Product(id=p.id, name=p.name, quantity=p.quantity, price=p.price) for p in o.products
-                        ],
-                    )
-                    for o in c.orders
-                ],
-            )
-            for c in customers_orm
-        ]
+        if self.core_reads:
+            rows = self.session.execute(select(*_CUSTOMER_COLUMNS).order_by(CustomerORM.id)).all()
+            return _rows_to_customers(self.session, rows, load_orders, load_products)
+
+        statement = select(CustomerORM).options(*_customer_load_options(load_orders, load_products))
+        return [_to_customer(c, load_orders, load_products) for c in self.session.scalars(statement)]
+
+    def iter_all(
+        self, batch_size: int = 1000, load_orders: bool = True, load_products: bool = True
+    ) -> 'Iterator[Customer]':
+        """Лениво перебирает всех клиентов в порядке ID.
+
+        Клиенты читаются курсором порциями по `batch_size` (`yield_per`); заказы и товары
+        каждой порции загружаются фиксированным числом запросов. ORM-объекты не создаются.
+
+        Args:
+            batch_size: Количество клиентов, получаемых из курсора за один раз.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Клиенты по одному.
+
+        Raises:
+            ValueError: Если `batch_size` меньше 1.
+        """
+        check_positive(batch_size, 'Batch size')
+        statement = select(*_CUSTOMER_COLUMNS).order_by(CustomerORM.id).execution_options(yield_per=batch_size)
+        for rows in self.session.execute(statement).partitions():
+            yield from _rows_to_customers(self.session, rows, load_orders, load_products)
+
+    def page(
+        self, after_id: int | None = None, limit: int = 100, load_orders: bool = True, load_products: bool = True
+    ) -> 'builtins.list[Customer]':
+        """Возвращает страницу клиентов с ID больше `after_id` (keyset-пагинация).
+
+        Args:
+            after_id: ID последнего клиента предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Клиенты страницы в порядке ID.
+
+        Raises:
+            ValueError: Если `limit` меньше 1.
+        """
+        check_positive(limit, 'Limit')
+        statement = keyset(select(*_CUSTOMER_COLUMNS), CustomerORM.id, after_id, limit)
+        return _rows_to_customers(self.session, self.session.execute(statement).all(), load_orders, load_products)
+
+    def summary(self, customer_id: int, orders_limit: int = 20, before_id: int | None = None) -> CustomerSummary:
+        """Возвращает сводку по клиенту двумя запросами независимо от числа его заказов.
+
+        Первый запрос читает клиента вместе с количеством и суммарной стоимостью заказов
+        (коррелированные подзапросы), второй — стоимость `orders_limit` последних заказов
+        по индексу `orders.customer_id` (keyset-пагинация от новых заказов к старым).
+
+        Args:
+            customer_id: Идентификатор клиента.
+            orders_limit: Количество последних заказов в странице.
+            before_id: Курсор страницы: вернуть заказы с ID меньше указанного.
+
+        Returns:
+            Сводка по клиенту.
+
+        Raises:
+            ValueError: Если ID клиента отрицательный или `orders_limit` меньше 1.
+            NotFoundError: Если клиент не найден.
+        """
+        if customer_id < 0:
+            raise ValueError('Customer ID must be a positive integer')
+        check_positive(orders_limit, 'Limit')
+
+        order_count = (
+            select(func.count(OrderORM.id)).where(OrderORM.customer_id == CustomerORM.id).correlate(CustomerORM)
+        )
+        revenue = (
+            select(func.coalesce(func.sum(OrderLineORM.unit_price * OrderLineORM.quantity), 0.0))
+            .join(OrderORM, OrderORM.id == OrderLineORM.order_id)
+            .where(OrderORM.customer_id == CustomerORM.id)
+            .correlate(CustomerORM)
+        )
+        header = self.session.execute(
+            select(
+                *_CUSTOMER_COLUMNS,
+                order_count.scalar_subquery().label('order_count'),
+                revenue.scalar_subquery().label('revenue'),
+            ).where(CustomerORM.id == customer_id)
+        ).one_or_none()
+        if header is None:
+            raise NotFoundError(f'Customer with ID {customer_id} not found')
+
+        statement = order_totals_select().where(OrderORM.customer_id == customer_id)
+        if before_id is not None:
+            statement = statement.where(OrderORM.id < before_id)
+        recent = self.session.execute(statement.order_by(OrderORM.id.desc()).limit(orders_limit + 1)).all()
+
+        return CustomerSummary(
+            customer=Customer(id=header.id, name=header.name, birth_date=header.birth_date),
+            order_count=header.order_count,
+            revenue=header.revenue,
+            recent_orders={order_id: total for order_id, total in recent[:orders_limit]},
+            next_cursor=recent[orders_limit - 1][0] if len(recent) > orders_limit else None,
+        )
+
+
+class SqlAlchemyImportProgressRepository(ImportProgressRepository):
+    """Репозиторий прогресса импорта в таблице `import_progress`."""
+
+    def __init__(self, session: 'Session') -> None:
+        """Инициализирует репозиторий прогресса импорта.
+
+        Args:
+            session: Экземпляр SQLAlchemy-сессии.
+        """
+        self.session = session
+
+    def get_offset(self, source: str) -> int:
+        """Возвращает количество обработанных записей источника.
+
+        Args:
+            source: Ключ источника импорта.
+
+        Returns:
+            Количество обработанных записей или 0, если импорт источника еще не выполнялся.
+        """
+        offset = self.session.scalar(select(ImportProgressORM.processed_rows).where(ImportProgressORM.source == source))
+        return offset or 0
+
+    def save_offset(self, source: str, offset: int) -> None:
+        """Сохраняет количество обработанных записей источника в транзакции сессии.
+
+        Args:
+            source: Ключ источника импорта.
+            offset: Количество обработанных записей.
+        """
+        progress = self.session.get(ImportProgressORM, source)
+        if progress is None:
+            self.session.add(ImportProgressORM(source=source, processed_rows=offset))
+        else:
+            progress.processed_rows = offset
+        self.session.flush()
+
+
+def _order_load_options(load_products: bool) -> list['ORMOption']:
+    """Возвращает опции загрузки связей заказа.
+
+    Args:
+        load_products: Загружать ли товары заказа.
+
+    Returns:
+        Список опций для `Select.options()`.
+    """
+    if not load_products:
+        return [lazyload(OrderORM.lines)]
+    return [selectinload(OrderORM.lines).joinedload(OrderLineORM.product)]
+
+
+def _customer_load_options(load_orders: bool, load_products: bool) -> list['ORMOption']:
+    """Возвращает опции загрузки связей клиента.
+
+    Args:
+        load_orders: Загружать ли заказы клиента.
+        load_products: Загружать ли товары заказов.
+
+    Returns:
+        Список опций для `Select.options()`.
+    """
+    if not load_orders:
+        return [lazyload(CustomerORM.orders)]
+
+    orders = selectinload(CustomerORM.orders)
+    if not load_products:
+        return [orders.lazyload(OrderORM.lines)]
+    return [orders.selectinload(OrderORM.lines).joinedload(OrderLineORM.product)]
+
+
+def _to_product(product_orm: ProductORM) -> Product:
+    """Преобразует ORM-модель товара в доменную модель.
+
+    Args:
+        product_orm: ORM-модель товара.
+
+    Returns:
+        Доменная модель товара.
+    """
+    return Product(id=product_orm.id, name=product_orm.name, quantity=product_orm.quantity, price=product_orm.price)
+
+
+def _to_order(order_orm: OrderORM, load_products: bool = True) -> Order:
+    """Преобразует ORM-модель заказа в доменную модель.
+
+    Args:
+        order_orm: ORM-модель заказа.
+        load_products: Заполнять ли списки товаров и строк заказа.
+
+    Returns:
+        Доменная модель заказа.
+    """
+    if not load_products:
+        return Order(id=order_orm.id, customer_id=order_orm.customer_id)
+
+    return Order(
+        id=order_orm.id,
+        customer_id=order_orm.customer_id,
+        products=[_to_product(line.product) for line in order_orm.lines],
+        lines=[
+            OrderLine(product_id=line.product_id, quantity=line.quantity, unit_price=line.unit_price)
+            for line in order_orm.lines
+        ],
+    )
+
+
+def _to_customer(customer_orm: CustomerORM, load_orders: bool = True, load_products: bool = True) -> Customer:
+    """Преобразует ORM-модель клиента в доменную модель.
+
+    Args:
+        customer_orm: ORM-модель клиента.
+        load_orders: Заполнять ли список заказов клиента.
+        load_products: Заполнять ли списки товаров в заказах.
+
+    Returns:
+        Доменная модель клиента.
+    """
+    orders = [_to_order(o, load_products) for o in customer_orm.orders] if load_orders else []
+    return Customer(id=customer_orm.id, name=customer_orm.name, birth_date=customer_orm.birth_date, orders=orders)
+
+
+def _captured_price(unit_price: float | None, product_orm: ProductORM) -> float:
+    """Возвращает цену за единицу для сохранения в строке заказа.
+
+    Args:
+        unit_price: Цена из доменной строки заказа или None.
+        product_orm: ORM-модель товара.
+
+    Returns:
+        Переданная цена, а если она не задана — текущая цена товара.
+    """
+    return product_orm.price if unit_price is None else unit_price
+
+
+def _row_to_product(row: 'Row[Any]') -> Product:
+    """Преобразует строку с колонками товара в доменную модель.
+
+    Args:
+        row: Строка, содержащая колонки `id`, `name`, `quantity` и `price`.
+
+    Returns:
+        Доменная модель товара.
+    """
+    return Product(id=row.id, name=row.name, quantity=row.quantity, price=row.price)
+
+
+def _load_order_lines(
+    session: 'Session', order_ids: 'Sequence[int]'
+) -> dict[int, tuple[list[Product], list[OrderLine]]]:
+    """Загружает строки и товары для набора заказов без создания ORM-объектов.
+
+    Args:
+        session: SQLAlchemy-сессия.
+        order_ids: Идентификаторы заказов.
+
+    Returns:
+        Словарь `{order_id: ([Product, ...], [OrderLine, ...])}`.
+    """
+    lines_by_order: dict[int, tuple[list[Product], list[OrderLine]]] = {}
+    for chunk in batched(order_ids, IN_CLAUSE_CHUNK_SIZE):
+        statement = (
+            select(*_ORDER_LINE_COLUMNS, *_PRODUCT_COLUMNS)
+            .join(ProductORM, ProductORM.id == OrderLineORM.product_id)
+            .where(OrderLineORM.order_id.in_(chunk))
+            .order_by(OrderLineORM.order_id, OrderLineORM.product_id)
+        )
+        for row in session.execute(statement):
+            products, lines = lines_by_order.setdefault(row.order_id, ([], []))
+            products.append(_row_to_product(row))
+            lines.append(OrderLine(product_id=row.id, quantity=row.line_quantity, unit_price=row.unit_price))
+    return lines_by_order
+
+
+def _rows_to_orders(
+    session: 'Session', rows: 'Sequence[Row[tuple[int, int | None]]]', load_products: bool
+) -> list[Order]:
+    """Преобразует строки заказов в доменные модели, догружая строки и товары одним запросом.
+
+    Args:
+        session: SQLAlchemy-сессия.
+        rows: Строки `(id, customer_id)`.
+        load_products: Загружать ли товары заказов.
+
+    Returns:
+        Доменные модели заказов в порядке строк.
+    """
+    if not load_products:
+        return [Order(id=row.id, customer_id=row.customer_id) for row in rows]
+
+    lines_by_order = _load_order_lines(session, [row.id for row in rows])
+    orders = []
+    for row in rows:
+        products, lines = lines_by_order.get(row.id, ([], []))
+        orders.append(Order(id=row.id, customer_id=row.customer_id, products=products, lines=lines))
+    return orders
+
+
+def _order_lines(order: Order) -> list[OrderLine]:
+    """Возвращает строки заказа, формируя их из списка товаров, если строки не заданы.
+
+    Args:
+        order: Доменная модель заказа.
+
+    Returns:
+        Строки заказа; каждый товар из `products` дает строку по текущей цене с количеством,
+        равным числу его повторов в списке.
+
+    Raises:
+        ValueError: Если количество в строке меньше 1 или один товар указан в заказе с разными ценами.
+    """
+    lines = order.lines or [
+        OrderLine(product_id=product_id, quantity=quantity)
+        for product_id, quantity in Counter(p.id for p in order.products).items()
+    ]
+    unit_prices: dict[int | None, float | None] = {}
+    for line in lines:
+        if line.quantity < 1:
+            raise ValueError('Order line quantity must be a positive integer')
+        if unit_prices.setdefault(line.product_id, line.unit_price) != line.unit_price:
+            raise ValueError(f'Order lists product {line.product_id} with conflicting unit prices')
+    return lines
+
+
+def _rows_to_customers(
+    session: 'Session', rows: 'Sequence[Row[tuple[int, str, date]]]', load_orders: bool, load_products: bool
+) -> list[Customer]:
+    """Преобразует строки клиентов в доменные модели, догружая заказы и товары пакетно.
+
+    Args:
+        session: SQLAlchemy-сессия.
+        rows: Строки `(id, name, birth_date)`.
+        load_orders: Загружать ли заказы клиентов.
+        load_products: Загружать ли товары заказов.
+
+    Returns:
+        Доменные модели клиентов в порядке строк.
+    """
+    orders_by_customer: dict[int | None, list[Order]] = {}
+    if load_orders:
+        for chunk in batched([row.id for row in rows], IN_CLAUSE_CHUNK_SIZE):
+            statement = select(*_ORDER_COLUMNS).where(OrderORM.customer_id.in_(chunk)).order_by(OrderORM.id)
+            for order in _rows_to_orders(session, session.execute(statement).all(), load_products):
+                orders_by_customer.setdefault(order.customer_id, []).append(order)
+
+    return [
+        Customer(id=row.id, name=row.name, birth_date=row.birth_date, orders=orders_by_customer.get(row.id, []))
+        for row in rows
+    ]
@@ -0,0 +1,778 @@
+"""Шардирование клиентов и заказов по `customer_id`.
+
+Каждый шард — отдельная база со схемой приложения. Клиент и все его заказы хранятся
+на шарде `jump_hash(customer_id, N)`; заказы без клиента — на шарде 0. ID клиентов и
+заказов назначаются до вставки аллокатором `IdAllocator` основной базы, поэтому они
+уникальны во всех шардах и шард клиента известен до записи.
+
+Запросы по клиенту (`get`, `summary`, заказы клиента) выполняются на одном шарде,
+а списки и агрегаты — параллельно на всех шардах с объединением результатов по ID.
+Каталог товаров остается в основной базе; строки заказов ссылаются на товары шарда,
+поэтому копия каталога синхронизируется на шарды командой `sync-products`.
+
+Транзакция, затрагивающая несколько шардов, не атомарна: шарды фиксируются по очереди.
+
+Запуск:
+
+    python -m warehouse_management.infrastructure.sharding rebalance
+    python -m warehouse_management.infrastructure.sharding sync-products
+"""
+
+import argparse
+import heapq
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import batched
+from typing import Any, TYPE_CHECKING, TypeVar
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import scoped_session
+
+from warehouse_management.domain.exceptions import NotFoundError
+from warehouse_management.domain.repositories import CustomerRepository, OrderRepository
+from warehouse_management.domain.unit_of_work import UnitOfWork
+from warehouse_management.infrastructure.orm import CustomerORM, OrderLineORM, OrderORM, ProductORM
+from warehouse_management.infrastructure.queries import check_positive, IN_CLAUSE_CHUNK_SIZE
+from warehouse_management.infrastructure.repositories import (
+    SqlAlchemyCustomerRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyProductRepository,
+)
+from warehouse_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    import builtins
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from typing import Self
+
+    from sqlalchemy.orm import Session
+
+    from warehouse_management.domain.models import Customer, CustomerSummary, Order
+    from warehouse_management.infrastructure.id_allocator import IdAllocator
+    from warehouse_management.settings import DatabaseSettings
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar('_T')
+
+# Множитель линейного конгруэнтного генератора из оригинальной статьи о jump consistent hash.
+_JUMP_HASH_MULTIPLIER = 2862933555777941757
+_UINT64_MASK = (1 << 64) - 1
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Возвращает номер корзины для ключа по алгоритму jump consistent hash (Lamping, Veach).
+
+    При увеличении числа корзин с N до N + 1 меняют корзину только около 1/(N + 1)
+    ключей, и все они переходят в новую корзину, поэтому добавление шарда требует
+    перемещения минимального числа клиентов.
+
+    Args:
+        key: Ключ (ID клиента).
+        buckets: Количество корзин.
+
+    Returns:
+        Номер корзины от 0 до `buckets - 1`.
+    """
+    key &= _UINT64_MASK
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * _JUMP_HASH_MULTIPLIER + 1) & _UINT64_MASK
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+class ShardSet:
+    """Сессии шардов и пул потоков для параллельных запросов ко всем шардам.
+
+    Сессии из `scoped_session` разрешаются в потоке вызывающего до передачи в пул,
+    поэтому параллельные запросы выполняются в сессиях его Unit of Work.
+    """
+
+    def __init__(self, sessions: 'Sequence[Session | scoped_session[Session]]') -> None:
+        """Инициализирует набор шардов.
+
+        Args:
+            sessions: Сессии или реестры сессий шардов; порядок задает номера шардов.
+
+        Raises:
+            ValueError: Если не задано ни одного шарда.
+        """
+        if not sessions:
+            raise ValueError('At least one shard is required')
+
+        self.sessions = list(sessions)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.sessions), thread_name_prefix='shard')
+
+    def __len__(self) -> int:
+        """Возвращает количество шардов."""
+        return len(self.sessions)
+
+    def shard_for(self, customer_id: int | None) -> int:
+        """Возвращает номер шарда клиента.
+
+        Args:
+            customer_id: ID клиента или None для заказов без клиента.
+
+        Returns:
+            Номер шарда.
+        """
+        return 0 if customer_id is None else jump_hash(customer_id, len(self.sessions))
+
+    def session(self, shard: int) -> 'Session':
+        """Возвращает сессию шарда в текущем потоке.
+
+        Args:
+            shard: Номер шарда.
+
+        Returns:
+            SQLAlchemy-сессия.
+        """
+        session = self.sessions[shard]
+        return session() if isinstance(session, scoped_session) else session
+
+    def scatter(self, operation: 'Callable[[Session], _T]') -> 'list[_T]':
+        """Выполняет операцию на всех шардах параллельно.
+
+        Args:
+            operation: Функция, выполняющая запрос в сессии шарда.
+
+        Returns:
+            Результаты в порядке номеров шардов.
+        """
+        sessions = [self.session(shard) for shard in range(len(self.sessions))]
+        if len(sessions) == 1:
+            return [operation(sessions[0])]
+        return list(self._executor.map(operation, sessions))
+
+    def close(self) -> None:
+        """Останавливает пул потоков."""
+        self._executor.shutdown()
+
+
+class ShardedUnitOfWork(UnitOfWork):
+    """Unit of Work над всеми шардами.
+
+    Шарды фиксируются по очереди в обратном порядке; если фиксация шарда завершилась
+    ошибкой, еще не зафиксированные шарды откатываются, а уже зафиксированные — нет.
+    """
+
+    def __init__(self, shards: ShardSet) -> None:
+        """Инициализирует Unit of Work.
+
+        Args:
+            shards: Набор шардов.
+        """
+        self.units = [SqlAlchemyUnitOfWork(session) for session in shards.sessions]
+        self._exit_stack = ExitStack()
+
+    def __enter__(self) -> 'Self':
+        """Входит в Unit of Work всех шардов.
+
+        Returns:
+            Текущий экземпляр Unit of Work.
+        """
+        with ExitStack() as stack:
+            for unit in self.units:
+                stack.enter_context(unit)
+            self._exit_stack = stack.pop_all()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: object | None
+    ) -> None:
+        """Выходит из Unit of Work всех шардов, фиксируя или откатывая изменения.
+
+        Args:
+            exc_type: Тип исключения.
+            exc_value: Объект исключения.
+            traceback: Трассировка исключения.
+        """
+        self._exit_stack.__exit__(exc_type, exc_value, traceback)  # type: ignore[arg-type]
+
+    def commit(self) -> None:
+        """Фиксирует изменения на всех шардах."""
+        for unit in self.units:
+            unit.commit()
+
+    def rollback(self) -> None:
+        """Откатывает изменения на всех шардах."""
+        for unit in self.units:
+            unit.rollback()
+
+
+class ShardedOrderRepository(OrderRepository):
+    """Репозиторий заказов, распределенных по шардам по ID клиента."""
+
+    def __init__(self, shards: ShardSet, id_allocator: 'IdAllocator', core_reads: bool = False) -> None:
+        """Инициализирует репозиторий.
+
+        Args:
+            shards: Набор шардов.
+            id_allocator: Аллокатор глобально уникальных ID заказов.
+            core_reads: Читать заказы запросами Core без ORM-объектов.
+        """
+        self.shards = shards
+        self.id_allocator = id_allocator
+        self.core_reads = core_reads
+
+    def add(self, order: 'Order') -> None:
+        """Добавляет заказ на шард его клиента.
+
+        Args:
+            order: Экземпляр заказа.
+
+        Raises:
+            NotFoundError: Если на шарде отсутствует хотя бы один товар заказа.
+        """
+        self.add_many([order])
+
+    def add_many(self, orders: 'Sequence[Order]') -> None:
+        """Назначает заказам ID и добавляет их на шарды клиентов.
+
+        Args:
+            orders: Заказы для добавления.
+
+        Raises:
+            ValueError: Если количество в строке заказа меньше 1.
+            NotFoundError: Если на шарде отсутствуют товары заказов.
+        """
+        new_orders = [order for order in orders if order.id is None]
+        for order, order_id in zip(
+            new_orders, self.id_allocator.allocate(OrderORM.__tablename__, len(new_orders)), strict=True
+        ):
+            order.id = order_id
+
+        by_shard: dict[int, list[Order]] = defaultdict(list)
+        for order in orders:
+            by_shard[self.shards.shard_for(order.customer_id)].append(order)
+        for shard, shard_orders in by_shard.items():
+            self._repository(self.shards.session(shard)).add_many(shard_orders)
+
+    def get(self, order_id: int, load_products: bool = True, customer_id: int | None = None) -> 'Order | None':
+        """Получает заказ по ID.
+
+        Если известен клиент, запрос выполняется только на его шарде; иначе шард
+        заказа ищется параллельным запросом по первичному ключу ко всем шардам.
+
+        Args:
+            order_id: Идентификатор заказа.
+            load_products: Загружать ли товары заказа.
+            customer_id: ID клиента заказа, если известен.
+
+        Returns:
+            Найденный заказ или None.
+        """
+        shard = self.shards.shard_for(customer_id) if customer_id is not None else self._locate(order_id)
+        if shard is None:
+            return None
+        return self._repository(self.shards.session(shard)).get(order_id, load_products)
+
+    def exists(self, order_id: int) -> bool:
+        """Проверяет существование заказа на любом шарде.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            True, если заказ существует.
+        """
+        return self._locate(order_id) is not None
+
+    def get_reference(self, order_id: int) -> 'Order':
+        """Возвращает заказ без строк и товаров.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            Найденный заказ.
+
+        Raises:
+            NotFoundError: Если заказ не найден.
+        """
+        shard = self._locate(order_id)
+        if shard is None:
+            raise NotFoundError(f'Order with ID {order_id} not found')
+        return self._repository(self.shards.session(shard)).get_reference(order_id)
+
+    def list(self, load_products: bool = True) -> 'builtins.list[Order]':
+        """Возвращает заказы всех шардов в порядке ID.
+
+        Args:
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Список заказов.
+        """
+        results = self.shards.scatter(lambda session: self._repository(session).list(load_products))
+        return list(heapq.merge(*results, key=_id))
+
+    def iter_all(self, batch_size: int = 1000, load_products: bool = True) -> 'Iterator[Order]':
+        """Лениво перебирает заказы всех шардов в порядке ID.
+
+        Args:
+            batch_size: Количество заказов, получаемых из шарда за один раз.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Заказы по одному.
+        """
+        iterators = [
+            self._repository(self.shards.session(shard)).iter_all(batch_size, load_products)
+            for shard in range(len(self.shards))
+        ]
+        yield from heapq.merge(*iterators, key=_id)
+
+    def page(self, after_id: int | None = None, limit: int = 100, load_products: bool = True) -> 'builtins.list[Order]':
+        """Возвращает страницу заказов с ID больше `after_id`, объединяя страницы всех шардов.
+
+        Args:
+            after_id: ID последнего заказа предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Заказы страницы в порядке ID.
+        """
+        pages = self.shards.scatter(lambda session: self._repository(session).page(after_id, limit, load_products))
+        return list(heapq.merge(*pages, key=_id))[:limit]
+
+    def totals(self, order_ids: 'Iterable[int]') -> dict[int, float]:
+        """Возвращает стоимость заказов, запрашивая все шарды параллельно.
+
+        Args:
+            order_ids: Идентификаторы заказов.
+
+        Returns:
+            Словарь `{order_id: стоимость}` для найденных заказов.
+        """
+        ids = list(order_ids)
+        totals: dict[int, float] = {}
+        for shard_totals in self.shards.scatter(lambda session: self._repository(session).totals(ids)):
+            totals.update(shard_totals)
+        return totals
+
+    def iter_totals(
+        self, customer_id: int | None = None, after_id: int | None = None, batch_size: int = 10_000
+    ) -> 'Iterator[dict[int, float]]':
+        """Потоково возвращает стоимость заказов порциями в порядке ID.
+
+        Заказы клиента читаются с его шарда, остальные запросы объединяют шарды по ID.
+
+        Args:
+            customer_id: Возвращать только заказы этого клиента.
+            after_id: Начать с заказов, ID которых больше указанного.
+            batch_size: Количество заказов в одной порции.
+
+        Yields:
+            Словари `{order_id: стоимость}`.
+        """
+        if customer_id is not None:
+            repository = self._repository(self.shards.session(self.shards.shard_for(customer_id)))
+            yield from repository.iter_totals(customer_id, after_id, batch_size)
+            return
+
+        check_positive(batch_size, 'Batch size')
+        items = [
+            (
+                item
+                for chunk in self._repository(self.shards.session(shard)).iter_totals(None, after_id, batch_size)
+                for item in chunk.items()
+            )
+            for shard in range(len(self.shards))
+        ]
+        for chunk in batched(heapq.merge(*items), batch_size):
+            yield dict(chunk)
+
+    def _locate(self, order_id: int) -> int | None:
+        """Находит шард заказа параллельным запросом по первичному ключу.
+
+        Args:
+            order_id: Идентификатор заказа.
+
+        Returns:
+            Номер шарда или None, если заказ не найден.
+        """
+        found = self.shards.scatter(lambda session: self._repository(session).exists(order_id))
+        return found.index(True) if True in found else None
+
+    def _repository(self, session: 'Session') -> SqlAlchemyOrderRepository:
+        """Возвращает репозиторий заказов для сессии шарда."""
+        return SqlAlchemyOrderRepository(session, self.core_reads)
+
+
+class ShardedCustomerRepository(CustomerRepository):
+    """Репозиторий клиентов, распределенных по шардам по ID."""
+
+    def __init__(self, shards: ShardSet, id_allocator: 'IdAllocator', core_reads: bool = False) -> None:
+        """Инициализирует репозиторий.
+
+        Args:
+            shards: Набор шардов.
+            id_allocator: Аллокатор глобально уникальных ID клиентов.
+            core_reads: Читать клиентов запросами Core без ORM-объектов.
+        """
+        self.shards = shards
+        self.id_allocator = id_allocator
+        self.core_reads = core_reads
+
+    def add(self, customer: 'Customer') -> None:
+        """Назначает клиенту ID и добавляет его на шард, определенный по этому ID.
+
+        Args:
+            customer: Экземпляр клиента.
+        """
+        if customer.id is None:
+            [customer.id] = self.id_allocator.allocate(CustomerORM.__tablename__)
+        session = self.shards.session(self.shards.shard_for(customer.id))
+        session.add(CustomerORM(id=customer.id, name=customer.name, birth_date=customer.birth_date))
+
+    def get(self, customer_id: int, load_orders: bool = True, load_products: bool = True) -> 'Customer':
+        """Получает клиента с его шарда.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            load_orders: Загружать ли заказы клиента.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Найденный клиент.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        return self._repository_for(customer_id).get(customer_id, load_orders, load_products)
+
+    def exists(self, customer_id: int) -> bool:
+        """Проверяет существование клиента на его шарде.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            True, если клиент существует.
+        """
+        return self._repository_for(customer_id).exists(customer_id)
+
+    def get_reference(self, customer_id: int) -> 'Customer':
+        """Возвращает клиента без заказов с его шарда.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Найденный клиент.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        return self._repository_for(customer_id).get_reference(customer_id)
+
+    def existing_ids(self, customer_ids: 'Iterable[int]') -> set[int]:
+        """Возвращает ID существующих клиентов, проверяя каждый ID на его шарде.
+
+        Args:
+            customer_ids: Проверяемые идентификаторы клиентов.
+
+        Returns:
+            Множество найденных идентификаторов.
+        """
+        by_shard: dict[int, set[int]] = defaultdict(set)
+        for customer_id in customer_ids:
+            by_shard[self.shards.shard_for(customer_id)].add(customer_id)
+
+        found: set[int] = set()
+        for shard, ids in by_shard.items():
+            found |= self._repository(self.shards.session(shard)).existing_ids(ids)
+        return found
+
+    def list(self, load_orders: bool = True, load_products: bool = True) -> 'builtins.list[Customer]':
+        """Возвращает клиентов всех шардов в порядке ID.
+
+        Args:
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Список клиентов.
+        """
+        results = self.shards.scatter(lambda session: self._repository(session).list(load_orders, load_products))
+        return list(heapq.merge(*results, key=_id))
+
+    def iter_all(
+        self, batch_size: int = 1000, load_orders: bool = True, load_products: bool = True
+    ) -> 'Iterator[Customer]':
+        """Лениво перебирает клиентов всех шардов в порядке ID.
+
+        Args:
+            batch_size: Количество клиентов, получаемых из шарда за один раз.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Yields:
+            Клиенты по одному.
+        """
+        iterators = [
+            self._repository(self.shards.session(shard)).iter_all(batch_size, load_orders, load_products)
+            for shard in range(len(self.shards))
+        ]
+        yield from heapq.merge(*iterators, key=_id)
+
+    def page(
+        self, after_id: int | None = None, limit: int = 100, load_orders: bool = True, load_products: bool = True
+    ) -> 'builtins.list[Customer]':
+        """Возвращает страницу клиентов с ID больше `after_id`, объединяя страницы всех шардов.
+
+        Args:
+            after_id: ID последнего клиента предыдущей страницы или None для первой страницы.
+            limit: Максимальный размер страницы.
+            load_orders: Загружать ли заказы клиентов.
+            load_products: Загружать ли товары заказов.
+
+        Returns:
+            Клиенты страницы в порядке ID.
+        """
+        pages = self.shards.scatter(
+            lambda session: self._repository(session).page(after_id, limit, load_orders, load_products)
+        )
+        return list(heapq.merge(*pages, key=_id))[:limit]
+
+    def summary(self, customer_id: int, orders_limit: int = 20, before_id: int | None = None) -> 'CustomerSummary':
+        """Возвращает сводку по клиенту с его шарда.
+
+        Args:
+            customer_id: Идентификатор клиента.
+            orders_limit: Количество последних заказов в странице.
+            before_id: Курсор страницы: вернуть заказы с ID меньше указанного.
+
+        Returns:
+            Сводка по клиенту.
+
+        Raises:
+            NotFoundError: Если клиент не найден.
+        """
+        return self._repository_for(customer_id).summary(customer_id, orders_limit, before_id)
+
+    def _repository_for(self, customer_id: int) -> SqlAlchemyCustomerRepository:
+        """Возвращает репозиторий клиентов шарда клиента."""
+        return self._repository(self.shards.session(self.shards.shard_for(customer_id)))
+
+    def _repository(self, session: 'Session') -> SqlAlchemyCustomerRepository:
+        """Возвращает репозиторий клиентов для сессии шарда."""
+        return SqlAlchemyCustomerRepository(session, self.core_reads)
+
+
+@dataclass
+class RebalanceReport:
+    """Итоги перераспределения клиентов.
+
+    Attributes:
+        customers: Количество перемещенных клиентов.
+        orders: Количество перемещенных заказов.
+    """
+
+    customers: int = 0
+    orders: int = 0
+
+
+def rebalance(shards: ShardSet, batch_size: int = 500) -> RebalanceReport:
+    """Перемещает клиентов с их заказами на шарды, соответствующие текущему числу шардов.
+
+    Запускается после добавления шарда в настройки. Каждый пакет сначала копируется
+    на целевой шард и фиксируется там, затем удаляется с исходного шарда; клиенты,
+    уже скопированные прерванным запуском, повторно не копируются, поэтому
+    перераспределение можно безопасно перезапустить. Пока пакет перемещается,
+    списки могут вернуть его клиентов дважды.
+
+    Args:
+        shards: Набор шардов.
+        batch_size: Количество клиентов, перемещаемых в одной паре транзакций.
+
+    Returns:
+        Итоги перераспределения.
+
+    Raises:
+        ValueError: Если `batch_size` меньше 1.
+    """
+    check_positive(batch_size, 'Batch size')
+    batch_size = min(batch_size, IN_CLAUSE_CHUNK_SIZE)
+
+    report = RebalanceReport()
+    for source in range(len(shards)):
+        session = shards.session(source)
+        after_id = 0
+        while ids := session.scalars(
+            select(CustomerORM.id).where(CustomerORM.id > after_id).order_by(CustomerORM.id).limit(batch_size)
+        ).all():
+            after_id = ids[-1]
+            by_target: dict[int, list[int]] = defaultdict(list)
+            for customer_id in ids:
+                target = shards.shard_for(customer_id)
+                if target != source:
+                    by_target[target].append(customer_id)
+            for target, customer_ids in by_target.items():
+                orders = _move_customers(session, shards.session(target), customer_ids)
+                report.customers += len(customer_ids)
+                report.orders += orders
+                logger.info(
+                    'Moved %d customers, %d orders from shard %d to %d', len(customer_ids), orders, source, target
+                )
+    return report
+
+
+def _move_customers(source: 'Session', target: 'Session', customer_ids: 'Sequence[int]') -> int:
+    """Копирует клиентов со всеми заказами на целевой шард, затем удаляет их с исходного.
+
+    Товары, на которые ссылаются строки заказов и которых нет на целевом шарде,
+    копируются вместе с заказами.
+
+    Args:
+        source: Сессия исходного шарда.
+        target: Сессия целевого шарда.
+        customer_ids: ID перемещаемых клиентов (не больше `IN_CLAUSE_CHUNK_SIZE`).
+
+    Returns:
+        Количество перемещенных заказов.
+    """
+    order_ids = source.scalars(select(OrderORM.id).where(OrderORM.customer_id.in_(customer_ids))).all()
+    copied = set(customer_ids) - SqlAlchemyCustomerRepository(target).existing_ids(customer_ids)
+    if copied:
+        customers = _rows(source, CustomerORM, CustomerORM.id, copied)
+        orders = _rows(source, OrderORM, OrderORM.customer_id, copied)
+        lines = _rows(source, OrderLineORM, OrderLineORM.order_id, [row['id'] for row in orders])
+        product_ids = {line['product_id'] for line in lines}
+        missing_products = product_ids - SqlAlchemyProductRepository(target).existing_ids(product_ids)
+        for table, rows in (
+            (ProductORM, _rows(source, ProductORM, ProductORM.id, missing_products)),
+            (CustomerORM, customers),
+            (OrderORM, orders),
+            (OrderLineORM, lines),
+        ):
+            if rows:
+                target.execute(insert(table), rows)
+    target.commit()
+
+    for chunk in batched(order_ids, IN_CLAUSE_CHUNK_SIZE):
+        source.execute(delete(OrderLineORM).where(OrderLineORM.order_id.in_(chunk)))
+        source.execute(delete(OrderORM).where(OrderORM.id.in_(chunk)))
+    source.execute(delete(CustomerORM).where(CustomerORM.id.in_(customer_ids)))
+    source.commit()
+    return len(order_ids)
+
+
+def _rows(session: 'Session', entity: type[Any], column: Any, values: 'Iterable[int]') -> list[dict[str, Any]]:  # noqa: ANN401
+    """Читает строки таблицы сущности по значениям колонки в виде словарей.
+
+    Args:
+        session: SQLAlchemy-сессия.
+        entity: ORM-класс таблицы.
+        column: Колонка фильтра.
+        values: Значения колонки.
+
+    Returns:
+        Строки таблицы `{колонка: значение}`.
+    """
+    table = entity.__table__
+    rows: list[dict[str, Any]] = []
+    for chunk in batched(sorted(values), IN_CLAUSE_CHUNK_SIZE):
+        rows.extend(dict(row) for row in session.execute(select(table).where(column.in_(chunk))).mappings())
+    return rows
+
+
+def sync_products(source: 'Session', shards: ShardSet, batch_size: int = 1000) -> int:
+    """Копирует каталог товаров основной базы на все шарды.
+
+    Существующие на шарде товары обновляются, отсутствующие добавляются.
+
+    Args:
+        source: Сессия основной базы.
+        shards: Набор шардов.
+        batch_size: Количество товаров, читаемых за один раз.
+
+    Returns:
+        Количество скопированных товаров.
+    """
+    count = 0
+    for products in batched(SqlAlchemyProductRepository(source).iter_all(batch_size), batch_size):
+        rows: list[dict[str, Any]] = [
+            {'id': p.id, 'name': p.name, 'quantity': p.quantity, 'price': p.price} for p in products
+        ]
+        ids = {row['id'] for row in rows}
+        for shard in range(len(shards)):
+            session = shards.session(shard)
+            existing = SqlAlchemyProductRepository(session).existing_ids(ids)
+            if existing:
+                session.execute(update(ProductORM), [row for row in rows if row['id'] in existing])
+            if missing := [row for row in rows if row['id'] not in existing]:
+                session.execute(insert(ProductORM), missing)
+        count += len(rows)
+    for shard in range(len(shards)):
+        shards.session(shard).commit()
+    return count
+
+
+def create_shard_set(settings: 'DatabaseSettings', shard_urls: 'Sequence[str]') -> ShardSet:
+    """Создает набор шардов с потоколокальными сессиями.
+
+    Args:
+        settings: Настройки основной базы данных (параметры пула и PRAGMA).
+        shard_urls: URL баз шардов.
+
+    Returns:
+        Набор шардов.
+    """
+    from warehouse_management.infrastructure.database import get_engine_for_url, get_session_factory
+
+    return ShardSet(
+        [
+            scoped_session(get_session_factory(get_engine_for_url(settings, url), settings.expire_on_commit))
+            for url in shard_urls
+        ]
+    )
+
+
+def _id(model: 'Order | Customer') -> int:
+    """Возвращает ID модели для слияния упорядоченных результатов шардов."""
+    return model.id or 0
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Разбирает аргументы командной строки и выполняет команду обслуживания шардов.
+
+    Args:
+        argv: Аргументы командной строки; по умолчанию берутся из `sys.argv`.
+    """
+    from warehouse_management.infrastructure.database import get_engine, get_session_factory
+    from warehouse_management.infrastructure.migrations import upgrade
+    from warehouse_management.settings import Settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('command', choices=('rebalance', 'sync-products'), help='команда')
+    parser.add_argument('--batch-size', type=int, default=500, help='записей, обрабатываемых за один раз')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    settings = Settings()
+    shards = create_shard_set(settings.database, settings.sharding.shard_urls)
+    for session in shards.sessions:
+        upgrade(session.get_bind())  # type: ignore[arg-type]
+
+    try:
+        if args.command == 'rebalance':
+            report = rebalance(shards, args.batch_size)
+            logger.info('Done: moved %d customers and %d orders', report.customers, report.orders)
+        else:
+            with get_session_factory(get_engine(settings.database))() as source:
+                count = sync_products(source, shards, args.batch_size)
+            logger.info('Done: synchronized %d products to %d shards', count, len(shards))
+    finally:
+        shards.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,25 +1,76 @@
 """Реализация паттерна Unit of Work с использованием SQLAlchemy."""
 
+from contextlib import ExitStack
 from typing import TYPE_CHECKING
 
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session
+
 from warehouse_management.domain.unit_of_work import UnitOfWork
+from warehouse_management.infrastructure.orm import ProductORM
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Self
 
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import Session, UOWTransaction
+
+    from warehouse_management.infrastructure.cache import CachedProductRepository
+    from warehouse_management.infrastructure.database import ReplicaRouter
+    from warehouse_management.infrastructure.instrumentation import QueryStats, SqlInstrumentation
+
+# Ключ `Session.info` для ID товаров, измененных массовыми UPDATE в обход flush.
+_BULK_WRITTEN_PRODUCT_IDS = 'bulk_written_product_ids'
+# Ключ `Session.info` для ID товаров, записанных flush в текущей транзакции.
+_FLUSHED_PRODUCT_IDS = 'flushed_product_ids'
+# Ключ `Session.info`, отмечающий сессию Unit of Work только для чтения.
+_READ_ONLY = 'read_only'
 
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
-    """Реализация Unit of Work для работы с SQLAlchemy."""
+    """Реализация Unit of Work для работы с SQLAlchemy.
+
+    Если передан `scoped_session`, каждый поток работает с собственной сессией,
+    а по завершении блока `with` сессия закрывается и удаляется из реестра:
+    следующий блок получает новую сессию. Репозитории, привязанные к тому же
+    `scoped_session`, автоматически используют сессию текущего потока.
 
-    def __init__(self, session: 'Session') -> None:
+    Если передано инструментирование, запросы блока `with` учитываются в `stats`,
+    которая остается доступной после выхода из блока.
+
+    Unit of Work только для чтения (`read_only=True`) на время блока `with` привязывает
+    сессию к реплике, выбранной `replica_router` (без маршрутизатора — к основной базе),
+    по завершении блока откатывает транзакцию и не допускает flush изменений.
+    Реплика может отставать от основной базы, поэтому такой Unit of Work подходит для
+    чтений, которым не нужны только что зафиксированные изменения; прочитанные в нем
+    товары не попадают в кэш.
+    """
+
+    def __init__(
+        self,
+        session: 'Session | scoped_session[Session]',
+        product_cache: 'CachedProductRepository | None' = None,
+        instrumentation: 'SqlInstrumentation | None' = None,
+        read_only: bool = False,
+        replica_router: 'ReplicaRouter | None' = None,
+    ) -> None:
         """Инициализирует Unit of Work.
 
         Args:
-            session: Экземпляр SQLAlchemy-сессии.
+            session: Экземпляр SQLAlchemy-сессии или потоколокальный реестр сессий `scoped_session`.
+            product_cache: Кэш товаров, записи которого инвалидируются после фиксации изменений.
+            instrumentation: Инструментирование SQL-запросов движка сессии.
+            read_only: Выполнять блок `with` только для чтения.
+            replica_router: Маршрутизатор реплик для чтения; учитывается только при `read_only=True`.
         """
         self.session = session
+        self.product_cache = product_cache
+        self.instrumentation = instrumentation
+        self.read_only = read_only
+        self.replica_router = replica_router
+        self.stats: QueryStats | None = None
+        self._written_product_ids: set[int] = set()
+        self._exit_stack = ExitStack()
 
     def __enter__(self) -> 'Self':
         """Входит в контекстный менеджер Unit of Work.
@@ -27,6 +78,14 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         Returns:
             Текущий экземпляр Unit of Work.
         """
+        if self.read_only:
+            self._enter_read_only()
+        if self.instrumentation is not None:
+            self.stats = self._exit_stack.enter_context(self.instrumentation.track())
+        if self.product_cache is not None:
+            session = self.session() if isinstance(self.session, scoped_session) else self.session
+            if not event.contains(session, 'after_flush', self._collect_written_products):
+                event.listen(session, 'after_flush', self._collect_written_products)
         return self
 
     def __exit__(
@@ -34,20 +93,221 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
     ) -> None:
         """Выходит из контекста Unit of Work, выполняя commit() или rollback().
 
+        Unit of Work только для чтения всегда выполняет rollback(). Сессия из `scoped_session`
+        после этого закрывается и удаляется из реестра потока, а статистика запросов,
+        если она ведется, завершается.
+
         Args:
             exc_type: Тип исключения.
             exc_value: Объект исключения.
             traceback: Трассировка исключения.
         """
-        if exc_type:
-            self.rollback()
-        else:
-            self.commit()
+        try:
+            if exc_type or self.read_only:
+                self.rollback()
+            else:
+                self.commit()
+        finally:
+            if isinstance(self.session, scoped_session):
+                self.session.remove()
+            self._exit_stack.close()
 
     def commit(self) -> None:
-        """Фиксирует изменения в базе данных."""
+        """Фиксирует изменения в базе данных и инвалидирует кэш измененных товаров.
+
+        Raises:
+            RuntimeError: Если Unit of Work только для чтения.
+        """
+        if self.read_only:
+            raise RuntimeError('Read-only unit of work cannot commit')
         self.session.commit()
+        self._invalidate_written_products()
 
     def rollback(self) -> None:
-        """Откатывает изменения в базе данных."""
+        """Откатывает изменения в базе данных.
+
+        Кэш измененных товаров также инвалидируется: внутри транзакции в него
+        могли попасть незафиксированные значения.
+        """
         self.session.rollback()
+        self._invalidate_written_products()
+
+    def _enter_read_only(self) -> None:
+        """Привязывает сессию блока к реплике и запрещает flush изменений до выхода из блока.
+
+        Сессия потока, оставшаяся после чтений вне Unit of Work, закрывается, если в ней
+        нет незафиксированных изменений.
+
+        Raises:
+            RuntimeError: Если в сессии потока есть незафиксированные изменения или у переданной
+                сессии есть активная транзакция.
+        """
+        engine = self.replica_router.engine() if self.replica_router is not None else None
+        if isinstance(self.session, scoped_session):
+            if self.session.registry.has():
+                if has_uncommitted_writes(self.session()):
+                    raise RuntimeError('Read-only unit of work cannot start while the session has uncommitted changes')
+                self.session.remove()
+            session = self.session(bind=engine) if engine is not None else self.session()
+        else:
+            session = self.session
+            if session.in_transaction():
+                raise RuntimeError('Read-only unit of work cannot start inside an active transaction')
+            if engine is not None:
+                previous_bind = session.bind
+                session.bind = engine
+                self._exit_stack.callback(setattr, session, 'bind', previous_bind)
+        event.listen(session, 'before_flush', _reject_flush)
+        self._exit_stack.callback(event.remove, session, 'before_flush', _reject_flush)
+        session.info[_READ_ONLY] = True
+        self._exit_stack.callback(session.info.pop, _READ_ONLY, None)
+
+    def _collect_written_products(self, session: 'Session', _flush_context: 'UOWTransaction') -> None:
+        """Запоминает ID товаров, записанных при очередном flush.
+
+        Args:
+            session: Сессия, выполнившая flush.
+            _flush_context: Контекст flush (не используется).
+        """
+        product_ids = written_product_ids(session)
+        self._written_product_ids.update(product_ids)
+        session.info.setdefault(_FLUSHED_PRODUCT_IDS, set()).update(product_ids)
+
+    def _invalidate_written_products(self) -> None:
+        """Удаляет из кэша товары, записанные в рамках текущей транзакции."""
+        self._written_product_ids.update(pop_bulk_written_product_ids(self.session))
+        self.session.info.pop(_FLUSHED_PRODUCT_IDS, None)
+        if self.product_cache is not None and self._written_product_ids:
+            self.product_cache.invalidate(self._written_product_ids)
+        self._written_product_ids.clear()
+
+
+def _reject_flush(session: 'Session', _flush_context: 'UOWTransaction', _instances: object) -> None:
+    """Запрещает flush изменений в Unit of Work только для чтения.
+
+    Args:
+        session: Сессия, выполняющая flush.
+        _flush_context: Контекст flush (не используется).
+        _instances: Устаревший параметр события (не используется).
+
+    Raises:
+        RuntimeError: Если в сессии есть изменения.
+    """
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError('Read-only unit of work cannot write changes')
+
+
+def is_read_only(session: 'Session') -> bool:
+    """Проверяет, работает ли сессия в Unit of Work только для чтения.
+
+    Такая сессия может читать отстающую реплику, поэтому прочитанные ею значения
+    нельзя публиковать в общие кэши.
+
+    Args:
+        session: Сессия.
+
+    Returns:
+        True, если сессия открыта блоком `with` Unit of Work только для чтения.
+    """
+    return bool(session.info.get(_READ_ONLY))
+
+
+def holds_sqlite_write_transaction(session: 'Session') -> bool:
+    """Проверяет, открыта ли в соединении сессии транзакция SQLite.
+
+    Драйвер `sqlite3` начинает транзакцию только перед изменяющим запросом, поэтому
+    открытая транзакция означает незафиксированную запись и удерживаемую блокировку.
+
+    Args:
+        session: Сессия.
+
+    Returns:
+        True, если сессия работает с SQLite и ее соединение находится в транзакции.
+    """
+    if not session.in_transaction() or session.get_bind().dialect.name != 'sqlite':
+        return False
+    dbapi_connection = session.connection().connection.dbapi_connection
+    return bool(getattr(dbapi_connection, 'in_transaction', False))
+
+
+def has_uncommitted_writes(session: 'Session') -> bool:
+    """Проверяет, есть ли в сессии изменения, которые потерялись бы при ее закрытии.
+
+    Транзакция, в которой выполнялись только чтения, изменений не содержит. Для баз,
+    кроме SQLite, записи в транзакции не отслеживаются, и любая транзакция считается
+    содержащей изменения.
+
+    Args:
+        session: Сессия.
+
+    Returns:
+        True, если есть изменения, ожидающие flush, или незафиксированная транзакция с записями.
+    """
+    if session.new or session.dirty or session.deleted:
+        return True
+    if not session.in_transaction():
+        return False
+    return session.get_bind().dialect.name != 'sqlite' or holds_sqlite_write_transaction(session)
+
+
+def has_uncommitted_product_write(session: 'Session', product_id: int) -> bool:
+    """Проверяет, изменен ли товар в сессии, но еще не зафиксирован.
+
+    Учитываются изменения, ожидающие flush, записанные flush в Unit of Work с кэшем
+    товаров и массовые UPDATE, отмеченные `mark_products_written()`. Прочитанное в такой
+    сессии значение товара не должно попадать в кэш, общий для всех потоков.
+
+    Args:
+        session: Сессия.
+        product_id: Идентификатор товара.
+
+    Returns:
+        True, если в транзакции сессии есть незафиксированная запись товара.
+    """
+    return (
+        product_id in session.info.get(_FLUSHED_PRODUCT_IDS, ())
+        or product_id in session.info.get(_BULK_WRITTEN_PRODUCT_IDS, ())
+        or product_id in written_product_ids(session)
+    )
+
+
+def written_product_ids(session: 'Session') -> set[int]:
+    """Возвращает ID товаров, добавленных, измененных или удаленных в текущем flush.
+
+    Предназначена для вызова из обработчика события `after_flush`, где
+    `new`, `dirty` и `deleted` еще отражают состояние до flush.
+
+    Args:
+        session: Сессия, выполняющая flush.
+
+    Returns:
+        Множество идентификаторов товаров.
+    """
+    return {
+        instance.id for instance in (*session.new, *session.dirty, *session.deleted) if isinstance(instance, ProductORM)
+    }
+
+
+def mark_products_written(session: 'Session', product_ids: 'Iterable[int]') -> None:
+    """Запоминает ID товаров, измененных массовым UPDATE, для инвалидации кэша при commit() или rollback().
+
+    Массовые UPDATE не проходят через flush, поэтому `written_product_ids()` их не видит.
+
+    Args:
+        session: Сессия, в которой выполнен UPDATE.
+        product_ids: Идентификаторы измененных товаров.
+    """
+    session.info.setdefault(_BULK_WRITTEN_PRODUCT_IDS, set()).update(product_ids)
+
+
+def pop_bulk_written_product_ids(session: 'Session | scoped_session[Session]') -> set[int]:
+    """Возвращает и забывает ID товаров, отмеченных `mark_products_written()`.
+
+    Args:
+        session: Сессия или реестр сессий текущего потока.
+
+    Returns:
+        Множество идентификаторов товаров.
+    """
+    product_ids: set[int] = session.info.pop(_BULK_WRITTEN_PRODUCT_IDS, set())
+    return product_ids
@@ -23,7 +23,7 @@ def main(container: 'AppContainer') -> None:
 
     warehouse_service = WarehouseService(product_repo, order_repo)
 
-    init_db()
+    init_db(container.database_settings())
 
     with uow:
         new_product = warehouse_service.create_product(name='Test Product', quantity=5, price=150.0)
@@ -1,12 +1,14 @@
 """Настройка параметров приложения с помощью Pydantic.
 
 Модуль определяет класс `Settings`, который загружает конфигурацию из переменных окружения
-и файла `.env.local` для локальной разработки.ariables and an optional `.env.local` file for local development.
+и файла `.env.local` для локальной разработки.
 """
 
 import os
 from enum import Enum
+from typing import Literal
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 DEFAULT_ENV = 'local'
@@ -23,13 +25,159 @@ class Env(str, Enum):
     PRODUCTION = 'production'
 
 
+class SqliteSettings(BaseSettings):
+    """Настройки PRAGMA, применяемые к каждому новому соединению SQLite.
+
+    Attributes:
+        journal_mode: Режим журнала; WAL позволяет читателям не блокировать писателя.
+        synchronous: Уровень синхронизации с диском; NORMAL безопасен в режиме WAL.
+        busy_timeout_ms: Время ожидания снятия блокировки, мс.
+        cache_size: Размер страничного кэша (отрицательное значение задает размер в КиБ).
+        mmap_size: Размер области отображения файла базы в память, байт (0 отключает).
+        foreign_keys: Включить проверку внешних ключей.
+    """
+
+    journal_mode: Literal['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'] = 'WAL'
+    synchronous: Literal['OFF', 'NORMAL', 'FULL', 'EXTRA'] = 'NORMAL'
+    busy_timeout_ms: int = Field(default=5_000, ge=0)
+    cache_size: int = -64_000
+    mmap_size: int = Field(default=268_435_456, ge=0)
+    foreign_keys: bool = True
+
+    model_config = SettingsConfigDict(
+        env_prefix=f'{_ENV_PREFIX}DATABASE_SQLITE_',
+        env_file=_ENV_FILE,
+        extra='ignore',
+    )
+
+
 class DatabaseSettings(BaseSettings):
-    """Настройки конфигурации базы данных."""
+    """Настройки конфигурации базы данных.
+
+    Attributes:
+        url: URL базы данных.
+        pool_size: Количество постоянно открытых соединений в пуле.
+        max_overflow: Количество дополнительных соединений сверх `pool_size`.
+        pool_timeout: Время ожидания свободного соединения, секунд.
+        pool_recycle: Время жизни соединения, секунд (-1 отключает пересоздание).
+        pool_pre_ping: Проверять соединение перед выдачей из пула.
+        echo: Логировать SQL-запросы.
+        expire_on_commit: Сбрасывать состояние объектов сессии после commit(); при False
+            зафиксированные объекты не перечитываются из базы повторным SELECT.
+        core_reads: Читать модели в `get()` и `list()` репозиториев запросами Core по колонкам,
+            без создания ORM-объектов и их регистрации в identity map сессии.
+        replica_urls: URL реплик для Unit of Work только для чтения (в переменной окружения — JSON-список).
+        replica_health_check_interval_s: Интервал между проверками доступности реплики, секунд.
+        sqlite: PRAGMA для соединений SQLite.
+    """
 
     url: str = 'sqlite:///warehouse.db'
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_timeout: float = Field(default=30.0, gt=0)
+    pool_recycle: int = -1
+    pool_pre_ping: bool = True
+    echo: bool = False
+    expire_on_commit: bool = False
+    core_reads: bool = False
+    replica_urls: list[str] = Field(default_factory=list)
+    replica_health_check_interval_s: float = Field(default=30.0, gt=0)
+    sqlite: SqliteSettings = SqliteSettings()
 
     model_config = SettingsConfigDict(
-        env_prefix=_ENV_PREFIX,
+        env_prefix=f'{_ENV_PREFIX}DATABASE_',
+        env_file=_ENV_FILE,
+        extra='ignore',
+    )
+
+
+class ProductCacheSettings(BaseSettings):
+    """Настройки кэша товаров."""
+
+    enabled: bool = False
+    max_size: int = 10_000
+    ttl_seconds: float | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix=f'{_ENV_PREFIX}PRODUCT_CACHE_',
+        env_file=_ENV_FILE,
+        extra='ignore',
+    )
+
+
+class SqlInstrumentationSettings(BaseSettings):
+    """Настройки инструментирования SQL-запросов.
+
+    Attributes:
+        enabled: Вести статистику запросов Unit of Work.
+        slow_query_threshold_ms: Порог времени выполнения, мс, после которого запрос записывается в журнал.
+        n_plus_one_threshold: Сколько раз один запрос может выполниться в Unit of Work без предупреждения о N+1.
+    """
+
+    enabled: bool = False
+    slow_query_threshold_ms: float | None = Field(default=100.0, ge=0)
+    n_plus_one_threshold: int = Field(default=10, ge=1)
+
+    model_config = SettingsConfigDict(
+        env_prefix=f'{_ENV_PREFIX}SQL_INSTRUMENTATION_',
+        env_file=_ENV_FILE,
+        extra='ignore',
+    )
+
+
+class IdAllocationSettings(BaseSettings):
+    """Настройки назначения ID товаров и клиентов на клиенте.
+
+    Attributes:
+        enabled: Назначать ID блоками из таблицы `id_sequences` вместо автоинкремента базы.
+            Асинхронные репозитории аллокатор не используют, поэтому включать его можно,
+            только если товары и клиенты не добавляются через них.
+        block_size: Количество ID, резервируемых одним запросом к базе.
+    """
+
+    enabled: bool = False
+    block_size: int = Field(default=100, ge=1)
+
+    model_config = SettingsConfigDict(
+        env_prefix=f'{_ENV_PREFIX}ID_ALLOCATION_',
+        env_file=_ENV_FILE,
+        extra='ignore',
+    )
+
+
+class GroupCommitSettings(BaseSettings):
+    """Настройки групповой фиксации операций.
+
+    Attributes:
+        enabled: Создавать `GroupCommitUnitOfWork` в контейнере.
+        max_batch_size: Максимальное количество операций в одной транзакции.
+        max_delay_ms: Сколько миллисекунд пакет ожидает новых операций после первой.
+    """
+
+    enabled: bool = False
+    max_batch_size: int = Field(default=100, ge=1)
+    max_delay_ms: float = Field(default=5.0, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix=f'{_ENV_PREFIX}GROUP_COMMIT_',
+        env_file=_ENV_FILE,
+        extra='ignore',
+    )
+
+
+class ShardingSettings(BaseSettings):
+    """Настройки шардирования клиентов и заказов по ID клиента.
+
+    Attributes:
+        enabled: Создавать шардированные репозитории в контейнере.
+        shard_urls: URL баз шардов (в переменной окружения — JSON-список); порядок задает номера шардов.
+    """
+
+    enabled: bool = False
+    shard_urls: list[str] = Field(default_factory=list)
+
+    model_config = SettingsConfigDict(
+        env_prefix=f'{_ENV_PREFIX}SHARDING_',
         env_file=_ENV_FILE,
         extra='ignore',
     )
@@ -40,6 +188,11 @@ class Settings(BaseSettings):
 
     env: Env = Env.LOCAL
     database: DatabaseSettings = DatabaseSettings()
+    product_cache: ProductCacheSettings = ProductCacheSettings()
+    sql_instrumentation: SqlInstrumentationSettings = SqlInstrumentationSettings()
+    id_allocation: IdAllocationSettings = IdAllocationSettings()
+    group_commit: GroupCommitSettings = GroupCommitSettings()
+    sharding: ShardingSettings = ShardingSettings()
 
     model_config = SettingsConfigDict(
         env_prefix=_ENV_PREFIX,